@@ -5,6 +5,9 @@ Submodules:
     repeatablerandom - Repeatable Random Sequences
     distributions - Serializable Probability Distributions
     algorithms - General Sampling Algorithms
+    parallel - Parallel Bulk Generation
+    montecarlo - Deterministic Monte Carlo Simulations
+    noise - Coherent Noise
     pyyaml_support - YAML serialization support
 """
 
@@ -1,13 +1,24 @@
 """Implements several general-purpose sampling algorithms."""
 
 from bisect import bisect
-from typing import Sequence, List, Callable
+from itertools import product
+from math import ceil, cos, exp, floor, lgamma, log, pi, sin, sqrt
+from typing import Sequence, List, Callable, Optional, Tuple, Union
 
 __all__ = [
     'sample_discrete_roulette',
-    'AliasTable'
+    'AliasTable',
+    'sample_binomial',
+    'sample_poisson',
+    'poisson_disk_sample'
 ]
 
+_MAX_ITERATIONS = 1024
+
+# Below these means, variates are sampled by inversion
+_BINOMIAL_INVERSION_LIMIT = 10.0
+_POISSON_INVERSION_LIMIT = 10.0
+
 
 def sample_discrete_roulette(
         randfloat: Callable[[], float],
@@ -118,3 +129,396 @@ class AliasTable(object):
             result.probability[large.pop()] = 1.0
 
         return result
+
+
+def sample_binomial(
+        randfloat: Callable[[], float],
+        n: int,
+        p: float) -> int:
+    """Sample the number of successes in `n` independent trials which
+    each succeed with chance `p`.
+
+    If ``n * p`` is small, the result is found by inverting the CDF
+    using a single random value. Otherwise, Hörmann's BTRS
+    transformed rejection method is used, which requires about two
+    random values per sample regardless of `n`. Either way the expected
+    cost is constant, rather than proportional to `n`. If `p` is greater
+    than 0.5, the number of failures is sampled instead.
+
+    Args:
+        randfloat (Callable[[], float]): A function returning a random
+            float in [0.0, 1.0), e.g. ``random.random()``.
+            Is always called at least once.
+        n (int): The number of trials.
+        p (float): The chance of success for each trial.
+
+    Returns:
+        An int from 0 to `n`.
+
+    Raises:
+        ValueError: if `n` is negative or not an integer, or `p` is not
+            in [0.0, 1.0].
+        RuntimeError: if no sample was accepted within the
+            iteration limit.
+    """
+    return _binomial_sampler(n, p)(randfloat)
+
+
+def _binomial_sampler(n: int, p: float) -> Callable[[Callable[[], float]],
+                                                     int]:
+    # Returns a function performing sample_binomial(randfloat, n, p)
+    # for a given randfloat, with constants depending only on the
+    # parameters precomputed.
+    if n < 0 or n != int(n):
+        raise ValueError('n must be a non-negative integer.')
+    if not 0.0 <= p <= 1.0:
+        raise ValueError('p must be in [0.0, 1.0].')
+    n = int(n)
+
+    if p > 0.5:
+        failures = _binomial_sampler(n, 1.0 - p)
+        return lambda randfloat: n - failures(randfloat)
+
+    if p == 0.0:
+        def sample(randfloat: Callable[[], float]) -> int:
+            randfloat()
+            return 0
+        return sample
+
+    if n * p < _BINOMIAL_INVERSION_LIMIT:
+        q = 1.0 - p
+        s = p / q
+        a = (n + 1) * s
+        r0 = q ** n
+
+        def sample(randfloat: Callable[[], float]) -> int:
+            # Walk the PMF upwards using its recurrence
+            u = randfloat()
+            r = r0
+            x = 0
+            while u > r and x < n:
+                u -= r
+                x += 1
+                r *= a / x - s
+            return x
+        return sample
+
+    spq = sqrt(n * p * (1.0 - p))
+    b = 1.15 + 2.53 * spq
+    a = -0.0873 + 0.0248 * b + 0.01 * p
+    c = n * p + 0.5
+    vr = 0.92 - 4.2 / b
+    alpha = (2.83 + 5.1 / b) * spq
+    lpq = log(p / (1.0 - p))
+    m = floor((n + 1) * p)
+    h = lgamma(m + 1) + lgamma(n - m + 1)
+
+    def sample(randfloat: Callable[[], float]) -> int:
+        for _ in range(_MAX_ITERATIONS):
+            u = randfloat() - 0.5
+            v = randfloat()
+            us = 0.5 - abs(u)
+            if us == 0.0:
+                continue
+            k = floor((2.0 * a / us + b) * u + c)
+            if k < 0 or k > n:
+                continue
+
+            # Squeeze, which accepts most samples without evaluating
+            # the PMF
+            if us >= 0.07 and v <= vr:
+                return k
+
+            v *= alpha / (a / (us * us) + b)
+            log_pmf_ratio = \
+                h - lgamma(k + 1) - lgamma(n - k + 1) + (k - m) * lpq
+            if v == 0.0 or log(v) <= log_pmf_ratio:
+                return k
+
+        raise RuntimeError('Could not make a random '
+                           'selection within limit.')
+    return sample
+
+
+def sample_poisson(
+        randfloat: Callable[[], float],
+        lam: float) -> int:
+    """Sample from a Poisson distribution with mean `lam`.
+
+    If `lam` is small, the result is found by inverting the CDF using a
+    single random value. Otherwise, Hörmann's PTRS transformed
+    rejection method is used, which requires about two random values
+    per sample regardless of `lam`. Either way the expected cost is
+    constant, rather than proportional to `lam`.
+
+    Args:
+        randfloat (Callable[[], float]): A function returning a random
+            float in [0.0, 1.0), e.g. ``random.random()``.
+            Is always called at least once.
+        lam (float): The distribution's mean.
+
+    Returns:
+        A non-negative int.
+
+    Raises:
+        ValueError: if `lam` is negative.
+        RuntimeError: if no sample was accepted within the
+            iteration limit.
+    """
+    return _poisson_sampler(lam)(randfloat)
+
+
+def _poisson_sampler(lam: float) -> Callable[[Callable[[], float]], int]:
+    # Returns a function performing sample_poisson(randfloat, lam) for
+    # a given randfloat, with constants depending only on the
+    # parameters precomputed.
+    if not lam >= 0.0:
+        raise ValueError('lam must be at least 0.')
+
+    if lam < _POISSON_INVERSION_LIMIT:
+        p0 = exp(-lam)
+
+        def sample(randfloat: Callable[[], float]) -> int:
+            # Walk the PMF upwards using its recurrence
+            u = randfloat()
+            p = p0
+            cdf = p
+            x = 0
+            while u > cdf and p > 0.0:
+                x += 1
+                p *= lam / x
+                cdf += p
+            return x
+        return sample
+
+    slam = sqrt(lam)
+    loglam = log(lam)
+    b = 0.931 + 2.53 * slam
+    a = -0.059 + 0.02483 * b
+    invalpha = 1.1239 + 1.1328 / (b - 3.4)
+    vr = 0.9277 - 3.6224 / (b - 2.0)
+
+    def sample(randfloat: Callable[[], float]) -> int:
+        for _ in range(_MAX_ITERATIONS):
+            u = randfloat() - 0.5
+            v = randfloat()
+            us = 0.5 - abs(u)
+            if us == 0.0:
+                continue
+            k = floor((2.0 * a / us + b) * u + lam + 0.43)
+
+            # Squeeze, which accepts most samples without evaluating
+            # the PMF
+            if us >= 0.07 and v <= vr:
+                return k
+
+            if k < 0 or (us < 0.013 and v > us):
+                continue
+
+            log_pmf = -lam + k * loglam - lgamma(k + 1)
+            if v == 0.0 or \
+                    log(v * invalpha / (a / (us * us) + b)) <= log_pmf:
+                return k
+
+        raise RuntimeError('Could not make a random '
+                           'selection within limit.')
+    return sample
+
+
+def poisson_disk_sample(
+        randfloat: Callable[[], float],
+        randbelow: Callable[[int], int],
+        size: Sequence[float],
+        radius: Union[float, Callable[[Tuple[float, ...]], float]],
+        k: int = 30,
+        min_radius: Optional[float] = None,
+        max_radius: Optional[float] = None,
+        start: Optional[Sequence[float]] = None) -> List[Tuple[float, ...]]:
+    """Generate a set of evenly-spaced random points within a 2D or 3D
+    box using Bridson's Poisson-disk sampling algorithm.
+
+    No point lies within the disk (or ball) of another point's radius,
+    that is, for any two points `p` and `q`,
+    ``dist(p, q) >= max(radius(p), radius(q))``. Points are added until
+    no more will fit, so the box is densely filled.
+
+    Points are stored in a background grid with at most one point per
+    cell, so checking a candidate against its neighbours takes
+    constant time and sampling takes time linear in the number of
+    points produced.
+
+    For each active point, a batch of `k` candidates is generated within
+    the annulus from `radius` to twice `radius` around it. Each candidate
+    that is far enough from every existing point (including candidates
+    accepted earlier in the batch) is accepted, and the active point is
+    retired once a batch produces no new points.
+
+    Args:
+        randfloat (Callable[[], float]): A function returning a random
+            float in [0.0, 1.0), e.g. ``random.random()``.
+        randbelow (Callable[[int], int]): A function returning a
+            random int in [0, `arg`), e.g. ``random.randrange()``.
+        size (Sequence[float]): The size of the box along each axis.
+            Points are generated within [0, `size[i]`) on axis `i`.
+            Must have 2 or 3 elements.
+        radius (float or Callable): Either the minimum distance between
+            points, or a function mapping a point to its radius.
+        k (int): The number of candidates generated around each
+            active point per batch.
+        min_radius (float, optional): A lower bound for `radius`, which
+            determines the size of the grid's cells. Required if
+            `radius` is a function.
+        max_radius (float, optional): An upper bound for `radius`, which
+            determines how many cells are searched for neighbours.
+            Required if `radius` is a function.
+        start (Sequence[float], optional): The first point, which must
+            lie within the box. If omitted, the first point is chosen
+            uniformly within the box.
+
+    Returns:
+        A list of points, each a tuple of coordinates, in the order
+        they were generated.
+
+    Raises:
+        ValueError: if `size` does not have 2 or 3 elements, `k` is
+            less than 1, the radius bounds are missing or invalid,
+            `radius` returns a value outside [`min_radius`,
+            `max_radius`], or `start` does not lie within the box.
+    """
+    dimensions = len(size)
+    if dimensions not in (2, 3):
+        raise ValueError('Size must have 2 or 3 elements.')
+    if k < 1:
+        raise ValueError('k must be at least 1.')
+
+    if callable(radius):
+        if min_radius is None or max_radius is None:
+            raise ValueError('min_radius and max_radius are required '
+                             'when radius is a function.')
+
+        def radius_at(point):
+            # The grid and neighbour search are only valid for radii
+            # within the given bounds
+            value = radius(point)
+            if not min_radius <= value <= max_radius:
+                raise ValueError(
+                    'Radius {} at {} is outside [min_radius, '
+                    'max_radius].'.format(value, point))
+            return value
+    else:
+        min_radius = max_radius = radius
+
+        def radius_at(_):
+            return radius
+    if not 0.0 < min_radius <= max_radius:
+        raise ValueError('Radius must be positive.')
+
+    # Cells are small enough that no two points may share a cell. The
+    # grid is padded by `reach` cells on each side so that neighbours
+    # may be found using flat offsets without bounds checks.
+    cell_size = min_radius / sqrt(dimensions)
+    reach = ceil(max_radius / cell_size)
+    shape = [ceil(x / cell_size) + 2 * reach for x in size]
+    strides = [1] * dimensions
+    for i in range(dimensions - 2, -1, -1):
+        strides[i] = strides[i + 1] * shape[i + 1]
+    grid: List[int] = [-1] * (strides[0] * shape[0])
+
+    # Only cells which may contain a point within `max_radius` are
+    # searched, nearest first so that conflicts are found early
+    offsets = []
+    for delta in product(range(-reach, reach + 1), repeat=dimensions):
+        gap = sum(max(abs(d) - 1, 0) ** 2 for d in delta) * cell_size ** 2
+        if gap < max_radius * max_radius:
+            offsets.append((gap, sum(d * s for d, s in zip(delta, strides))))
+    offsets = [offset for _, offset in sorted(offsets)]
+
+    points: List[Tuple[float, ...]] = []
+    radii: List[float] = []
+    active: List[int] = []
+
+    def cell_of(point) -> int:
+        return sum((int(x / cell_size) + reach) * s
+                   for x, s in zip(point, strides))
+
+    def fits(point, point_radius) -> bool:
+        # Squared distances are compared, avoiding a square root
+        cell = cell_of(point)
+        for offset in offsets:
+            index = grid[cell + offset]
+            if index >= 0:
+                limit = radii[index]
+                if limit < point_radius:
+                    limit = point_radius
+                other = points[index]
+                if sum((a - b) * (a - b) for a, b in zip(point, other)) < \
+                        limit * limit:
+                    return False
+        return True
+
+    def add(point, point_radius):
+        grid[cell_of(point)] = len(points)
+        active.append(len(points))
+        points.append(tuple(point))
+        radii.append(point_radius)
+
+    if start is None:
+        start = [randfloat() * x for x in size]
+    elif len(start) != dimensions:
+        raise ValueError('Start must have {} elements.'.format(dimensions))
+    elif not all(0.0 <= x < limit for x, limit in zip(start, size)):
+        raise ValueError('Start must lie within the box.')
+    add(start, radius_at(tuple(start)))
+
+    while active:
+        slot = randbelow(len(active))
+        center = points[active[slot]]
+        center_radius = radii[active[slot]]
+
+        accepted = False
+        for candidate in _annulus_batch(randfloat, center, center_radius, k):
+            if not all(0.0 <= x < limit for x, limit in zip(candidate, size)):
+                continue
+            candidate_radius = radius_at(candidate)
+            if fits(candidate, candidate_radius):
+                add(candidate, candidate_radius)
+                accepted = True
+
+        if not accepted:
+            active[slot] = active[-1]
+            active.pop()
+
+    return points
+
+
+def _annulus_batch(randfloat: Callable[[], float],
+                   center: Tuple[float, ...],
+                   radius: float,
+                   count: int) -> List[Tuple[float, ...]]:
+    # Generates `count` points uniformly within the annulus (or
+    # spherical shell) from `radius` to 2 * `radius` around `center`.
+    if len(center) == 2:
+        x, y = center
+        inner = radius * radius
+        span = 3.0 * inner
+        result = []
+        for _ in range(count):
+            distance = sqrt(inner + span * randfloat())
+            angle = 2.0 * pi * randfloat()
+            result.append((x + distance * cos(angle),
+                           y + distance * sin(angle)))
+        return result
+
+    x, y, z = center
+    inner = radius * radius * radius
+    span = 7.0 * inner
+    result = []
+    for _ in range(count):
+        distance = (inner + span * randfloat()) ** (1.0 / 3.0)
+        height = 2.0 * randfloat() - 1.0
+        angle = 2.0 * pi * randfloat()
+        planar = distance * sqrt(1.0 - height * height)
+        result.append((x + planar * cos(angle),
+                       y + planar * sin(angle),
+                       z + distance * height))
+    return result
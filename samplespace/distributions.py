@@ -1,10 +1,19 @@
 """Implements a number of useful probability distributions."""
 
+import functools
 import itertools
 import math
-from typing import Sequence, Tuple, Optional, Any, List, Dict
-
-from .algorithms import sample_discrete_roulette
+import numbers
+import operator
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from typing import Sequence, Tuple, Optional, Any, List, Dict, Iterable, \
+    Callable, Union
+
+from .algorithms import sample_discrete_roulette, sample_binomial, \
+    sample_poisson, AliasTable
 
 __all__ = [
     'Constant',
@@ -24,14 +33,32 @@ __all__ = [
     'Weibull',
     'Gaussian',
     'Bernoulli',
+    'Binomial',
+    'Poisson',
     'WeightedCategorical',
     'UniformCategorical',
     'FiniteGeometricCategorical',
     'ZipfMandelbrotCategorical',
+    'MarkovChain',
+    'Multinomial',
+    'Dirichlet',
+    'MultivariateGaussian',
+    'Truncated',
+    'Empirical',
+    'Mixture',
+    'Arithmetic',
+    'Mapped',
+    'Clipped',
+    'clip',
+    'register_function',
     'distribution_from_dict',
     'distribution_from_list'
 ]
 
+_MAX_ITERATIONS = 1024
+_MAX_GAMMA_ITERATIONS = 100000
+_GAMMA_EPSILON = 1e-15
+
 
 class Distribution(object):
 
@@ -43,6 +70,100 @@ class Distribution(object):
         """
         raise NotImplementedError
 
+    def bind(self, rand) -> Callable[[], Any]:
+        """Return a function of no arguments which samples from the
+        distribution using `rand`.
+
+        Parameter-dependent constants and method lookups are resolved
+        once, when the function is created, so repeatedly calling the
+        bound function is faster than repeatedly calling
+        :meth:`sample`. Each call produces exactly the same result, and
+        consumes exactly the same random values, as
+        ``sample(rand)`` would.
+
+        Args:
+            rand: The random generator used to generate samples.
+        """
+        return functools.partial(self.sample, rand)
+
+    def samples(self, rand, k: int) -> List:
+        """Return a list of `k` samples from the distribution.
+
+        The result is identical to calling :meth:`sample` `k` times,
+        and leaves `rand` in the same state. Subclasses may override
+        this method with faster batched implementations.
+
+        Args:
+            rand: The random generator used to generate the samples.
+            k (int): The number of samples.
+        """
+        sample = self.bind(rand)
+        return [sample() for _ in range(k)]
+
+    def samples_grouped(self, rand, k: int) -> List:
+        """Return a list of `k` samples from the distribution, possibly
+        grouping draws for speed.
+
+        Unlike :meth:`samples`, the random values may be consumed in a
+        different order than `k` calls to :meth:`sample` would, so the
+        samples follow the same distribution but are not identical. By
+        default, this is equivalent to :meth:`samples`; composite
+        distributions such as :class:`Mixture` and :class:`Arithmetic`
+        override it to sample each of their parts in a single batch.
+
+        Args:
+            rand: The random generator used to generate the samples.
+            k (int): The number of samples.
+        """
+        return self.samples(rand, k)
+
+    def sample_into(self, rand, out) -> None:
+        """Replace each element of `out` with a sample from the
+        distribution, in order.
+
+        The result is identical to calling :meth:`sample` once for each
+        element, and no intermediate list is created, so `out` may be
+        preallocated storage such as a list, an :class:`array.array`,
+        or a writable :class:`memoryview`.
+
+        Args:
+            rand: The random generator used to generate the samples.
+            out: A mutable sequence to fill.
+        """
+        sample = self.bind(rand)
+        for i in range(len(out)):
+            out[i] = sample()
+
+    @classmethod
+    def sample_broadcast(cls, rand, *args, **kwargs) -> List:
+        """Return one sample for each element of the given parameter
+        sequences.
+
+        Each parameter is given as for the distribution's constructor,
+        either as a single value used for every sample, or as a
+        sequence (such as a list, an :class:`array.array`, or a NumPy
+        array) with one value per sample. Element `i` of the result is
+        identical to ``cls(...).sample(rand)`` called with element `i`
+        of each sequence, in order. Subclasses override this method to
+        avoid constructing a distribution for each sample.
+
+        Args:
+            rand: The random generator used to generate the samples.
+
+        Raises:
+            ValueError: if no parameter is a sequence, or the sequences
+                have different lengths.
+        """
+        names = list(kwargs)
+        _, columns = _broadcast(*args, *kwargs.values())
+        positional = len(args)
+        result = []
+        for values in zip(*columns):
+            dist = cls(*values[:positional],
+                       **dict(zip(names, values[positional:])))
+            result.append(dist.sample(rand))
+        return result
+
     def as_list(self) -> List:
         """Return a representation of the distribution as a list.
 
@@ -69,6 +190,60 @@ class Distribution(object):
     def __repr__(self):
         return 'Distribution.from_list({})'.format(self.as_list())
 
+    def map(self, func: Union[str, Callable]) -> 'Mapped':
+        """Return a distribution whose samples are the result of
+        applying `func` to samples from this distribution.
+
+        Args:
+            func (str or Callable): The name of a function registered
+                using :func:`register_function`, or the registered
+                function itself.
+        """
+        return Mapped(self, func)
+
+    def __add__(self, other):
+        if not _is_operand(other):
+            return NotImplemented
+        return Arithmetic('add', self, other)
+
+    def __radd__(self, other):
+        if not _is_operand(other):
+            return NotImplemented
+        return Arithmetic('add', other, self)
+
+    def __sub__(self, other):
+        if not _is_operand(other):
+            return NotImplemented
+        return Arithmetic('sub', self, other)
+
+    def __rsub__(self, other):
+        if not _is_operand(other):
+            return NotImplemented
+        return Arithmetic('sub', other, self)
+
+    def __mul__(self, other):
+        if not _is_operand(other):
+            return NotImplemented
+        return Arithmetic('mul', self, other)
+
+    def __rmul__(self, other):
+        if not _is_operand(other):
+            return NotImplemented
+        return Arithmetic('mul', other, self)
+
+    def __truediv__(self, other):
+        if not _is_operand(other):
+            return NotImplemented
+        return Arithmetic('truediv', self, other)
+
+    def __rtruediv__(self, other):
+        if not _is_operand(other):
+            return NotImplemented
+        return Arithmetic('truediv', other, self)
+
+    def __neg__(self):
+        return Mapped(self, 'neg')
+
     @classmethod
     def from_dict(cls, dist_as_dict):
         return distribution_from_dict(dist_as_dict)
@@ -97,6 +272,16 @@ class Constant(Distribution):
         rand.random()
         return self._value
 
+    def bind(self, rand) -> Callable[[], Any]:
+        random = rand.random
+        value = self._value
+
+        def sample():
+            random()
+            return value
+
+        return sample
+
     def as_list(self) -> List:
         return [self.__class__.__name__.casefold(),
                 self._value]
@@ -141,6 +326,27 @@ class Uniform(Distribution):
     def sample(self, rand) -> float:
         return rand.uniform(self._min, self._max)
 
+    def bind(self, rand) -> Callable[[], float]:
+        return functools.partial(rand.uniform, self._min, self._max)
+
+    def samples(self, rand, k: int) -> List[float]:
+        if not hasattr(rand, '_randoms'):
+            return super().samples(rand, k)
+        low = self._min
+        span = self._max - self._min
+        return [low + span * u for u in _randoms(rand, k)]
+
+    @classmethod
+    def sample_broadcast(cls, rand, min_val=0.0, max_val=1.0) -> List[float]:
+        count, (min_val, max_val) = _broadcast(min_val, max_val)
+        bounds = [(a, b) if a <= b else (b, a)
+                  for a, b in zip(min_val, max_val)]
+        if not hasattr(rand, '_randoms'):
+            uniform = rand.uniform
+            return [uniform(a, b) for a, b in bounds]
+        return [a + (b - a) * u
+                for (a, b), u in zip(bounds, _randoms(rand, count))]
+
     def as_list(self) -> List:
         return [self.__class__.__name__.casefold(),
                 self._min, self._max]
@@ -155,10 +361,20 @@ class Uniform(Distribution):
 
 class DiscreteUniform(Distribution):
     """Represents a discrete uniform distribution of integers
-    in [`min_value`, `max_value`)."""
+    in [`min_value`, `max_value`).
+
+    Integral bounds of other types, such as ``2.0``, are converted to
+    :class:`int`, so that samples are always ints.
+
+    Raises:
+        TypeError: if either bound is not integral.
+    """
 
     def __init__(self, min_val: int, max_val: int):
         super().__init__()
+        if min_val != int(min_val) or max_val != int(max_val):
+            raise TypeError('Bounds must be integers.')
+        min_val, max_val = int(min_val), int(max_val)
         self._min: int = min(min_val, max_val)
         self._max: int = max(min_val, max_val)
 
@@ -175,6 +391,33 @@ class DiscreteUniform(Distribution):
     def sample(self, rand) -> int:
         return rand.randrange(self._min, self._max)
 
+    def bind(self, rand) -> Callable[[], int]:
+        sampler = self._range_sampler(rand)
+        if sampler is not None:
+            return sampler.draw
+        return functools.partial(rand.randrange, self._min, self._max)
+
+    def samples(self, rand, k: int) -> List[int]:
+        sampler = self._range_sampler(rand)
+        if sampler is not None:
+            return sampler.draw_many(k)
+        return super().samples(rand, k)
+
+    def _range_sampler(self, rand):
+        # Returns a sampler equivalent to rand.randrange(min, max) if
+        # the generator supports them, otherwise None.
+        range_sampler = getattr(rand, 'range_sampler', None)
+        if range_sampler is None or self._min == self._max:
+            return None
+        return range_sampler(self._min, self._max - 1)
+
+    @classmethod
+    def sample_broadcast(cls, rand, min_val, max_val) -> List[int]:
+        _, (min_val, max_val) = _broadcast(min_val, max_val)
+        randrange = rand.randrange
+        return [randrange(a, b) if a <= b else randrange(b, a)
+                for a, b in zip(min_val, max_val)]
+
     def as_list(self) -> List:
         return [self.__class__.__name__.casefold(),
                 self._min, self._max]
@@ -224,6 +467,16 @@ class Geometric(Distribution):
                        self._impl(rand, mean, include_zero))
         return func(self._mean, self._include_zero)
 
+    def bind(self, rand) -> Callable[[], int]:
+        sampler = getattr(rand, '_geometric_sampler', None)
+        if sampler is not None:
+            return sampler(self._mean, self._include_zero)
+        func = getattr(rand,
+                       'geometric',
+                       lambda mean, include_zero:
+                       self._impl(rand, mean, include_zero))
+        return functools.partial(func, self._mean, self._include_zero)
+
     def as_list(self) -> List:
         return [self.__class__.__name__.casefold(),
                 self._mean, self._include_zero]
@@ -299,6 +552,11 @@ class FiniteGeometric(Distribution):
         return sample_discrete_roulette(
             rand.random, self._cum_weights) + 1
 
+    def bind(self, rand) -> Callable[[], int]:
+        random = rand.random
+        cum_weights = self._cum_weights
+        return lambda: sample_discrete_roulette(random, cum_weights) + 1
+
     def as_list(self) -> List:
         return [self.__class__.__name__.casefold(),
                 self._s, self._n]
@@ -355,6 +613,11 @@ class ZipfMandelbrot(Distribution):
         return sample_discrete_roulette(
             rand.random, self._cum_weights) + 1
 
+    def bind(self, rand) -> Callable[[], int]:
+        random = rand.random
+        cum_weights = self._cum_weights
+        return lambda: sample_discrete_roulette(random, cum_weights) + 1
+
     def as_list(self) -> List:
         return [self.__class__.__name__.casefold(),
                 self._s, self._q, self._n]
@@ -405,6 +668,17 @@ class Gamma(Distribution):
     def sample(self, rand) -> float:
         return rand.gammavariate(self._alpha, self._beta)
 
+    def bind(self, rand) -> Callable[[], float]:
+        sampler = getattr(rand, '_gamma_sampler', None)
+        if sampler is not None:
+            return sampler(self._alpha, self._beta)
+        return functools.partial(rand.gammavariate, self._alpha, self._beta)
+
+    @classmethod
+    def sample_broadcast(cls, rand, alpha, beta) -> List[float]:
+        _, columns = _broadcast(alpha, beta)
+        return list(map(rand.gammavariate, *columns))
+
     def as_list(self) -> List:
         return [self.__class__.__name__.casefold(),
                 self._alpha, self._beta]
@@ -466,6 +740,13 @@ class Triangular(Distribution):
     def sample(self, rand) -> float:
         return rand.triangular(self._low, self._high, self._mode)
 
+    def bind(self, rand) -> Callable[[], float]:
+        sampler = getattr(rand, '_triangular_sampler', None)
+        if sampler is not None:
+            return sampler(self._low, self._high, self._mode)
+        return functools.partial(rand.triangular,
+                                 self._low, self._high, self._mode)
+
     def as_list(self) -> List:
         if self._mode is None:
             return [self.__class__.__name__.casefold(),
@@ -520,6 +801,13 @@ class UniformProduct(Distribution):
                        self._impl(rand, n))
         return func(self._n)
 
+    def bind(self, rand) -> Callable[[], float]:
+        func = getattr(rand,
+                       'uniformproduct',
+                       lambda n:
+                       self._impl(rand, n))
+        return functools.partial(func, self._n)
+
     def as_list(self) -> List:
         return [self.__class__.__name__.casefold(),
                 self._n]
@@ -570,6 +858,19 @@ class LogNormal(Distribution):
     def sample(self, rand) -> float:
         return rand.lognormvariate(self._mu, self._sigma)
 
+    def bind(self, rand) -> Callable[[], float]:
+        return functools.partial(rand.lognormvariate, self._mu, self._sigma)
+
+    @classmethod
+    def sample_broadcast(cls, rand, mu=0.0, sigma=1.0) -> List[float]:
+        count, (mu, sigma) = _broadcast(mu, sigma)
+        gaussians = getattr(rand, '_gauss_many', None)
+        if gaussians is None:
+            return list(map(rand.lognormvariate, mu, sigma))
+        exp, cos = math.exp, math.cos
+        return [exp(m + cos(a) * b * s)
+                for (a, b), m, s in zip(gaussians(count), mu, sigma)]
+
     def as_list(self) -> List:
         return [self.__class__.__name__.casefold(),
                 self._mu, self._sigma]
@@ -601,6 +902,25 @@ class Exponential(Distribution):
     def sample(self, rand) -> float:
         return rand.expovariate(self._lambda)
 
+    def bind(self, rand) -> Callable[[], float]:
+        return functools.partial(rand.expovariate, self._lambda)
+
+    def samples(self, rand, k: int) -> List[float]:
+        if not hasattr(rand, '_randoms'):
+            return super().samples(rand, k)
+        lambd = self._lambda
+        log = math.log
+        return [-log(1.0 - u) / lambd for u in _randoms(rand, k)]
+
+    @classmethod
+    def sample_broadcast(cls, rand, lambd) -> List[float]:
+        count, (lambd,) = _broadcast(lambd)
+        if not hasattr(rand, '_randoms'):
+            return list(map(rand.expovariate, lambd))
+        log = math.log
+        return [-log(1.0 - u) / rate
+                for u, rate in zip(_randoms(rand, count), lambd)]
+
     def as_list(self) -> List:
         return [self.__class__.__name__.casefold(),
                 self._lambda]
@@ -647,6 +967,17 @@ class VonMises(Distribution):
     def sample(self, rand) -> float:
         return rand.vonmisesvariate(self._mu, self._kappa)
 
+    def bind(self, rand) -> Callable[[], float]:
+        sampler = getattr(rand, '_vonmises_sampler', None)
+        if sampler is not None:
+            return sampler(self._mu, self._kappa)
+        return functools.partial(rand.vonmisesvariate, self._mu, self._kappa)
+
+    @classmethod
+    def sample_broadcast(cls, rand, mu, kappa) -> List[float]:
+        _, columns = _broadcast(mu, kappa)
+        return list(map(rand.vonmisesvariate, *columns))
+
     def as_list(self) -> List:
         return [self.__class__.__name__.casefold(),
                 self._mu, self._kappa]
@@ -689,6 +1020,14 @@ class Beta(Distribution):
     def sample(self, rand) -> float:
         return rand.betavariate(self._alpha, self._beta)
 
+    def bind(self, rand) -> Callable[[], float]:
+        return functools.partial(rand.betavariate, self._alpha, self._beta)
+
+    @classmethod
+    def sample_broadcast(cls, rand, alpha, beta) -> List[float]:
+        _, columns = _broadcast(alpha, beta)
+        return list(map(rand.betavariate, *columns))
+
     def as_list(self) -> List:
         return [self.__class__.__name__.casefold(),
                 self._alpha, self._beta]
@@ -724,6 +1063,20 @@ class Pareto(Distribution):
     def sample(self, rand) -> float:
         return rand.paretovariate(self._alpha)
 
+    def bind(self, rand) -> Callable[[], float]:
+        return functools.partial(rand.paretovariate, self._alpha)
+
+    def samples(self, rand, k: int) -> List[float]:
+        if not hasattr(rand, '_randoms') or self._alpha == 0.0:
+            return super().samples(rand, k)
+        exponent = -1.0 / self._alpha
+        return [(1.0 - u) ** exponent for u in _randoms(rand, k)]
+
+    @classmethod
+    def sample_broadcast(cls, rand, alpha) -> List[float]:
+        _, columns = _broadcast(alpha)
+        return list(map(rand.paretovariate, *columns))
+
     def as_list(self) -> List:
         return [self.__class__.__name__.casefold(),
                 self._alpha]
@@ -768,6 +1121,23 @@ class Weibull(Distribution):
     def sample(self, rand) -> float:
         return rand.weibullvariate(self._alpha, self._beta)
 
+    def bind(self, rand) -> Callable[[], float]:
+        return functools.partial(rand.weibullvariate, self._alpha, self._beta)
+
+    def samples(self, rand, k: int) -> List[float]:
+        if not hasattr(rand, '_randoms') or self._beta == 0.0:
+            return super().samples(rand, k)
+        alpha = self._alpha
+        exponent = 1.0 / self._beta
+        log = math.log
+        return [alpha * (-log(1.0 - u)) ** exponent
+                for u in _randoms(rand, k)]
+
+    @classmethod
+    def sample_broadcast(cls, rand, alpha, beta) -> List[float]:
+        _, columns = _broadcast(alpha, beta)
+        return list(map(rand.weibullvariate, *columns))
+
     def as_list(self) -> List:
         return [self.__class__.__name__.casefold(),
                 self._alpha, self._beta]
@@ -810,6 +1180,27 @@ class Gaussian(Distribution):
     def sample(self, rand):
         return rand.gauss(self._mu, self._sigma)
 
+    def bind(self, rand) -> Callable[[], float]:
+        return functools.partial(rand.gauss, self._mu, self._sigma)
+
+    def samples(self, rand, k: int) -> List[float]:
+        gaussians = getattr(rand, '_gauss_many', None)
+        if gaussians is None:
+            return super().samples(rand, k)
+        mu, sigma = self._mu, self._sigma
+        cos = math.cos
+        return [mu + cos(a) * b * sigma for a, b in gaussians(k)]
+
+    @classmethod
+    def sample_broadcast(cls, rand, mu=0.0, sigma=1.0) -> List[float]:
+        count, (mu, sigma) = _broadcast(mu, sigma)
+        gaussians = getattr(rand, '_gauss_many', None)
+        if gaussians is None:
+            return list(map(rand.gauss, mu, sigma))
+        cos = math.cos
+        return [m + cos(a) * b * s
+                for (a, b), m, s in zip(gaussians(count), mu, sigma)]
+
     def as_list(self) -> List:
         return [self.__class__.__name__.casefold(),
                 self._mu, self._sigma]
@@ -840,6 +1231,20 @@ class Bernoulli(Distribution):
     def sample(self, rand) -> bool:
         return rand.random() < self._p
 
+    def bind(self, rand) -> Callable[[], bool]:
+        random = rand.random
+        p = self._p
+        return lambda: random() < p
+
+    def samples(self, rand, k: int) -> List[bool]:
+        p = self._p
+        return [u < p for u in _randoms(rand, k)]
+
+    @classmethod
+    def sample_broadcast(cls, rand, p) -> List[bool]:
+        count, (p,) = _broadcast(p)
+        return [u < chance for u, chance in zip(_randoms(rand, count), p)]
+
     def as_list(self) -> List:
         return [self.__class__.__name__.casefold(),
                 self._p]
@@ -851,6 +1256,128 @@ class Bernoulli(Distribution):
         }
 
 
+class Binomial(Distribution):
+    r"""Represents a binomial distribution, the number of successes in
+    `n` independent trials which each succeed with probability `p`.
+
+    The binomial distribution is defined by
+
+    .. math::
+
+        \text{Pr}(x = k) = \binom{n}{k} p^k (1 - p)^{n - k}
+
+    Samples take constant expected time regardless of `n`; see
+    :func:`~samplespace.algorithms.sample_binomial`.
+    """
+
+    def __init__(self, n: int, p: float):
+        super().__init__()
+        if n < 0 or n != int(n):
+            raise ValueError('n must be a non-negative integer.')
+        if not 0.0 <= p <= 1.0:
+            raise ValueError('p must be in [0.0, 1.0].')
+        self._n: int = n
+        self._p: float = p
+
+    @property
+    def n(self) -> int:
+        """Read-only property for the number of trials."""
+        return self._n
+
+    @property
+    def p(self) -> float:
+        """Read-only property for each trial's chance of success."""
+        return self._p
+
+    def sample(self, rand) -> int:
+        func = getattr(rand,
+                       'binomialvariate',
+                       lambda n, p:
+                       self._impl(rand, n, p))
+        return func(self._n, self._p)
+
+    def bind(self, rand) -> Callable[[], int]:
+        sampler = getattr(rand, '_binomial_sampler', None)
+        if sampler is not None:
+            return sampler(self._n, self._p)
+        func = getattr(rand,
+                       'binomialvariate',
+                       lambda n, p:
+                       self._impl(rand, n, p))
+        return functools.partial(func, self._n, self._p)
+
+    def as_list(self) -> List:
+        return [self.__class__.__name__.casefold(),
+                self._n, self._p]
+
+    def as_dict(self) -> Dict:
+        return {
+            'distribution': self.__class__.__name__.casefold(),
+            'n': self._n,
+            'p': self._p
+        }
+
+    @staticmethod
+    def _impl(rand, n: int, p: float) -> int:
+        return sample_binomial(rand.random, n, p)
+
+
+class Poisson(Distribution):
+    r"""Represents a Poisson distribution with mean `lam`.
+
+    The Poisson distribution is defined by
+
+    .. math::
+
+        \text{Pr}(x = k) = \frac{\lambda^k e^{-\lambda}}{k!}
+
+    Samples take constant expected time regardless of `lam`; see
+    :func:`~samplespace.algorithms.sample_poisson`.
+    """
+
+    def __init__(self, lam: float):
+        super().__init__()
+        if not lam >= 0.0:
+            raise ValueError('lam must be at least 0.')
+        self._lam: float = lam
+
+    @property
+    def lam(self) -> float:
+        """Read-only property for the distribution's mean."""
+        return self._lam
+
+    def sample(self, rand) -> int:
+        func = getattr(rand,
+                       'poissonvariate',
+                       lambda lam:
+                       self._impl(rand, lam))
+        return func(self._lam)
+
+    def bind(self, rand) -> Callable[[], int]:
+        sampler = getattr(rand, '_poisson_sampler', None)
+        if sampler is not None:
+            return sampler(self._lam)
+        func = getattr(rand,
+                       'poissonvariate',
+                       lambda lam:
+                       self._impl(rand, lam))
+        return functools.partial(func, self._lam)
+
+    def as_list(self) -> List:
+        return [self.__class__.__name__.casefold(),
+                self._lam]
+
+    def as_dict(self) -> Dict:
+        return {
+            'distribution': self.__class__.__name__.casefold(),
+            'lam': self._lam
+        }
+
+    @staticmethod
+    def _impl(rand, lam: float) -> int:
+        return sample_poisson(rand.random, lam)
+
+
 class WeightedCategorical(Distribution):
     """Represents a categorical distribution defined by a
     population and a list of relative weights.
@@ -937,10 +1464,24 @@ class WeightedCategorical(Distribution):
         return self.samples(rand, 1)[0]
 
     def samples(self, rand, k: int) -> Sequence:
+        """Return a list of `k` samples from the distribution.
+
+        Note:
+            Unlike most distributions, this is equivalent to
+            ``rand.choices()`` rather than `k` calls to :meth:`sample`.
+            A :class:`~samplespace.repeatablerandom.RepeatableRandomSequence`
+            therefore advances only once for the whole batch.
+        """
         return rand.choices(self._population,
                             cum_weights=self._cum_weights,
                             k=k)
 
+    def bind(self, rand) -> Callable[[], Any]:
+        choices = rand.choices
+        population = self._population
+        cum_weights = self._cum_weights
+        return lambda: choices(population, cum_weights=cum_weights, k=1)[0]
+
     def as_list(self) -> List:
         return [self.__class__.__name__.casefold(), self.items]
 
@@ -968,7 +1509,16 @@ class UniformCategorical(Distribution):
     def sample(self, rand):
         return rand.choice(self._population)
 
+    def bind(self, rand) -> Callable[[], Any]:
+        return functools.partial(rand.choice, self._population)
+
     def samples(self, rand, k: int) -> Sequence:
+        """Return a list of `k` samples from the distribution.
+
+        Note:
+            Unlike most distributions, this is equivalent to
+            ``rand.choices()`` rather than `k` calls to :meth:`sample`.
+        """
         return rand.choices(self._population, k=k)
 
     def samples_unique(self, rand, k: int) -> List[Any]:
@@ -1079,10 +1629,1473 @@ class ZipfMandelbrotCategorical(WeightedCategorical):
         }
 
 
+class MarkovChain(Distribution):
+    """Represents a Markov chain defined by a sparse table of weighted
+    transitions between states.
+
+    Sampling produces a walk of up to `length` states, beginning with
+    a transition out of `start`. A walk ends early upon reaching a
+    state with no outgoing transitions, so terminal states may be
+    used to produce walks of varying length.
+
+    Each step draws from an :class:`~samplespace.algorithms.AliasTable`
+    for the current state, consuming two random values. Tables are
+    built the first time each state is visited, and reused thereafter.
+
+    Args:
+        transitions (Sequence[Sequence]): A sequence of
+            [from state, to state, relative weight] triples. Weights
+            need not be normalized. States must be hashable.
+        start: The state from which sampled walks begin.
+        length (int): The maximum number of states in a sampled walk.
+
+    Raises:
+        ValueError: if any transition's weight is negative, or if a
+            state's outgoing weights sum to zero.
+    """
+
+    def __init__(self,
+                 transitions: Sequence[Sequence],
+                 start: Any = None,
+                 length: int = 1):
+        super().__init__()
+        self._start: Any = start
+        self._length: int = length
+
+        # Maps each state to its (targets, weights)
+        self._transitions: Dict[Any, Tuple[List, List[float]]] = {}
+        for source, target, weight in transitions:
+            if weight < 0.0:
+                raise ValueError('Transition weights must be non-negative.')
+            targets, weights = self._transitions.setdefault(source, ([], []))
+            targets.append(target)
+            weights.append(weight)
+
+        for source, (_, weights) in self._transitions.items():
+            if not sum(weights) > 0.0:
+                raise ValueError(
+                    'Transitions from {!r} have zero total weight.'.format(
+                        source))
+
+        self._tables: Dict[Any, AliasTable] = {}
+
+    @property
+    def transitions(self) -> List[List]:
+        """Read-only property for the chain's transitions, as a list of
+        [from state, to state, relative weight] triples."""
+        return [[source, target, weight]
+                for source, (targets, weights) in self._transitions.items()
+                for target, weight in zip(targets, weights)]
+
+    @property
+    def start(self) -> Any:
+        """Read-only property for the state from which sampled
+        walks begin."""
+        return self._start
+
+    @property
+    def length(self) -> int:
+        """Read-only property for the maximum number of states in a
+        sampled walk."""
+        return self._length
+
+    @property
+    def states(self) -> List:
+        """Read-only property for the states with outgoing
+        transitions."""
+        return list(self._transitions)
+
+    def step(self, rand, state) -> Any:
+        """Sample the state following `state`.
+
+        Raises:
+            KeyError: if `state` has no outgoing transitions.
+        """
+        table = self._table(state)
+        targets = self._transitions[state][0]
+        return targets[table.sample(rand.randrange,
+                                    lambda p: rand.random() < p)]
+
+    def walk(self, rand, start, length: int) -> List:
+        """Sample a walk of up to `length` states, beginning with a
+        transition out of `start`.
+
+        The walk ends early if it reaches a state with no outgoing
+        transitions."""
+        return self.walks(rand, [start], length)[0]
+
+    def walks(self, rand, starts: Sequence, length: int) -> List[List]:
+        """Sample one walk from each of several starting states.
+
+        The walks are advanced in lockstep; every walk takes its first
+        step before any walk takes its second, and so on. Walks which
+        reach a state with no outgoing transitions end early, and stop
+        consuming random values.
+
+        Returns:
+            A list containing a walk for each state in `starts`.
+        """
+        transitions = self._transitions
+        tables = self._tables
+        randbelow = rand.randrange
+
+        def randchance(p):
+            return rand.random() < p
+
+        result = [[] for _ in starts]
+        current = list(enumerate(starts))
+        for _ in range(length):
+            moved = []
+            for i, state in current:
+                if state not in transitions:
+                    continue
+                table = tables.get(state)
+                if table is None:
+                    table = self._table(state)
+                state = transitions[state][0][table.sample(randbelow, randchance)]
+                result[i].append(state)
+                moved.append((i, state))
+            current = moved
+        return result
+
+    def sample(self, rand) -> List:
+        return self.walk(rand, self._start, self._length)
+
+    def as_list(self) -> List:
+        return [self.__class__.__name__.casefold(),
+                self.transitions, self._start, self._length]
+
+    def as_dict(self) -> Dict:
+        return {
+            'distribution': self.__class__.__name__.casefold(),
+            'transitions': self.transitions,
+            'start': self._start,
+            'length': self._length
+        }
+
+    def _table(self, state) -> AliasTable:
+        table = self._tables.get(state)
+        if table is None:
+            table = AliasTable.from_weights(self._transitions[state][1])
+            self._tables[state] = table
+        return table
+
+    def __eq__(self, other):
+        # N.B. Alias tables are a cache, so are excluded from comparison.
+        if isinstance(other, self.__class__):
+            return (self._transitions, self._start, self._length) == \
+                   (other._transitions, other._start, other._length)
+        return NotImplemented
+
+
+class Multinomial(Distribution):
+    """Represents a multinomial distribution, the number of times each
+    of several outcomes occurs in `n` independent trials.
+
+    Samples are lists with one count for each weight, summing to `n`.
+    Each count is sampled from a binomial distribution conditioned on
+    the counts before it, so a sample requires at most one binomial
+    variate per outcome rather than one categorical variate per trial.
+
+    Args:
+        n (int): The number of trials.
+        weights (Sequence[float]): The relative weight of each outcome.
+            Need not be normalized.
+
+    Raises:
+        ValueError: if `n` is negative or not an integer, any weight
+            is negative, or the weights sum to zero.
+    """
+
+    def __init__(self, n: int, weights: Sequence[float]):
+        super().__init__()
+        if n < 0 or n != int(n):
+            raise ValueError('n must be a non-negative integer.')
+        if any(w < 0.0 for w in weights):
+            raise ValueError('Weights must be non-negative.')
+        if not sum(weights) > 0.0:
+            raise ValueError('Weights must not sum to zero.')
+        self._n: int = n
+        self._weights: List[float] = list(weights)
+
+        # Total weight of each outcome and those after it
+        self._remaining_weights: List[float] = \
+            list(itertools.accumulate(reversed(self._weights)))[::-1]
+
+    @property
+    def n(self) -> int:
+        """Read-only property for the number of trials."""
+        return self._n
+
+    @property
+    def weights(self) -> List[float]:
+        """Read-only property for the relative weight of each
+        outcome."""
+        return self._weights
+
+    def sample(self, rand) -> List[int]:
+        return self.samples(rand, 1)[0]
+
+    def samples(self, rand, k: int) -> List[List[int]]:
+        binomial = getattr(rand,
+                           'binomialvariate',
+                           lambda n, p:
+                           sample_binomial(rand.random, n, p))
+        chances = [min(w / r, 1.0) if r > 0.0 else 0.0
+                   for w, r in zip(self._weights[:-1],
+                                   self._remaining_weights)]
+
+        result = []
+        for _ in range(k):
+            counts = []
+            remaining = self._n
+            for chance in chances:
+                if remaining:
+                    count = binomial(remaining, chance)
+                    remaining -= count
+                else:
+                    count = 0
+                counts.append(count)
+            counts.append(remaining)
+            result.append(counts)
+        return result
+
+    def as_list(self) -> List:
+        return [self.__class__.__name__.casefold(),
+                self._n, self._weights]
+
+    def as_dict(self) -> Dict:
+        return {
+            'distribution': self.__class__.__name__.casefold(),
+            'n': self._n,
+            'weights': self._weights
+        }
+
+
+class Dirichlet(Distribution):
+    r"""Represents a Dirichlet distribution with concentration
+    parameters `alphas`.
+
+    Samples are lists of non-negative floats summing to 1.0, with one
+    element for each concentration parameter. Each sample is found by
+    normalizing independent gamma variates with shape `alphas[i]`.
+
+    The Dirichlet distribution is defined by
+
+    .. math::
+
+        \text{P}(x) = \frac{\Gamma(\sum_i \alpha_i)}
+        {\prod_i \Gamma(\alpha_i)} \prod_i x_i^{\alpha_i - 1}
+
+    Raises:
+        ValueError: if fewer than two concentration parameters are
+            given, or any is not greater than 0.
+    """
+
+    def __init__(self, alphas: Sequence[float]):
+        super().__init__()
+        if len(alphas) < 2:
+            raise ValueError('Must specify at least two alphas.')
+        if not all(a > 0.0 for a in alphas):
+            raise ValueError('Alphas must be greater than 0.')
+        self._alphas: List[float] = list(alphas)
+
+    @property
+    def alphas(self) -> List[float]:
+        """Read-only property for the distribution's concentration
+        parameters."""
+        return self._alphas
+
+    def sample(self, rand) -> List[float]:
+        return self.samples(rand, 1)[0]
+
+    def samples(self, rand, k: int) -> List[List[float]]:
+        gamma = rand.gammavariate
+        alphas = self._alphas
+        result = []
+        for _ in range(k):
+            values = [gamma(alpha, 1.0) for alpha in alphas]
+            total = sum(values)
+            result.append([x / total for x in values])
+        return result
+
+    def as_list(self) -> List:
+        return [self.__class__.__name__.casefold(),
+                self._alphas]
+
+    def as_dict(self) -> Dict:
+        return {
+            'distribution': self.__class__.__name__.casefold(),
+            'alphas': self._alphas
+        }
+
+
+class MultivariateGaussian(Distribution):
+    """Represents a multivariate Gaussian distribution with mean vector
+    `mean` and covariance matrix `cov`.
+
+    Samples are lists of floats with the same length as `mean`. The
+    covariance matrix is factorized once on construction, so each
+    sample requires only a set of independent standard normal variates
+    and a triangular matrix-vector product. Standard normal variates
+    are taken in pairs using ``rand.gausspair()`` if available.
+
+    Args:
+        mean (Sequence[float]): The distribution's mean.
+        cov (Sequence[Sequence[float]]): The distribution's covariance,
+            as a symmetric positive semi-definite matrix given as a
+            list of rows.
+
+    Raises:
+        ValueError: if `cov` is not a square matrix matching the size
+            of `mean`, or is not positive semi-definite.
+    """
+
+    def __init__(self, mean: Sequence[float], cov: Sequence[Sequence[float]]):
+        super().__init__()
+        size = len(mean)
+        if size < 1:
+            raise ValueError('Mean must not be empty.')
+        if len(cov) != size or any(len(row) != size for row in cov):
+            raise ValueError('Covariance must be a square matrix with '
+                             'the same size as the mean.')
+        self._mean: List[float] = list(mean)
+        self._cov: List[List[float]] = [list(row) for row in cov]
+        self._factor: List[List[float]] = self._cholesky(self._cov)
+
+    @property
+    def mean(self) -> List[float]:
+        """Read-only property for the distribution's mean."""
+        return self._mean
+
+    @property
+    def cov(self) -> List[List[float]]:
+        """Read-only property for the distribution's covariance
+        matrix."""
+        return self._cov
+
+    def sample(self, rand) -> List[float]:
+        return self.samples(rand, 1)[0]
+
+    def samples(self, rand, k: int) -> List[List[float]]:
+        size = len(self._mean)
+        gausspair = getattr(rand, 'gausspair', None)
+        if gausspair is None:
+            def standard_normals():
+                return [rand.gauss(0.0, 1.0) for _ in range(size)]
+        else:
+            def standard_normals():
+                pairs = [gausspair(0.0, 1.0) for _ in range((size + 1) // 2)]
+                return [x for pair in pairs for x in pair][:size]
+
+        rows = list(zip(self._mean, self._factor))
+        result = []
+        for _ in range(k):
+            z = standard_normals()
+            result.append([mu + sum(map(operator.mul, row, z))
+                           for mu, row in rows])
+        return result
+
+    def as_list(self) -> List:
+        return [self.__class__.__name__.casefold(),
+                self._mean, self._cov]
+
+    def as_dict(self) -> Dict:
+        return {
+            'distribution': self.__class__.__name__.casefold(),
+            'mean': self._mean,
+            'cov': self._cov
+        }
+
+    @staticmethod
+    def _cholesky(matrix: List[List[float]]) -> List[List[float]]:
+        # Returns the lower-triangular factor L such that L L^T equals
+        # `matrix`, with each row truncated after its diagonal. Zero
+        # pivots are permitted so that semi-definite matrices (e.g.
+        # perfectly correlated variables) are supported.
+        size = len(matrix)
+        tolerance = 1e-12 * max(abs(matrix[i][i]) for i in range(size))
+        factor = [[0.0] * (i + 1) for i in range(size)]
+        for j in range(size):
+            if any(abs(matrix[i][j] - matrix[j][i]) > tolerance
+                   for i in range(j)):
+                raise ValueError('Covariance must be symmetric.')
+            pivot = matrix[j][j] - math.fsum(x * x for x in factor[j][:j])
+            if pivot < -tolerance:
+                raise ValueError('Covariance must be positive '
+                                 'semi-definite.')
+            diagonal = math.sqrt(pivot) if pivot > tolerance else 0.0
+            factor[j][j] = diagonal
+            for i in range(j + 1, size):
+                value = matrix[i][j] - math.fsum(
+                    a * b for a, b in zip(factor[i][:j], factor[j][:j]))
+                if diagonal:
+                    factor[i][j] = value / diagonal
+                elif abs(value) > tolerance:
+                    raise ValueError('Covariance must be positive '
+                                     'semi-definite.')
+        return factor
+
+
+class Truncated(Distribution):
+    """Represents another distribution truncated to the interval
+    [`lo`, `hi`].
+
+    The following distributions may be truncated:
+
+    * :class:`Exponential` and :class:`Pareto`, sampled using their
+      closed-form inverse CDFs.
+    * :class:`Gaussian` and :class:`LogNormal`, sampled by inverting
+      the normal CDF. Intervals so far into a tail that the CDF
+      underflows are sampled using Robert's exponential rejection
+      method instead.
+    * :class:`Gamma`, sampled by numerically inverting the regularized
+      incomplete gamma function.
+
+    Except in the case of Robert's method, each sample requires exactly
+    one random value, however far into a tail the interval lies.
+    Robert's method requires two random values per iteration, and
+    accepts with probability of at least 0.99 so far into the tail.
+
+    Args:
+        dist (Distribution): The distribution to truncate. May also be
+            given in the form returned by ``as_dict()`` or
+            ``as_list()``.
+        lo (float, optional): The lower bound. If ``None``, the
+            distribution is not truncated from below.
+        hi (float, optional): The upper bound. If ``None``, the
+            distribution is not truncated from above.
+
+    Raises:
+        ValueError: if `dist` cannot be truncated, `lo` is not less than
+            `hi`, or the interval has no probability mass.
+    """
+
+    def __init__(self,
+                 dist,
+                 lo: Optional[float] = None,
+                 hi: Optional[float] = None):
+        super().__init__()
+        dist = _as_distribution(dist)
+        if lo is not None and hi is not None and not lo < hi:
+            raise ValueError('lo must be less than hi.')
+
+        self._dist: Distribution = dist
+        self._lo: Optional[float] = lo
+        self._hi: Optional[float] = hi
+
+        name = dist.__class__.__name__.casefold()
+        if name not in self._SUPPORTED:
+            raise ValueError('Cannot truncate {} distributions.'.format(
+                dist.__class__.__name__))
+        lo = -math.inf if lo is None else lo
+        hi = math.inf if hi is None else hi
+        self._method: str = name
+        self._params: Tuple = getattr(self, '_setup_' + name)(lo, hi)
+
+    _SUPPORTED = ('exponential', 'pareto', 'gaussian', 'lognormal', 'gamma')
+
+    @property
+    def dist(self) -> Distribution:
+        """Read-only property for the distribution being truncated."""
+        return self._dist
+
+    @property
+    def lo(self) -> Optional[float]:
+        """Read-only property for the lower bound, or ``None``."""
+        return self._lo
+
+    @property
+    def hi(self) -> Optional[float]:
+        """Read-only property for the upper bound, or ``None``."""
+        return self._hi
+
+    def sample(self, rand) -> float:
+        return getattr(self, '_sample_' + self._method)(rand, *self._params)
+
+    def bind(self, rand) -> Callable[[], float]:
+        return functools.partial(getattr(self, '_sample_' + self._method),
+                                 rand, *self._params)
+
+    def as_list(self) -> List:
+        return [self.__class__.__name__.casefold(),
+                self._dist.as_list(), self._lo, self._hi]
+
+    def as_dict(self) -> Dict:
+        return {
+            'distribution': self.__class__.__name__.casefold(),
+            'dist': self._dist.as_dict(),
+            'lo': self._lo,
+            'hi': self._hi
+        }
+
+    # ---- Exponential ----
+
+    def _setup_exponential(self, lo: float, hi: float) -> Tuple:
+        lambd = self._dist.lambd
+        if not lambd > 0.0:
+            raise ValueError('Can only truncate exponential distributions '
+                             'with positive rates.')
+        # By memorylessness, only the interval's width matters
+        lo = max(lo, 0.0)
+        mass = -math.expm1(-lambd * (hi - lo))
+        if not mass > 0.0:
+            raise ValueError('Truncation interval contains no '
+                             'probability mass.')
+        return lo, hi, lambd, mass
+
+    @staticmethod
+    def _sample_exponential(rand, lo, hi, lambd, mass) -> float:
+        return min(lo - math.log1p(-rand.random() * mass) / lambd, hi)
+
+    # ---- Pareto ----
+
+    def _setup_pareto(self, lo: float, hi: float) -> Tuple:
+        alpha = self._dist.alpha
+        if not alpha > 0.0:
+            raise ValueError('Can only truncate Pareto distributions '
+                             'with positive alpha.')
+        lo = max(lo, 1.0)
+        survival_lo = lo ** -alpha
+        survival_hi = hi ** -alpha
+        if not survival_lo > survival_hi:
+            raise ValueError('Truncation interval contains no '
+                             'probability mass.')
+        return lo, hi, alpha, survival_lo, survival_lo - survival_hi
+
+    @staticmethod
+    def _sample_pareto(rand, lo, hi, alpha, survival_lo, mass) -> float:
+        survival = survival_lo - rand.random() * mass
+        return min(max(survival ** (-1.0 / alpha), lo), hi)
+
+    # ---- Gaussian ----
+
+    def _setup_gaussian(self, lo: float, hi: float) -> Tuple:
+        return _truncated_normal_setup(
+            self._dist.mu, self._dist.sigma, lo, hi)
+
+    @staticmethod
+    def _sample_gaussian(rand, *params) -> float:
+        return _truncated_normal_sample(rand, *params)
+
+    # ---- LogNormal ----
+
+    def _setup_lognormal(self, lo: float, hi: float) -> Tuple:
+        if not hi > 0.0:
+            raise ValueError('Truncation interval contains no '
+                             'probability mass.')
+        lo = math.log(lo) if lo > 0.0 else -math.inf
+        return _truncated_normal_setup(
+            self._dist.mu, self._dist.sigma, lo, math.log(hi))
+
+    @staticmethod
+    def _sample_lognormal(rand, *params) -> float:
+        return math.exp(_truncated_normal_sample(rand, *params))
+
+    # ---- Gamma ----
+
+    def _setup_gamma(self, lo: float, hi: float) -> Tuple:
+        alpha, beta = self._dist.alpha, self._dist.beta
+        if not (alpha > 0.0 and beta > 0.0):
+            raise ValueError('alpha and beta must be greater than 0.')
+        lo = max(lo, 0.0) / beta
+        hi = hi / beta
+        lower_lo, upper_lo = _regularized_gamma(alpha, lo)
+        lower_hi, upper_hi = _regularized_gamma(alpha, hi)
+
+        # Invert whichever of P and Q is smaller over the interval,
+        # to avoid cancellation in the tails
+        use_upper = lower_lo >= 0.5
+        if use_upper:
+            start, mass = upper_lo, upper_lo - upper_hi
+        else:
+            start, mass = lower_lo, lower_hi - lower_lo
+        if not mass > 0.0:
+            raise ValueError('Truncation interval contains no '
+                             'probability mass.')
+        return alpha, beta, lo, hi, use_upper, start, mass
+
+    @staticmethod
+    def _sample_gamma(rand, alpha, beta, lo, hi, use_upper,
+                      start, mass) -> float:
+        u = rand.random()
+        if use_upper:
+            target = start - u * mass
+        else:
+            target = start + u * mass
+        return _inverse_regularized_gamma(
+            alpha, target, use_upper, lo, hi) * beta
+
+
+class Empirical(Distribution):
+    """Represents a continuous distribution defined by a table of
+    evenly-spaced quantiles.
+
+    Sampling chooses a uniformly-distributed position within the table
+    and linearly interpolates between the two nearest quantiles, so
+    takes constant time using a single random value regardless of how
+    much data the table was built from.
+
+    The table may be given directly, or built from either observed
+    `data` or a tabulated CDF given by `values` and `cdf`. Only one of
+    these should be provided.
+
+    Args:
+        quantiles (Sequence[float], optional): The values of the
+            quantiles at probabilities ``i / (len(quantiles) - 1)``.
+        data (Iterable[float], optional): Observed values. The table is
+            built by linearly interpolating between order statistics.
+        values (Sequence[float], optional): Values in increasing order
+            at which the CDF is tabulated.
+        cdf (Sequence[float], optional): The CDF at each value. The CDF
+            is linearly interpolated between values, and rescaled to
+            increase from 0.0 at ``values[0]`` to 1.0 at
+            ``values[-1]``.
+        table_size (int): The number of quantiles in the table when
+            building from `data` or `cdf`.
+
+    Raises:
+        ValueError: if the arguments are inconsistent, or define a
+            table with fewer than two quantiles.
+    """
+
+    DEFAULT_TABLE_SIZE: int = 4097
+    """The default number of quantiles built from data or a CDF."""
+
+    _BYTES_HEADER = struct.Struct('<BI')
+    _BYTES_VERSION = 1
+
+    def __init__(self,
+                 quantiles: Optional[Sequence[float]] = None, *,
+                 data: Optional[Iterable[float]] = None,
+                 values: Optional[Sequence[float]] = None,
+                 cdf: Optional[Sequence[float]] = None,
+                 table_size: int = DEFAULT_TABLE_SIZE):
+        super().__init__()
+        sources = sum(x is not None for x in (quantiles, data, cdf))
+        if sources != 1 or (values is None) != (cdf is None):
+            raise ValueError('Specify exactly one of quantiles, data, '
+                             'or values and cdf.')
+        if table_size < 2:
+            raise ValueError('Table size must be at least 2.')
+
+        if data is not None:
+            quantiles = self._quantiles_from_data(data, table_size)
+        elif cdf is not None:
+            quantiles = self._quantiles_from_cdf(values, cdf, table_size)
+
+        if len(quantiles) < 2:
+            raise ValueError('Must have at least two quantiles.')
+        if any(b < a for a, b in zip(quantiles, quantiles[1:])):
+            raise ValueError('Quantiles must be in increasing order.')
+        self._quantiles: List[float] = [float(x) for x in quantiles]
+
+    @property
+    def quantiles(self) -> List[float]:
+        """Read-only property for the table of quantiles."""
+        return self._quantiles
+
+    def quantile(self, p: float) -> float:
+        """Return the value below which a sample falls with
+        probability `p`.
+
+        Raises:
+            ValueError: if `p` is not in [0.0, 1.0].
+        """
+        if not 0.0 <= p <= 1.0:
+            raise ValueError('p must be in [0.0, 1.0].')
+        return self._interpolate(p)
+
+    def sample(self, rand) -> float:
+        return self._interpolate(rand.random())
+
+    def bind(self, rand) -> Callable[[], float]:
+        random = rand.random
+        interpolate = self._interpolate
+        return lambda: interpolate(random())
+
+    def samples(self, rand, k: int) -> List[float]:
+        quantiles = self._quantiles
+        scale = len(quantiles) - 1
+        result = []
+        for u in _randoms(rand, k):
+            position = u * scale
+            i = int(position)
+            low = quantiles[i]
+            result.append(low + (quantiles[i + 1] - low) * (position - i))
+        return result
+
+    def as_list(self) -> List:
+        return [self.__class__.__name__.casefold(),
+                self._quantiles]
+
+    def as_dict(self) -> Dict:
+        return {
+            'distribution': self.__class__.__name__.casefold(),
+            'quantiles': self._quantiles
+        }
+
+    def as_bytes(self) -> bytes:
+        """Return a compact binary representation of the distribution.
+
+        The representation is a little-endian header containing a
+        format version (uint8) and the number of quantiles (uint32),
+        followed by each quantile as a little-endian float64.
+        """
+        table = array('d', self._quantiles)
+        if sys.byteorder != 'little':
+            table.byteswap()
+        return self._BYTES_HEADER.pack(
+            self._BYTES_VERSION, len(table)) + table.tobytes()
+
+    @classmethod
+    def from_bytes(cls, as_bytes: bytes) -> 'Empirical':
+        """Build a distribution from the representation returned
+        by :meth:`as_bytes`.
+
+        Raises:
+            ValueError: if the representation is malformed or of an
+                unsupported version.
+        """
+        header_size = cls._BYTES_HEADER.size
+        if len(as_bytes) < header_size:
+            raise ValueError('Representation is too short.')
+        version, count = cls._BYTES_HEADER.unpack_from(as_bytes)
+        if version != cls._BYTES_VERSION:
+            raise ValueError('Unsupported representation version.')
+        table = array('d')
+        table.frombytes(as_bytes[header_size:])
+        if len(table) != count or len(as_bytes) != header_size + 8 * count:
+            raise ValueError('Representation has the wrong length.')
+        if sys.byteorder != 'little':
+            table.byteswap()
+        return cls(table.tolist())
+
+    def _interpolate(self, p: float) -> float:
+        quantiles = self._quantiles
+        position = p * (len(quantiles) - 1)
+        i = min(int(position), len(quantiles) - 2)
+        low = quantiles[i]
+        return low + (quantiles[i + 1] - low) * (position - i)
+
+    @staticmethod
+    def _quantiles_from_data(data: Iterable[float],
+                             table_size: int) -> List[float]:
+        data = sorted(data)
+        if not data:
+            raise ValueError('Data must not be empty.')
+        scale = (len(data) - 1) / (table_size - 1)
+        result = []
+        for j in range(table_size):
+            position = j * scale
+            i = min(int(position), len(data) - 1)
+            if i == len(data) - 1:
+                result.append(data[i])
+            else:
+                result.append(data[i] + (data[i + 1] - data[i]) * (position - i))
+        return result
+
+    @staticmethod
+    def _quantiles_from_cdf(values: Sequence[float],
+                            cdf: Sequence[float],
+                            table_size: int) -> List[float]:
+        if len(values) != len(cdf) or len(values) < 2:
+            raise ValueError('Values and CDF must have the same number '
+                             'of elements, and at least two.')
+        if any(b < a for a, b in zip(values, values[1:])) or \
+                any(b < a for a, b in zip(cdf, cdf[1:])):
+            raise ValueError('Values and CDF must be in increasing order.')
+        low, span = cdf[0], cdf[-1] - cdf[0]
+        if not span > 0.0:
+            raise ValueError('CDF must not be constant.')
+        cdf = [(x - low) / span for x in cdf]
+
+        result = []
+        for j in range(table_size):
+            p = j / (table_size - 1)
+            i = bisect_left(cdf, p)
+            if i == 0:
+                result.append(values[0])
+            else:
+                fraction = (p - cdf[i - 1]) / (cdf[i] - cdf[i - 1])
+                result.append(values[i - 1] +
+                              (values[i] - values[i - 1]) * fraction)
+        return result
+
+
+class Mixture(Distribution):
+    """Represents a mixture of other distributions.
+
+    Each sample is taken from one of the `components`, chosen with
+    probability proportional to its weight using an
+    :class:`~samplespace.algorithms.AliasTable`.
+
+    Args:
+        components (Sequence[Distribution]): The distributions to mix.
+            Each may also be given in the form returned by
+            ``as_dict()`` or ``as_list()``.
+        weights (Sequence[float], optional): The relative weight of each
+            component. If omitted, components are weighted equally.
+
+    Raises:
+        ValueError: if no components are given, the number of weights
+            does not match the number of components, any weight is
+            negative, or the weights sum to zero.
+    """
+
+    def __init__(self,
+                 components: Sequence,
+                 weights: Optional[Sequence[float]] = None):
+        super().__init__()
+        if not components:
+            raise ValueError('Must specify at least one component.')
+        if weights is None:
+            weights = [1.0] * len(components)
+        if len(weights) != len(components):
+            raise ValueError('Components and weights must have '
+                             'the same number of elements.')
+        if any(w < 0.0 for w in weights):
+            raise ValueError('Weights must be non-negative.')
+        if not sum(weights) > 0.0:
+            raise ValueError('Weights must not sum to zero.')
+
+        self._components: List[Distribution] = \
+            [_as_distribution(x) for x in components]
+        self._weights: List[float] = list(weights)
+        self._table: AliasTable = AliasTable.from_weights(self._weights)
+
+    @property
+    def components(self) -> List[Distribution]:
+        """Read-only property for the distribution's components."""
+        return self._components
+
+    @property
+    def weights(self) -> List[float]:
+        """Read-only property for the relative weight of
+        each component."""
+        return self._weights
+
+    def sample(self, rand):
+        index = self._table.sample(rand.randrange,
+                                   lambda p: rand.random() < p)
+        return self._components[index].sample(rand)
+
+    def bind(self, rand) -> Callable[[], Any]:
+        select = functools.partial(self._table.sample, rand.randrange,
+                                   lambda p: rand.random() < p)
+        components = [x.bind(rand) for x in self._components]
+        return lambda: components[select()]()
+
+    def samples_grouped(self, rand, k: int) -> List:
+        """Return a list of `k` samples from the distribution, grouping
+        draws by component.
+
+        A component is first chosen for every sample, then each chosen
+        component is sampled in a single batch using its own
+        ``samples_grouped()`` method.
+        """
+        select = functools.partial(self._table.sample, rand.randrange,
+                                   lambda p: rand.random() < p)
+        positions = [[] for _ in self._components]
+        for i in range(k):
+            positions[select()].append(i)
+
+        # Sample each component once, in batch, then restore the
+        # chosen order
+        result = [None] * k
+        for component, component_positions in zip(self._components,
+                                                  positions):
+            if not component_positions:
+                continue
+            values = component.samples_grouped(rand,
+                                               len(component_positions))
+            for i, value in zip(component_positions, values):
+                result[i] = value
+        return result
+
+    def as_list(self) -> List:
+        return [self.__class__.__name__.casefold(),
+                [x.as_list() for x in self._components],
+                self._weights]
+
+    def as_dict(self) -> Dict:
+        return {
+            'distribution': self.__class__.__name__.casefold(),
+            'components': [x.as_dict() for x in self._components],
+            'weights': self._weights
+        }
+
+
+class Arithmetic(Distribution):
+    """Represents the result of an arithmetic operation on samples from
+    two distributions, or a distribution and a constant.
+
+    Arithmetic distributions are usually created using operators, e.g.
+    ``Gaussian(0.0, 1.0) * 3.0 + Exponential(2.0)``. Each operand is
+    sampled independently, even if the same distribution appears more
+    than once within an expression.
+
+    Args:
+        op (str): One of ``'add'``, ``'sub'``, ``'mul'``, or
+            ``'truediv'``.
+        left: The left operand, either a number or a distribution.
+            Distributions may also be given in the form returned by
+            ``as_dict()`` or ``as_list()``.
+        right: The right operand.
+
+    Raises:
+        ValueError: if `op` is not recognized.
+    """
+
+    def __init__(self, op: str, left, right):
+        super().__init__()
+        if op not in _OPERATORS:
+            raise ValueError('Operator must be one of {}.'.format(
+                ', '.join(_OPERATORS)))
+        self._op: str = op
+        self._left = _as_operand(left)
+        self._right = _as_operand(right)
+
+    @property
+    def op(self) -> str:
+        """Read-only property for the name of the operator."""
+        return self._op
+
+    @property
+    def left(self):
+        """Read-only property for the left operand."""
+        return self._left
+
+    @property
+    def right(self):
+        """Read-only property for the right operand."""
+        return self._right
+
+    def sample(self, rand):
+        left = _sample_operand(self._left, rand)
+        right = _sample_operand(self._right, rand)
+        return _OPERATORS[self._op](left, right)
+
+    def bind(self, rand) -> Callable[[], Any]:
+        func = _OPERATORS[self._op]
+        left = _bind_operand(self._left, rand)
+        right = _bind_operand(self._right, rand)
+        return lambda: func(left(), right())
+
+    def samples_grouped(self, rand, k: int) -> List:
+        """Return a list of `k` samples from the distribution, grouping
+        draws by operand.
+
+        Each operand is sampled in a single batch using its own
+        ``samples_grouped()`` method, left operand first, and the
+        batches are then combined.
+        """
+        left = _sample_operand_many(self._left, rand, k)
+        right = _sample_operand_many(self._right, rand, k)
+        return list(map(_OPERATORS[self._op], left, right))
+
+    def as_list(self) -> List:
+        return [self.__class__.__name__.casefold(), self._op,
+                _operand_as_list(self._left), _operand_as_list(self._right)]
+
+    def as_dict(self) -> Dict:
+        return {
+            'distribution': self.__class__.__name__.casefold(),
+            'op': self._op,
+            'left': _operand_as_dict(self._left),
+            'right': _operand_as_dict(self._right)
+        }
+
+
+class Mapped(Distribution):
+    """Represents the result of applying a function to samples from
+    another distribution.
+
+    Mapped distributions are usually created using
+    :meth:`Distribution.map`. So that they may be serialized, functions
+    are referred to by the name they were registered with using
+    :func:`register_function`. The following functions are
+    registered by default:
+
+    ``neg``, ``abs``, ``round``, ``floor``, ``ceil``, ``sqrt``,
+    ``exp``, ``expm1``, ``log``, ``log1p``, ``log10``, ``sin``,
+    ``cos``, ``tan``, ``tanh``
+
+    Args:
+        dist (Distribution): The distribution whose samples are mapped.
+            May also be given in the form returned by ``as_dict()`` or
+            ``as_list()``.
+        func (str or Callable): The name of a registered function, or
+            the registered function itself.
+
+    Raises:
+        ValueError: if `func` is not registered.
+    """
+
+    def __init__(self, dist, func: Union[str, Callable]):
+        super().__init__()
+        self._dist: Distribution = _as_distribution(dist)
+        self._func: str = _function_name(func)
+
+    @property
+    def dist(self) -> Distribution:
+        """Read-only property for the distribution being mapped."""
+        return self._dist
+
+    @property
+    def func(self) -> str:
+        """Read-only property for the name of the mapped function."""
+        return self._func
+
+    def sample(self, rand):
+        return _functions[self._func](self._dist.sample(rand))
+
+    def bind(self, rand) -> Callable[[], Any]:
+        func = _functions[self._func]
+        sample = self._dist.bind(rand)
+        return lambda: func(sample())
+
+    def samples(self, rand, k: int) -> List:
+        return list(map(_functions[self._func], self._dist.samples(rand, k)))
+
+    def samples_grouped(self, rand, k: int) -> List:
+        return list(map(_functions[self._func],
+                        _sample_operand_many(self._dist, rand, k)))
+
+    def as_list(self) -> List:
+        return [self.__class__.__name__.casefold(),
+                self._dist.as_list(), self._func]
+
+    def as_dict(self) -> Dict:
+        return {
+            'distribution': self.__class__.__name__.casefold(),
+            'dist': self._dist.as_dict(),
+            'func': self._func
+        }
+
+
+class Clipped(Distribution):
+    """Represents samples from another distribution clamped to the
+    interval [`lo`, `hi`].
+
+    Unlike :class:`Truncated`, samples outside the interval are moved
+    to its nearest bound, rather than redistributed within it. Clipped
+    distributions are usually created using :func:`clip`.
+
+    Args:
+        dist (Distribution): The distribution whose samples are clipped.
+            May also be given in the form returned by ``as_dict()`` or
+            ``as_list()``.
+        lo (float, optional): The lower bound, or ``None``.
+        hi (float, optional): The upper bound, or ``None``.
+
+    Raises:
+        ValueError: if `lo` is greater than `hi`.
+    """
+
+    def __init__(self,
+                 dist,
+                 lo: Optional[float] = None,
+                 hi: Optional[float] = None):
+        super().__init__()
+        if lo is not None and hi is not None and lo > hi:
+            raise ValueError('lo must not be greater than hi.')
+        self._dist: Distribution = _as_distribution(dist)
+        self._lo: Optional[float] = lo
+        self._hi: Optional[float] = hi
+
+    @property
+    def dist(self) -> Distribution:
+        """Read-only property for the distribution being clipped."""
+        return self._dist
+
+    @property
+    def lo(self) -> Optional[float]:
+        """Read-only property for the lower bound, or ``None``."""
+        return self._lo
+
+    @property
+    def hi(self) -> Optional[float]:
+        """Read-only property for the upper bound, or ``None``."""
+        return self._hi
+
+    def sample(self, rand):
+        return self._clip([self._dist.sample(rand)])[0]
+
+    def bind(self, rand) -> Callable[[], Any]:
+        clip_values = self._clip
+        sample = self._dist.bind(rand)
+        return lambda: clip_values([sample()])[0]
+
+    def samples(self, rand, k: int) -> List:
+        return self._clip(self._dist.samples(rand, k))
+
+    def samples_grouped(self, rand, k: int) -> List:
+        return self._clip(_sample_operand_many(self._dist, rand, k))
+
+    def as_list(self) -> List:
+        return [self.__class__.__name__.casefold(),
+                self._dist.as_list(), self._lo, self._hi]
+
+    def as_dict(self) -> Dict:
+        return {
+            'distribution': self.__class__.__name__.casefold(),
+            'dist': self._dist.as_dict(),
+            'lo': self._lo,
+            'hi': self._hi
+        }
+
+    def _clip(self, values: List) -> List:
+        if self._lo is not None:
+            lo = self._lo
+            values = [lo if x < lo else x for x in values]
+        if self._hi is not None:
+            hi = self._hi
+            values = [hi if x > hi else x for x in values]
+        return values
+
+
+def clip(dist, lo: Optional[float] = None,
+         hi: Optional[float] = None) -> Clipped:
+    """Return a distribution whose samples are those of `dist` clamped
+    to the interval [`lo`, `hi`]. See :class:`Clipped`."""
+    return Clipped(dist, lo, hi)
+
+
+def register_function(name: str, func: Callable) -> None:
+    """Register a function for use with :meth:`Distribution.map`.
+
+    Functions must be registered under the same name wherever mapped
+    distributions are serialized and deserialized.
+
+    Raises:
+        ValueError: if a different function is already registered
+            as `name`.
+    """
+    existing = _functions.get(name)
+    if existing is not None and existing is not func:
+        raise ValueError(
+            'A different function is already registered as {!r}.'.format(
+                name))
+    _functions[name] = func
+
+
+_OPERATORS = {
+    'add': operator.add,
+    'sub': operator.sub,
+    'mul': operator.mul,
+    'truediv': operator.truediv
+}
+
+_functions: Dict[str, Callable] = {
+    'neg': operator.neg,
+    'abs': abs,
+    'round': round,
+    'floor': math.floor,
+    'ceil': math.ceil,
+    'sqrt': math.sqrt,
+    'exp': math.exp,
+    'expm1': math.expm1,
+    'log': math.log,
+    'log1p': math.log1p,
+    'log10': math.log10,
+    'sin': math.sin,
+    'cos': math.cos,
+    'tan': math.tan,
+    'tanh': math.tanh
+}
+
+
+def _function_name(func: Union[str, Callable]) -> str:
+    if isinstance(func, str):
+        if func not in _functions:
+            raise ValueError('No function is registered as {!r}.'.format(
+                func))
+        return func
+    for name, registered in _functions.items():
+        if registered is func:
+            return name
+    raise ValueError('Function must be registered using '
+                     'register_function().')
+
+
+def _is_operand(value) -> bool:
+    return isinstance(value, (Distribution, numbers.Real))
+
+
+def _as_operand(value):
+    # Constants are kept as-is, and anything else is a distribution
+    if isinstance(value, numbers.Real):
+        return value
+    return _as_distribution(value)
+
+
+def _operand_as_list(value):
+    return value.as_list() if isinstance(value, Distribution) else value
+
+
+def _operand_as_dict(value):
+    return value.as_dict() if isinstance(value, Distribution) else value
+
+
+def _sample_operand(value, rand):
+    return value.sample(rand) if isinstance(value, Distribution) else value
+
+
+def _bind_operand(value, rand) -> Callable[[], Any]:
+    if isinstance(value, Distribution):
+        return value.bind(rand)
+    return lambda: value
+
+
+def _sample_operand_many(value, rand, k: int) -> Iterable:
+    # Samples an operand in bulk using the distribution's grouped
+    # batch sampler, or repeats a constant.
+    if isinstance(value, Distribution):
+        return value.samples_grouped(rand, k)
+    return itertools.repeat(value, k)
+
+
+def _broadcast(*params) -> Tuple[int, List[Iterable]]:
+    # Returns the common length of the sequence parameters, and each
+    # parameter's per-sample values, repeating single values.
+    count = None
+    for value in params:
+        if hasattr(value, '__len__'):
+            if count is None:
+                count = len(value)
+            elif len(value) != count:
+                raise ValueError('Parameter sequences must have the '
+                                 'same length.')
+    if count is None:
+        raise ValueError('At least one parameter must be a sequence.')
+    return count, [value if hasattr(value, '__len__')
+                   else itertools.repeat(value, count)
+                   for value in params]
+
+
+def _randoms(rand, k: int) -> List[float]:
+    # Equivalent to k calls to rand.random(), generated in bulk if
+    # the generator supports it.
+    randoms = getattr(rand, '_randoms', None)
+    if randoms is not None:
+        return randoms(k)
+    random = rand.random
+    return [random() for _ in range(k)]
+
+
+def _as_distribution(value) -> Distribution:
+    # Accepts a distribution, or a nested dict or list representation
+    # of one.
+    if isinstance(value, dict):
+        return distribution_from_dict(value)
+    if isinstance(value, (list, tuple)):
+        return distribution_from_list(value)
+    return value
+
+
+def _normal_cdf(x: float) -> float:
+    # Accurate to full relative precision in the lower tail
+    return 0.5 * math.erfc(-x / math.sqrt(2.0))
+
+
+def _normal_inv_cdf(p: float) -> float:
+    # Wichura (1988), "Algorithm AS241: The percentage points of the
+    # normal distribution." Accurate to about 1 part in 10^16 for p in
+    # (0, 1), and computes the same values as
+    # statistics.NormalDist().inv_cdf() on Python 3.8 onwards.
+    q = p - 0.5
+    if math.fabs(q) <= 0.425:
+        r = 0.180625 - q * q
+        num = (((((((2.5090809287301226727e+3 * r +
+                     3.3430575583588128105e+4) * r +
+                     6.7265770927008700853e+4) * r +
+                     4.5921953931549871457e+4) * r +
+                     1.3731693765509461125e+4) * r +
+                     1.9715909503065514427e+3) * r +
+                     1.3314166789178437745e+2) * r +
+                     3.3871328727963666080e+0) * q
+        den = (((((((5.2264952788528545610e+3 * r +
+                     2.8729085735721942674e+4) * r +
+                     3.9307895800092710610e+4) * r +
+                     2.1213794301586595867e+4) * r +
+                     5.3941960214247511077e+3) * r +
+                     6.8718700749205790830e+2) * r +
+                     4.2313330701600911252e+1) * r +
+                     1.0)
+        return num / den
+
+    r = math.sqrt(-math.log(p if q <= 0.0 else 1.0 - p))
+    if r <= 5.0:
+        r -= 1.6
+        num = (((((((7.7454501427834140764e-4 * r +
+                     2.2723844989269184583e-2) * r +
+                     2.4178072517745061177e-1) * r +
+                     1.2704582524523683826e+0) * r +
+                     3.6478483247632045605e+0) * r +
+                     5.7694972214606914055e+0) * r +
+                     4.6303378461565452959e+0) * r +
+                     1.4234371107496835773e+0)
+        den = (((((((1.0507500716444168432e-9 * r +
+                     5.4759380849953449460e-4) * r +
+                     1.5198666563616457197e-2) * r +
+                     1.4810397642748007459e-1) * r +
+                     6.8976733498510000455e-1) * r +
+                     1.6763848301838038494e+0) * r +
+                     2.0531916266377588219e+0) * r +
+                     1.0)
+    else:
+        r -= 5.0
+        num = (((((((2.0103343992922881327e-7 * r +
+                     2.7115555687434875782e-5) * r +
+                     1.2426609473880784386e-3) * r +
+                     2.6532189526576123093e-2) * r +
+                     2.9656057182850489123e-1) * r +
+                     1.7848265399172913358e+0) * r +
+                     5.4637849111641143699e+0) * r +
+                     6.6579046435011037772e+0)
+        den = (((((((2.0442631033899397856e-15 * r +
+                     1.4215117583164458887e-7) * r +
+                     1.8463183175100546818e-5) * r +
+                     7.8686913114561325910e-4) * r +
+                     1.4875361290850614852e-2) * r +
+                     1.3692988092273580531e-1) * r +
+                     5.9983220655588793769e-1) * r +
+                     1.0)
+    x = num / den
+    return -x if q < 0.0 else x
+
+
+def _truncated_normal_setup(mu: float, sigma: float,
+                            lo: float, hi: float) -> Tuple:
+    # Standardizes the interval, reflecting it if necessary so that it
+    # does not lie entirely within the upper tail, where the CDF has
+    # poor relative precision.
+    if not sigma > 0.0:
+        raise ValueError('sigma must be greater than 0.')
+    a = (lo - mu) / sigma
+    b = (hi - mu) / sigma
+    sign = 1.0
+    if a > 0.0:
+        a, b, sign = -b, -a, -1.0
+
+    cdf_a = _normal_cdf(a)
+    mass = _normal_cdf(b) - cdf_a
+    if mass > 0.0:
+        return mu, sigma, sign, a, b, cdf_a, mass
+
+    # The CDF underflows this far into the tail, so use Robert's method
+    # on the reflected interval [-b, -a]
+    return mu, sigma, -sign, -b, -a, None, None
+
+
+def _truncated_normal_sample(rand, mu, sigma, sign, a, b, cdf_a, mass):
+    if cdf_a is not None:
+        p = cdf_a + rand.random() * mass
+        z = _normal_inv_cdf(p) if 0.0 < p < 1.0 else a
+        return mu + sign * min(max(z, a), b) * sigma
+
+    # Robert (1995), "Simulation of truncated normal variables." The
+    # proposal is an exponential distribution shifted to start at `a`
+    # with the optimal rate.
+    rate = (a + math.sqrt(a * a + 4.0)) * 0.5
+    for _ in range(_MAX_ITERATIONS):
+        z = a - math.log(1.0 - rand.random()) / rate
+        u = rand.random()
+        if z <= b and u <= math.exp(-0.5 * (z - rate) ** 2):
+            return mu + sign * z * sigma
+    raise RuntimeError('Could not make a random '
+                       'selection within limit.')
+
+
+def _regularized_gamma(a: float, x: float) -> Tuple[float, float]:
+    # Returns the regularized lower and upper incomplete gamma
+    # functions P(a, x) and Q(a, x), each to full relative precision.
+    # The series converges quickly for x < a + 1, and the continued
+    # fraction otherwise (see Numerical Recipes 6.2).
+    if x <= 0.0:
+        return 0.0, 1.0
+    if math.isinf(x):
+        return 1.0, 0.0
+    log_prefix = a * math.log(x) - x - math.lgamma(a)
+
+    if x < a + 1.0:
+        term = total = 1.0 / a
+        denominator = a
+        for _ in range(_MAX_GAMMA_ITERATIONS):
+            denominator += 1.0
+            term *= x / denominator
+            total += term
+            if abs(term) < abs(total) * _GAMMA_EPSILON:
+                lower = total * math.exp(log_prefix)
+                return lower, 1.0 - lower
+    else:
+        # Modified Lentz's method
+        tiny = 1e-300
+        b = x + 1.0 - a
+        c = 1.0 / tiny
+        d = 1.0 / b
+        h = d
+        for i in range(1, _MAX_GAMMA_ITERATIONS):
+            an = -i * (i - a)
+            b += 2.0
+            d = an * d + b
+            if abs(d) < tiny:
+                d = tiny
+            c = b + an / c
+            if abs(c) < tiny:
+                c = tiny
+            d = 1.0 / d
+            delta = d * c
+            h *= delta
+            if abs(delta - 1.0) < _GAMMA_EPSILON:
+                upper = h * math.exp(log_prefix)
+                return 1.0 - upper, upper
+
+    raise RuntimeError('Incomplete gamma function did not converge.')
+
+
+def _inverse_regularized_gamma(a: float, target: float, use_upper: bool,
+                               lo: float, hi: float) -> float:
+    # Finds x in [lo, hi] such that P(a, x) == target, or
+    # Q(a, x) == target if `use_upper`, using Newton's method
+    # safeguarded by bisection.
+    def error(x):
+        lower, upper = _regularized_gamma(a, x)
+        return target - upper if use_upper else lower - target
+
+    if math.isinf(hi):
+        hi = max(2.0 * lo, a + 10.0 * math.sqrt(a) + 10.0)
+        while error(hi) < 0.0:
+            lo, hi = hi, 2.0 * hi
+
+    x = min(max(a, lo), hi) if lo < a < hi else 0.5 * (lo + hi)
+    log_gamma = math.lgamma(a)
+    for _ in range(_MAX_ITERATIONS):
+        e = error(x)
+        if e == 0.0:
+            return x
+        if e < 0.0:
+            lo = x
+        else:
+            hi = x
+
+        density = math.exp((a - 1.0) * math.log(x) - x - log_gamma) \
+            if x > 0.0 else 0.0
+        next_x = x - e / density if density > 0.0 else lo - 1.0
+        if not lo < next_x < hi:
+            next_x = 0.5 * (lo + hi)
+        if abs(next_x - x) <= _GAMMA_EPSILON * x or next_x in (lo, hi):
+            return next_x
+        x = next_x
+    return x
+
+
 _distribution_lookup = {
     dist.casefold(): globals()[dist]
     for dist in __all__
-    if dist not in ('distribution_from_list', 'distribution_from_dict')
+    if dist not in ('distribution_from_list', 'distribution_from_dict',
+                    'clip', 'register_function')
 }
 
 
@@ -0,0 +1,264 @@
+"""Runs deterministic Monte Carlo simulations across multiple processes."""
+
+import copy
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from .repeatablerandom import RepeatableRandomSequence
+
+__all__ = [
+    'Accumulator',
+    'Mean',
+    'Variance',
+    'Histogram',
+    'trial_sequence',
+    'run'
+]
+
+DEFAULT_BLOCK_SIZE: int = 1024
+"""The default number of trials reduced together by a single task."""
+
+
+class Accumulator(object):
+    """Base class for streaming, mergeable reductions over trial
+    results.
+
+    Args:
+        field (optional): If provided, each trial result is indexed by
+            `field` before being added, allowing several accumulators to
+            reduce different parts of a trial's result.
+    """
+
+    def __init__(self, field=None):
+        self.field = field
+
+    def add(self, value) -> None:
+        """Add a single trial result."""
+        if self.field is not None:
+            value = value[self.field]
+        self._add(value)
+
+    def merge(self, other: 'Accumulator') -> None:
+        """Merge the results of another accumulator of the same type
+        into this one."""
+        raise NotImplementedError
+
+    def _add(self, value) -> None:
+        raise NotImplementedError
+
+    def __eq__(self, other):
+        if isinstance(other, self.__class__):
+            return self.__dict__ == other.__dict__
+        return NotImplemented
+
+    def __repr__(self):
+        return '<{}: {}>'.format(self.__class__.__name__, self.__dict__)
+
+
+class Mean(Accumulator):
+    """Accumulates the mean of trial results.
+
+    Attributes:
+        count (int): The number of results added.
+        mean (float): The mean of all results added.
+    """
+
+    def __init__(self, field=None):
+        super().__init__(field)
+        self.count: int = 0
+        self.mean: float = 0.0
+
+    def _add(self, value) -> None:
+        self.count += 1
+        self.mean += (value - self.mean) / self.count
+
+    def merge(self, other: 'Mean') -> None:
+        if not other.count:
+            return
+        if not self.count:
+            self.count, self.mean = other.count, other.mean
+            return
+        count = self.count + other.count
+        self.mean += (other.mean - self.mean) * other.count / count
+        self.count = count
+
+
+class Variance(Accumulator):
+    """Accumulates the mean and variance of trial results using
+    Welford's algorithm.
+
+    Attributes:
+        count (int): The number of results added.
+        mean (float): The mean of all results added.
+    """
+
+    def __init__(self, field=None):
+        super().__init__(field)
+        self.count: int = 0
+        self.mean: float = 0.0
+        self._m2: float = 0.0
+
+    @property
+    def variance(self) -> float:
+        """The sample variance of all results added, or ``nan`` if
+        fewer than two results were added."""
+        if self.count < 2:
+            return float('nan')
+        return self._m2 / (self.count - 1)
+
+    @property
+    def stdev(self) -> float:
+        """The sample standard deviation of all results added."""
+        return self.variance ** 0.5
+
+    def _add(self, value) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+    def merge(self, other: 'Variance') -> None:
+        if not other.count:
+            return
+        if not self.count:
+            self.count, self.mean, self._m2 = \
+                other.count, other.mean, other._m2
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self._m2 += other._m2 + delta * delta * self.count * other.count / count
+        self.count = count
+
+
+class Histogram(Accumulator):
+    """Accumulates a histogram of trial results over `bins` equal-width
+    bins spanning [`low`, `high`).
+
+    Attributes:
+        counts (List[int]): The number of results within each bin.
+        underflow (int): The number of results less than `low`.
+        overflow (int): The number of results greater than or equal
+            to `high`.
+    """
+
+    def __init__(self, low: float, high: float, bins: int, field=None):
+        super().__init__(field)
+        if bins < 1:
+            raise ValueError('bins must be at least 1.')
+        if not low < high:
+            raise ValueError('low must be less than high.')
+        self.low: float = low
+        self.high: float = high
+        self.counts: List[int] = [0] * bins
+        self.underflow: int = 0
+        self.overflow: int = 0
+
+    def _add(self, value) -> None:
+        if value < self.low:
+            self.underflow += 1
+        elif value >= self.high:
+            self.overflow += 1
+        else:
+            bins = len(self.counts)
+            index = int((value - self.low) / (self.high - self.low) * bins)
+            self.counts[min(index, bins - 1)] += 1
+
+    def merge(self, other: 'Histogram') -> None:
+        if (self.low, self.high, len(self.counts)) != \
+                (other.low, other.high, len(other.counts)):
+            raise ValueError('Histograms must have the same bins.')
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+
+
+def trial_sequence(seed, trial: int) -> RepeatableRandomSequence:
+    """Return the sequence used for trial number `trial` of a
+    simulation with root seed `seed`.
+
+    This is equivalent to ``RepeatableRandomSequence(seed).derive(trial)``,
+    so each trial's sequence depends only on `seed` and `trial`.
+    """
+    return RepeatableRandomSequence(seed).derive(trial)
+
+
+def _run_block(trial: Callable[[RepeatableRandomSequence], Any],
+               root: RepeatableRandomSequence,
+               first: int,
+               count: int,
+               accumulators: Dict[str, Accumulator]) -> Dict[str, Accumulator]:
+    # Reduces trials [first, first + count) in order, so each block's
+    # result is independent of which worker ran it.
+    accumulators = copy.deepcopy(accumulators)
+    for rrs in root.derive_many(range(first, first + count)):
+        result = trial(rrs)
+        for accumulator in accumulators.values():
+            accumulator.add(result)
+    return accumulators
+
+
+def run(trial: Callable[[RepeatableRandomSequence], Any],
+        num_trials: int,
+        accumulators: Dict[str, Accumulator],
+        seed=0,
+        max_workers: Optional[int] = None,
+        block_size: int = DEFAULT_BLOCK_SIZE) -> Dict[str, Accumulator]:
+    """Run `num_trials` trials of a simulation, reducing the results of
+    each trial using the given accumulators.
+
+    Each trial is passed its own sequence, as returned by
+    :func:`trial_sequence`. Trials are grouped into blocks of
+    `block_size` consecutive trials, each block is reduced in trial
+    order, and the blocks are merged in block order. Results are
+    therefore bit-reproducible for a given `seed` and `block_size`,
+    regardless of the number of workers or the order in which
+    blocks complete.
+
+    Args:
+        trial (Callable): A function taking a
+            :class:`~samplespace.repeatablerandom.RepeatableRandomSequence`
+            and returning a result. Must be picklable if `max_workers`
+            is not 1.
+        num_trials (int): The number of trials to run.
+        accumulators (Dict[str, Accumulator]): Empty accumulators, by
+            name, to which each trial's result is added.
+        seed (int, str, bytes, bytearray): The simulation's root seed.
+        max_workers (int, optional): The number of worker processes.
+            Defaults to the number of processors. If 1, trials are run
+            in the calling process.
+        block_size (int): The number of trials in each block.
+
+    Returns:
+        A dict of merged accumulators with the same keys
+        as `accumulators`.
+
+    Raises:
+        ValueError: if `num_trials` is negative or `block_size` is
+            less than 1.
+    """
+    if num_trials < 0:
+        raise ValueError('num_trials must be at least 0.')
+    if block_size < 1:
+        raise ValueError('block_size must be at least 1.')
+
+    root = RepeatableRandomSequence(seed)
+    blocks = [(first, min(block_size, num_trials - first))
+              for first in range(0, num_trials, block_size)]
+
+    if max_workers == 1 or len(blocks) <= 1:
+        block_results = [
+            _run_block(trial, root, first, count, accumulators)
+            for first, count in blocks]
+    else:
+        with ProcessPoolExecutor(max_workers) as executor:
+            futures = [executor.submit(
+                _run_block, trial, root, first, count, accumulators)
+                for first, count in blocks]
+            block_results = [future.result() for future in futures]
+
+    result = copy.deepcopy(accumulators)
+    for block_result in block_results:
+        for name, accumulator in result.items():
+            accumulator.merge(block_result[name])
+    return result
@@ -0,0 +1,478 @@
+"""Implements repeatable coherent noise for procedural generation."""
+
+from itertools import product
+from math import floor, sqrt
+from struct import pack
+from typing import Sequence, List, Optional, Iterable, Iterator, Callable, \
+    Any
+
+from .repeatablerandom import RepeatableRandomSequence, _block_function
+
+__all__ = [
+    'Noise',
+    'ValueNoise',
+    'PerlinNoise',
+    'SimplexNoise',
+    'Fractal'
+]
+
+_MASK = 0xFFFFFFFFFFFFFFFF
+_CONV_16BIT_TO_FLOAT = 3.0517578125e-05  # 2^-15
+_CONV_53BIT_TO_FLOAT = 1.1102230246251565e-16  # 2^-53
+
+# Scale factors bringing each noise type approximately into [-1, 1]
+_PERLIN_SCALE = {1: 2.0, 2: 1.4, 3: 1.2, 4: 1.2}
+_SIMPLEX_SCALE = {1: 70.0, 2: 70.0, 3: 64.0, 4: 60.0}
+
+
+def _fade(t: float) -> float:
+    # Quintic smoothstep, 6t^5 - 15t^4 + 10t^3
+    return t * t * t * (t * (t * 6.0 - 15.0) + 10.0)
+
+
+def _gradient(block: int, dimensions: int) -> tuple:
+    # Each gradient component is taken from 16 bits of the lattice
+    # point's block, giving a value in [-1, 1).
+    return tuple(((block >> (48 - 16 * k)) & 0xFFFF) * _CONV_16BIT_TO_FLOAT - 1.0
+                 for k in range(dimensions))
+
+
+class Noise(object):
+    """Base class for coherent noise functions of 1 to 4 dimensions.
+
+    Noise values depend only on the sequence's seed and the
+    coordinates. The pseudo-random value associated with each integer
+    lattice point is ``rrs.block_at(*point)``, so noise is stateless,
+    cross-platform, and independent of evaluation order. Use
+    :meth:`~samplespace.repeatablerandom.RepeatableRandomSequence.derive`
+    to obtain independent noise functions from a single seed.
+
+    Args:
+        rrs (RepeatableRandomSequence): The sequence whose seed
+            defines the noise. Its index is neither read nor advanced.
+        dimensions (int): The number of coordinates, from 1 to 4.
+
+    Raises:
+        ValueError: if `dimensions` is not between 1 and 4.
+    """
+
+    def __init__(self, rrs: RepeatableRandomSequence, dimensions: int = 2):
+        if not 1 <= dimensions <= 4:
+            raise ValueError('Dimensions must be between 1 and 4.')
+        self._dimensions: int = dimensions
+        # noinspection PyProtectedMember
+        self._seed: int = int.from_bytes(rrs._hash_input, 'big')
+        self._backend: str = rrs.backend
+
+    @property
+    def dimensions(self) -> int:
+        """Read-only property for the number of coordinates."""
+        return self._dimensions
+
+    def at(self, *coords: float) -> float:
+        """Evaluate the noise function at a single point.
+
+        Tip:
+            Prefer :meth:`evaluate` or :meth:`grid` when evaluating many
+            nearby points, since lattice values are shared between
+            points within a single call.
+        """
+        return self.evaluate([coords])[0]
+
+    def evaluate(self, points: Iterable[Sequence[float]]) -> List[float]:
+        """Evaluate the noise function at each of the given points.
+
+        Raises:
+            ValueError: if any point has the wrong number of coordinates.
+        """
+        lattice = self._make_lattice()
+        evaluate_point = self._evaluate_point
+        dimensions = self._dimensions
+        result = []
+        for point in points:
+            if len(point) != dimensions:
+                raise ValueError('Points must have {} coordinates.'.format(
+                    dimensions))
+            result.append(evaluate_point(point, lattice))
+        return result
+
+    def grid(self,
+             shape: Sequence[int],
+             origin: Optional[Sequence[float]] = None,
+             step: float = 1.0) -> List:
+        """Evaluate the noise function over a regular grid of points.
+
+        The result is a nested list such that
+        ``result[i][j] == at(origin[0] + i * step, origin[1] + j * step)``,
+        and similarly for other numbers of dimensions.
+
+        Tip:
+            Grids are evaluated one row at a time using :meth:`rows`.
+            Use :meth:`rows` directly to process very large grids
+            without holding every value in memory. Evaluation remains
+            pure Python: in 2-D on a typical desktop CPU, value and
+            Perlin noise take roughly 2 us per point and simplex noise
+            roughly 14 us, so a 4096 x 4096 height map takes around 40
+            seconds using value or Perlin noise and around 4 minutes
+            using simplex noise, multiplied by the number of octaves
+            for :class:`Fractal` noise.
+
+        Raises:
+            ValueError: if `shape` or `origin` do not have
+                :attr:`dimensions` elements.
+        """
+        values = list(self.rows(shape, origin, step))
+        if len(shape) == 1:
+            return values[0]
+
+        # Group the rows by each middle axis in turn, innermost first.
+        # The number of groups is counted from the shape rather than
+        # the rows, so that axes of size 0 still produce nested lists.
+        counts = [1]
+        for size in shape[:-2]:
+            counts.append(counts[-1] * size)
+        for size, count in zip(reversed(shape[1:-1]), reversed(counts[1:])):
+            values = [values[i * size:(i + 1) * size] for i in range(count)]
+        return values
+
+    def rows(self,
+             shape: Sequence[int],
+             origin: Optional[Sequence[float]] = None,
+             step: float = 1.0) -> Iterator[List[float]]:
+        """Lazily evaluate the noise function over a regular grid of
+        points, one row at a time.
+
+        Yields a list of ``shape[-1]`` values along the last axis for
+        each combination of the other coordinates, with the first axis
+        varying slowest. The rows are those of :meth:`grid` with the
+        same arguments, in order. Only lattice values near the current
+        row are retained between rows.
+
+        Raises:
+            ValueError: if `shape` or `origin` do not have
+                :attr:`dimensions` elements.
+        """
+        if len(shape) != self._dimensions:
+            raise ValueError('Shape must have {} dimensions.'.format(
+                self._dimensions))
+        if origin is None:
+            origin = [0.0] * self._dimensions
+        elif len(origin) != self._dimensions:
+            raise ValueError('Origin must have {} dimensions.'.format(
+                self._dimensions))
+
+        axes = [[start + i * step for i in range(size)]
+                for start, size in zip(origin, shape)]
+        return self._rows(axes)
+
+    def _rows(self, axes: List[List[float]]) -> Iterator[List[float]]:
+        # Yields each row of the grid with the given coordinates along
+        # each axis. Per-axis terms are computed once, and the lattice
+        # cache is replaced whenever the lattice cell along the first
+        # axis changes, bounding its size.
+        terms = [self._axis_terms(axis) for axis in axes]
+        last = terms[-1]
+        band = None
+        lattice = None
+        for index in product(*(range(len(axis)) for axis in axes[:-1])):
+            if lattice is None or floor(axes[0][index[0]]) != band:
+                band = floor(axes[0][index[0]]) if index else None
+                lattice = self._make_lattice()
+            outer = [terms[k][i] for k, i in enumerate(index)]
+            yield self._evaluate_row(outer, last, lattice)
+
+    def _axis_terms(self, axis: List[float]) -> List:
+        # Converts the coordinates along one axis of a grid to the
+        # terms passed to _evaluate_row().
+        return axis
+
+    def _evaluate_row(self, outer: List, last: List,
+                      lattice: Callable[[tuple], Any]) -> List[float]:
+        # Evaluates one row of a grid, given the terms for the fixed
+        # coordinates along each outer axis, and for each coordinate
+        # along the last axis.
+        evaluate_point = self._evaluate_point
+        prefix = tuple(outer)
+        return [evaluate_point(prefix + (x,), lattice) for x in last]
+
+    def _make_lattice(self) -> Callable[[tuple], Any]:
+        # Returns a function mapping lattice points to their values,
+        # caching results so that neighbouring points share hash
+        # evaluations.
+        cache = {}
+        seed = self._seed
+        fmt = '>{}Q'.format(self._dimensions)
+        digest = _block_function(self._backend)
+        convert = self._lattice_value
+
+        def lattice(cell: tuple):
+            value = cache.get(cell)
+            if value is None:
+                value = convert(
+                    digest(pack(fmt, *(x & _MASK for x in cell)), seed))
+                cache[cell] = value
+            return value
+
+        return lattice
+
+    def _lattice_value(self, block: int):
+        # Converts a lattice point's block to the value used
+        # during evaluation.
+        return _gradient(block, self._dimensions)
+
+    def _evaluate_point(self, point: Sequence[float],
+                        lattice: Callable[[tuple], Any]) -> float:
+        raise NotImplementedError
+
+    def __eq__(self, other):
+        if isinstance(other, self.__class__):
+            return self.__dict__ == other.__dict__
+        return NotImplemented
+
+
+class ValueNoise(Noise):
+    """Value noise, which smoothly interpolates between random values
+    in [-1, 1) at each integer lattice point."""
+
+    def _lattice_value(self, block: int) -> float:
+        return (block >> 11) * _CONV_53BIT_TO_FLOAT * 2.0 - 1.0
+
+    def _evaluate_point(self, point, lattice) -> float:
+        cell = [floor(x) for x in point]
+        frac = [x - c for x, c in zip(point, cell)]
+
+        # Values at each corner of the cell, with the first axis
+        # varying slowest
+        cells = [()]
+        for c in cell:
+            cells = [prefix + (c + offset,) for prefix in cells
+                     for offset in (0, 1)]
+        return _interpolate([lattice(corner) for corner in cells], frac)
+
+    def _axis_terms(self, axis):
+        return _cell_terms(axis)
+
+    def _evaluate_row(self, outer, last, lattice) -> List[float]:
+        # Performs the same operations as _evaluate_point() for each
+        # point, with lattice values looked up once per row.
+        if not last:
+            return []
+        first = min(c for c, _, _ in last)
+        cells = range(first, max(c for c, _, _ in last) + 2)
+        columns = [[lattice(prefix + (c,)) for c in cells]
+                   for prefix, _ in _outer_corners(outer)]
+        weights = [w for _, _, w in reversed(outer)]
+
+        result = []
+        for c, _, w in last:
+            k = c - first
+            values = [column[k] + (column[k + 1] - column[k]) * w
+                      for column in columns]
+            for weight in weights:
+                values = [a + (b - a) * weight
+                          for a, b in zip(values[0::2], values[1::2])]
+            result.append(values[0])
+        return result
+
+
+class PerlinNoise(Noise):
+    """Perlin gradient noise, which interpolates between random
+    gradients at each integer lattice point. Values are approximately
+    within [-1, 1], and are 0 at each lattice point."""
+
+    def _evaluate_point(self, point, lattice) -> float:
+        cell = [floor(x) for x in point]
+        frac = [x - c for x, c in zip(point, cell)]
+
+        corners = [((), ())]
+        for c, f in zip(cell, frac):
+            corners = [(prefix + (c + offset,), rel + (f - offset,))
+                       for prefix, rel in corners for offset in (0, 1)]
+        values = [sum(g * r for g, r in zip(lattice(corner), rel))
+                  for corner, rel in corners]
+        return _interpolate(values, frac) * _PERLIN_SCALE[self._dimensions]
+
+    def _axis_terms(self, axis):
+        return _cell_terms(axis)
+
+    def _evaluate_row(self, outer, last, lattice) -> List[float]:
+        # Performs the same operations as _evaluate_point() for each
+        # point, with gradients looked up, and their dot products with
+        # the outer axes' offsets computed, once per row.
+        if not last:
+            return []
+        first = min(c for c, _, _ in last)
+        cells = range(first, max(c for c, _, _ in last) + 2)
+        columns = []
+        for prefix, rel in _outer_corners(outer):
+            gradients = [lattice(prefix + (c,)) for c in cells]
+            columns.append((
+                [sum(g * r for g, r in zip(gradient, rel))
+                 for gradient in gradients],
+                [gradient[-1] for gradient in gradients]))
+        weights = [w for _, _, w in reversed(outer)]
+        scale = _PERLIN_SCALE[self._dimensions]
+
+        result = []
+        for c, f, w in last:
+            k = c - first
+            f1 = f - 1
+            values = []
+            for partial, gradient in columns:
+                a = partial[k] + gradient[k] * f
+                b = partial[k + 1] + gradient[k + 1] * f1
+                values.append(a + (b - a) * w)
+            for weight in weights:
+                values = [a + (b - a) * weight
+                          for a, b in zip(values[0::2], values[1::2])]
+            result.append(values[0] * scale)
+        return result
+
+
+class SimplexNoise(Noise):
+    """Simplex gradient noise, which sums contributions from random
+    gradients at the corners of the simplex containing each point.
+    Values are approximately within [-1, 1].
+
+    Simplex noise has fewer directional artifacts than Perlin noise,
+    and requires only `dimensions` + 1 lattice points per evaluation
+    rather than 2 ^ `dimensions`."""
+
+    def __init__(self, rrs: RepeatableRandomSequence, dimensions: int = 2):
+        super().__init__(rrs, dimensions)
+        self._skew: float = (sqrt(dimensions + 1.0) - 1.0) / dimensions
+        self._unskew: float = (1.0 - 1.0 / sqrt(dimensions + 1.0)) / dimensions
+
+    def _evaluate_point(self, point, lattice) -> float:
+        dimensions = self._dimensions
+        unskew = self._unskew
+
+        # Find the skewed cell containing the point
+        s = sum(point) * self._skew
+        cell = [floor(x + s) for x in point]
+        t = sum(cell) * unskew
+        rel = [x - c + t for x, c in zip(point, cell)]
+
+        # Traverse the simplex's corners along axes in order of
+        # decreasing relative position
+        order = sorted(range(dimensions), key=lambda k: -rel[k])
+        corner = list(cell)
+        offset = [0] * dimensions
+        result = 0.0
+        for j in range(dimensions + 1):
+            if j:
+                axis = order[j - 1]
+                corner[axis] += 1
+                offset[axis] = 1
+            d = [r - o + j * unskew for r, o in zip(rel, offset)]
+            falloff = 0.5 - sum(x * x for x in d)
+            if falloff > 0.0:
+                grad = lattice(tuple(corner))
+                falloff *= falloff
+                result += falloff * falloff * sum(g * x for g, x in zip(grad, d))
+        return result * _SIMPLEX_SCALE[dimensions]
+
+
+class Fractal(Noise):
+    """Fractal Brownian motion (fBm), which sums several octaves of
+    another noise type at increasing frequencies and decreasing
+    amplitudes.
+
+    Octave `i` is sampled at frequency ``lacunarity ** i`` with
+    amplitude ``gain ** i`` from ``noise_type(rrs.derive('octave', i))``,
+    and the sum is normalized by the total amplitude.
+
+    Args:
+        noise_type (type): The :class:`Noise` subclass for each octave.
+        rrs (RepeatableRandomSequence): The sequence whose seed
+            defines the noise.
+        dimensions (int): The number of coordinates, from 1 to 4.
+        octaves (int): The number of octaves to sum.
+        lacunarity (float): The frequency multiplier between octaves.
+        gain (float): The amplitude multiplier between octaves.
+
+    Raises:
+        ValueError: if `octaves` is not at least 1.
+    """
+
+    def __init__(self,
+                 noise_type: type,
+                 rrs: RepeatableRandomSequence,
+                 dimensions: int = 2,
+                 octaves: int = 4,
+                 lacunarity: float = 2.0,
+                 gain: float = 0.5):
+        super().__init__(rrs, dimensions)
+        if octaves < 1:
+            raise ValueError('Octaves must be at least 1.')
+        self._octaves: List[Noise] = [
+            noise_type(rrs.derive('octave', i), dimensions)
+            for i in range(octaves)]
+        self._lacunarity: float = lacunarity
+        self._gain: float = gain
+
+    def evaluate(self, points: Iterable[Sequence[float]]) -> List[float]:
+        points = list(points)
+        result = [0.0] * len(points)
+        frequency = 1.0
+        amplitude = 1.0
+        total = 0.0
+        for octave in self._octaves:
+            scaled = [[x * frequency for x in point] for point in points]
+            values = octave.evaluate(scaled)
+            result = [r + v * amplitude for r, v in zip(result, values)]
+            total += amplitude
+            frequency *= self._lacunarity
+            amplitude *= self._gain
+        return [r / total for r in result]
+
+    def _rows(self, axes: List[List[float]]) -> Iterator[List[float]]:
+        # Combines each octave's rows, performing the same operations
+        # as evaluate() for each point.
+        octave_rows = []
+        frequency = 1.0
+        for octave in self._octaves:
+            octave_rows.append(octave._rows(
+                [[x * frequency for x in axis] for axis in axes]))
+            frequency *= self._lacunarity
+
+        for rows in zip(*octave_rows):
+            result = [0.0] * len(axes[-1])
+            amplitude = 1.0
+            total = 0.0
+            for values in rows:
+                result = [r + v * amplitude for r, v in zip(result, values)]
+                total += amplitude
+                amplitude *= self._gain
+            yield [r / total for r in result]
+
+
+def _cell_terms(axis: List[float]) -> List[tuple]:
+    # Returns the lattice cell, offset within the cell, and faded
+    # interpolation weight for each coordinate along a grid axis.
+    terms = []
+    for x in axis:
+        c = floor(x)
+        f = x - c
+        terms.append((c, f, _fade(f)))
+    return terms
+
+
+def _outer_corners(outer: List[tuple]) -> List[tuple]:
+    # Returns the lattice cells and offsets of the corners of a row's
+    # cells along its outer axes, in the same order as the corners
+    # enumerated by _evaluate_point().
+    corners = [((), ())]
+    for c, f, _ in outer:
+        corners = [(prefix + (c + offset,), rel + (f - offset,))
+                   for prefix, rel in corners for offset in (0, 1)]
+    return corners
+
+
+def _interpolate(values: List[float], frac: Sequence[float]) -> float:
+    # Multilinear interpolation between the corners of a cell, using
+    # faded weights, with the first axis varying slowest in `values`.
+    for f in reversed(frac):
+        w = _fade(f)
+        values = [a + (b - a) * w for a, b in zip(values[0::2], values[1::2])]
+    return values[0]
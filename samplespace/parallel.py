@@ -0,0 +1,402 @@
+"""Generates large buffers of random values using multiple processes
+or threads."""
+
+import sys
+import time
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Optional, List, Sequence, Union, Any
+
+# Shared memory, and hence the process backend, requires Python 3.8
+try:
+    from multiprocessing import shared_memory
+except ImportError:
+    shared_memory = None
+
+from .repeatablerandom import RepeatableRandomSequence, \
+    CONV_53BIT_TO_FLOAT, _counter_key, _counter_blocks
+
+__all__ = [
+    'ThroughputReport',
+    'ParallelGenerator'
+]
+
+DEFAULT_CHUNK_SIZE: int = 1 << 20
+"""The default number of items generated by each task."""
+
+_BACKENDS = ('process', 'thread')
+
+_TYPECODES = {
+    'floats': 'd',
+    'ints': 'Q',
+    'bytes': 'B'
+}
+
+
+@dataclass
+class ThroughputReport:
+    """Timing information for a single call to one of
+    :class:`ParallelGenerator`'s fill methods."""
+    kind: str
+    count: int
+    num_bytes: int
+    workers: int
+    chunk_size: int
+    num_chunks: int
+    seconds: float
+
+    @property
+    def items_per_second(self) -> float:
+        """The number of items generated per second."""
+        return self.count / self.seconds if self.seconds else float('inf')
+
+    @property
+    def bytes_per_second(self) -> float:
+        """The number of output bytes generated per second."""
+        return self.num_bytes / self.seconds if self.seconds else float('inf')
+
+    def __str__(self):
+        return '{} {}: {:.3f} s, {:.1f} MB/s ' \
+               '({} workers, {} chunks of {})'.format(
+                   self.count, self.kind, self.seconds,
+                   self.bytes_per_second / 1e6,
+                   self.workers, self.num_chunks, self.chunk_size)
+
+
+def _generate_chunk(kind: str, key: bytes, first: int, count: int,
+                    block_backend: str):
+    # Generates `count` items starting at item `first`, returned as an
+    # array of the kind's typecode. `block_backend` is the sequence's
+    # block backend, not the pool backend.
+    if kind == 'bytes':
+        first_block = first // 8
+        num_blocks = (first + count + 7) // 8 - first_block
+        blocks = array('Q', _counter_blocks(
+            key, first_block, num_blocks, block_backend))
+        if sys.byteorder != 'little':
+            blocks.byteswap()
+        offset = first - first_block * 8
+        return array('B', blocks.tobytes()[offset:offset + count])
+
+    blocks = _counter_blocks(key, first, count, block_backend)
+    if kind == 'floats':
+        return array('d', [(block >> 11) * CONV_53BIT_TO_FLOAT
+                           for block in blocks])
+    return array('Q', blocks)
+
+
+def _fill_view(view: memoryview, kind: str, key: bytes,
+               first: int, count: int, block_backend: str):
+    # Writes a chunk into its slice of the output buffer. Chunks never
+    # overlap, so no locking is required.
+    view[first:first + count] = _generate_chunk(
+        kind, key, first, count, block_backend)
+
+
+def _fill_shared(name: str, offset: int, kind: str, key: bytes, first: int,
+                 count: int, block_backend: str):
+    # Process worker entry point. Writes a chunk directly into its
+    # slot in shared memory, starting at item `offset`.
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        with shm.buf.cast(_TYPECODES[kind]) as view:
+            view[offset:offset + count] = _generate_chunk(
+                kind, key, first, count, block_backend)
+    finally:
+        shm.close()
+
+
+def _output_view(out, typecode: str, count: int) -> memoryview:
+    # Returns a writable view of `out` with items of the given
+    # typecode, reinterpreting byte buffers if necessary.
+    view = memoryview(out)
+    if view.readonly:
+        view.release()
+        raise ValueError('Output buffer must be writable.')
+    if view.format != typecode:
+        view = view.cast('B').cast(typecode)
+    if len(view) != count:
+        view.release()
+        raise ValueError('Output buffer must hold exactly {} items.'.format(
+            count))
+    return view
+
+
+class ParallelGenerator(object):
+    """Fills large buffers with random values from a
+    :class:`~samplespace.repeatablerandom.RepeatableRandomSequence`
+    using a pool of worker processes or threads.
+
+    Each fill is a single counter-mode draw (see
+    :ref:`counter-mode-label`), so the sequence advances exactly once
+    and the output is identical regardless of the number of workers or
+    the chunk size. Item `i` of a fill is derived from counter-mode
+    block `i`:
+
+    * :meth:`fill_floats` converts each block to a float in
+      [0.0, 1.0), exactly as
+      :meth:`~samplespace.repeatablerandom.RepeatableRandomSequence.random`
+      does.
+    * :meth:`fill_ints` returns each block as an unsigned 64-bit int.
+    * :meth:`fill_bytes` returns the same bytes as
+      ``rrs.randbytes(num_bytes, mode='counter')``.
+
+    Each fill method returns an :class:`array.array`, or writes into
+    the caller's buffer `out` if one is given. `out` may be any
+    writable, contiguous buffer holding exactly the requested number
+    of items, such as an :class:`array.array`, a :class:`bytearray`,
+    or a :class:`memoryview` of shared memory or a memory-mapped file;
+    byte buffers are reinterpreted as items of the appropriate type.
+    No other buffer of the output's size is allocated.
+
+    With the ``'process'`` backend, workers write their chunks into
+    a small :class:`multiprocessing.shared_memory.SharedMemory` block
+    holding two chunks per worker, and each chunk is copied into the
+    result as soon as it is complete. Peak memory use is therefore
+    the result plus ``2 * max_workers`` chunks.
+
+    With the ``'thread'`` backend, workers write their chunks directly
+    into disjoint slices of the result. Threads avoid the cost of
+    starting processes and copying results, but only scale on
+    free-threaded builds of CPython, since hashing each block holds
+    the GIL for a short time.
+
+    The generator owns its worker pool, and should be closed when no
+    longer needed, either by calling :meth:`close` or by using it as a
+    context manager.
+
+    Args:
+        max_workers (int, optional): The number of workers.
+            Defaults to the number of processors. If 1, values are
+            generated in the calling thread.
+        chunk_size (int): The number of items generated by each task.
+            See :meth:`tune_chunk_size`.
+        backend (str): Either ``'process'`` or ``'thread'``. The
+            ``'process'`` backend requires Python 3.8 or later.
+
+    Raises:
+        ValueError: if `chunk_size` is less than 1 or `backend` is
+            not recognized.
+        RuntimeError: if `backend` is ``'process'``, `max_workers` is
+            not 1, and :mod:`multiprocessing.shared_memory` is not
+            available.
+
+    Attributes:
+        last_report (ThroughputReport, optional): Timing information
+            for the most recent fill.
+    """
+
+    def __init__(self,
+                 max_workers: Optional[int] = None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 backend: str = 'process'):
+        if chunk_size < 1:
+            raise ValueError('Chunk size must be at least 1.')
+        if backend not in _BACKENDS:
+            raise ValueError('Backend must be one of {}.'.format(
+                ', '.join(_BACKENDS)))
+        self._executor: Optional[Union[ProcessPoolExecutor,
+                                       ThreadPoolExecutor]] = None
+        if max_workers != 1:
+            if backend == 'process' and shared_memory is None:
+                raise RuntimeError(
+                    "The 'process' backend requires Python 3.8 or later; "
+                    "use backend='thread' instead.")
+            if backend == 'process':
+                self._executor = ProcessPoolExecutor(max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers)
+            # noinspection PyProtectedMember
+            max_workers = self._executor._max_workers
+        self.backend: str = backend
+        self.max_workers: int = max_workers
+        self.chunk_size: int = chunk_size
+        self.last_report: Optional[ThroughputReport] = None
+
+    def fill_floats(self, rrs: RepeatableRandomSequence,
+                    count: int, out: Any = None) -> Any:
+        """Generate `count` random floats in [0.0, 1.0).
+
+        Args:
+            rrs (RepeatableRandomSequence): The sequence to draw from.
+            count (int): The number of floats.
+            out (optional): A writable buffer of `count` doubles to
+                fill, instead of allocating a new array.
+
+        Returns:
+            `out` if given, otherwise an :class:`array.array` with
+            typecode ``'d'``.
+        """
+        return self._fill(rrs, 'floats', count, out)
+
+    def fill_ints(self, rrs: RepeatableRandomSequence,
+                  count: int, out: Any = None) -> Any:
+        """Generate `count` random unsigned 64-bit ints.
+
+        Args:
+            rrs (RepeatableRandomSequence): The sequence to draw from.
+            count (int): The number of ints.
+            out (optional): A writable buffer of `count` unsigned
+                64-bit ints to fill, instead of allocating a new array.
+
+        Returns:
+            `out` if given, otherwise an :class:`array.array` with
+            typecode ``'Q'``.
+        """
+        return self._fill(rrs, 'ints', count, out)
+
+    def fill_bytes(self, rrs: RepeatableRandomSequence,
+                   num_bytes: int, out: Any = None) -> Any:
+        """Generate `num_bytes` random bytes.
+
+        Args:
+            rrs (RepeatableRandomSequence): The sequence to draw from.
+            num_bytes (int): The number of bytes.
+            out (optional): A writable buffer of `num_bytes` bytes to
+                fill, instead of allocating a new array.
+
+        Returns:
+            `out` if given, otherwise an :class:`array.array` with
+            typecode ``'B'``. Use ``bytes(result)`` if an immutable
+            copy is required.
+        """
+        return self._fill(rrs, 'bytes', num_bytes, out)
+
+    def tune_chunk_size(self,
+                        kind: str = 'floats',
+                        count: int = 1 << 24,
+                        candidates: Sequence[int] = (
+                                1 << 16, 1 << 18, 1 << 20, 1 << 22)) \
+            -> List[ThroughputReport]:
+        """Time a fill of `count` items with each candidate chunk size,
+        and keep whichever was fastest as :attr:`chunk_size`.
+
+        Args:
+            kind (str): One of ``'floats'``, ``'ints'``, or ``'bytes'``.
+            count (int): The number of items to generate for each trial.
+            candidates (Sequence[int]): The chunk sizes to try.
+
+        Returns:
+            A :class:`ThroughputReport` for each candidate.
+        """
+        rrs = RepeatableRandomSequence()
+        reports = []
+        for chunk_size in candidates:
+            self.chunk_size = chunk_size
+            self._fill(rrs, kind, count)
+            reports.append(self.last_report)
+        self.chunk_size = max(reports, key=lambda x: x.items_per_second).chunk_size
+        return reports
+
+    def close(self) -> None:
+        """Shut down the workers."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _chunks(self, kind: str, count: int) -> List[range]:
+        chunk_size = self.chunk_size
+        if kind == 'bytes':
+            # Keep chunks block-aligned so no block is generated twice
+            chunk_size = (chunk_size + 7) // 8 * 8
+        return [range(first, min(first + chunk_size, count))
+                for first in range(0, count, chunk_size)]
+
+    # noinspection PyProtectedMember
+    def _fill(self, rrs: RepeatableRandomSequence, kind: str,
+              count: int, out: Any = None) -> Any:
+        if kind not in _TYPECODES:
+            raise ValueError('Kind must be one of {}.'.format(
+                ', '.join(_TYPECODES)))
+        if count < 0:
+            raise ValueError('Count must be at least 0.')
+
+        typecode = _TYPECODES[kind]
+        if out is None:
+            # Repeating a single item avoids building a temporary
+            # buffer of the result's size
+            out = array(typecode, [0]) * count
+        view = _output_view(out, typecode, count)
+
+        start_time = time.perf_counter()
+        key = _counter_key(rrs._hash_input, rrs._index)
+        block_backend = rrs.backend
+        rrs.getnextblock()
+
+        chunks = self._chunks(kind, count)
+        try:
+            if self._executor is None or len(chunks) <= 1:
+                for chunk in chunks:
+                    _fill_view(view, kind, key, chunk.start, len(chunk),
+                               block_backend)
+            elif self.backend == 'thread':
+                self._fill_threads(view, kind, key, chunks, block_backend)
+            else:
+                self._fill_processes(view, kind, key, chunks, block_backend)
+        finally:
+            view.release()
+
+        self.last_report = ThroughputReport(
+            kind=kind,
+            count=count,
+            num_bytes=count * array(typecode).itemsize,
+            workers=self.max_workers if len(chunks) > 1 else 1,
+            chunk_size=self.chunk_size,
+            num_chunks=len(chunks),
+            seconds=time.perf_counter() - start_time)
+        return out
+
+    def _fill_threads(self, view: memoryview, kind: str, key: bytes,
+                      chunks: List[range], block_backend: str) -> None:
+        futures = [self._executor.submit(
+            _fill_view, view, kind, key, chunk.start, len(chunk),
+            block_backend)
+            for chunk in chunks]
+        wait(futures)
+        for future in futures:
+            future.result()
+
+    def _fill_processes(self, view: memoryview, kind: str, key: bytes,
+                        chunks: List[range], block_backend: str) -> None:
+        # Workers fill a ring of chunk-sized slots in shared memory.
+        # Chunks are copied out in order, and each freed slot is reused
+        # for the next chunk, so shared memory stays small regardless
+        # of the size of the output.
+        slot_size = len(chunks[0])
+        num_slots = min(len(chunks), 2 * self.max_workers)
+        shm = shared_memory.SharedMemory(
+            create=True, size=num_slots * slot_size * view.itemsize)
+        pending = deque()
+
+        def submit(index: int, slot: int):
+            chunk = chunks[index]
+            pending.append((chunk, slot, self._executor.submit(
+                _fill_shared, shm.name, slot * slot_size, kind, key,
+                chunk.start, len(chunk), block_backend)))
+
+        try:
+            for index in range(num_slots):
+                submit(index, index)
+            next_index = num_slots
+            with shm.buf.cast(_TYPECODES[kind]) as slots:
+                while pending:
+                    chunk, slot, future = pending.popleft()
+                    future.result()
+                    offset = slot * slot_size
+                    with slots[offset:offset + len(chunk)] as source:
+                        view[chunk.start:chunk.stop] = source
+                    if next_index < len(chunks):
+                        submit(next_index, slot)
+                        next_index += 1
+        finally:
+            wait([future for _, _, future in pending])
+            shm.close()
+            shm.unlink()
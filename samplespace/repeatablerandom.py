@@ -4,24 +4,41 @@ random sequences."""
 from base64 import standard_b64encode, standard_b64decode
 from contextlib import contextmanager
 from dataclasses import dataclass
-from functools import wraps
+from functools import wraps, lru_cache
 from itertools import accumulate
+from struct import pack
 from math import ceil, log, sqrt, exp, cos, sin, acos, pi as PI, e as E
-from typing import Optional, Sequence, Tuple, Any
+from typing import Optional, Sequence, Tuple, Any, List, Iterable, \
+    Callable
 
 import xxhash
 
-from .algorithms import sample_discrete_roulette
+from .algorithms import sample_discrete_roulette, _binomial_sampler, \
+    _poisson_sampler
 
 __all__ = [
     'RepeatableRandomSequence',
-    'RepeatableRandomSequenceState'
+    'RepeatableRandomSequenceState',
+    'RangeSampler'
 ]
 
 TWO_PI = 6.283185307179586  # 2 * pi
 LOG_4 = 1.3862943611198906  # log(4)
 GAMMA_MAGIC = 2.504077396776274  # 1.0 + log(4.5)
 CONV_53BIT_TO_FLOAT = 1.1102230246251565e-16  # 2^-53
+DERIVE_CACHE_SIZE = 4096
+
+_MODES = ('cascade', 'counter')
+
+# Block functions by backend name. See "Block backends" in the
+# documentation for their definitions.
+_BLOCK_FUNCTIONS = {
+    'xxh64': xxhash.xxh64_intdigest
+}
+
+# XXH3 is available from xxhash 2.0 onwards
+if hasattr(xxhash, 'xxh3_64_intdigest'):
+    _BLOCK_FUNCTIONS['xxh3_64'] = xxhash.xxh3_64_intdigest
 
 
 def _no_cascade(method):
@@ -34,6 +51,89 @@ def _no_cascade(method):
     return _impl
 
 
+def _check_mode(mode: str) -> None:
+    if mode not in _MODES:
+        raise ValueError('Mode must be one of {}.'.format(', '.join(_MODES)))
+
+
+def _block_function(backend: str) -> Callable[[bytes, int], int]:
+    try:
+        return _BLOCK_FUNCTIONS[backend]
+    except KeyError:
+        raise ValueError('Backend must be one of {}.'.format(
+            ', '.join(_BLOCK_FUNCTIONS))) from None
+
+
+def _counter_key(hash_input: bytes, index: int) -> bytes:
+    # The hash input for counter-mode blocks is the sequence's hash
+    # input followed by the draw's start index as a big-endian uint64.
+    return hash_input + (index & 0xFFFFFFFFFFFFFFFF).to_bytes(8, 'big')
+
+
+def _counter_blocks(key: bytes, first: int, count: int,
+                    backend: str = 'xxh64') -> List[int]:
+    # Counter-mode blocks depend only on the key and their offset, so
+    # any sub-range may be generated independently of the others.
+    block = _block_function(backend)
+    return [block(key, offset) for offset in range(first, first + count)]
+
+
+def _rejection_params(limit: int) -> Tuple[int, int]:
+    # Returns the number of blocks drawn by each attempt of
+    # _randbelow(limit), and the threshold below which an attempt's
+    # result is accepted. Both depend only on the limit.
+    num_blocks = ((limit - 1).bit_length() + 63) // 64
+    mask = (1 << (num_blocks * 64)) - 1
+    if mask % limit == limit - 1:
+        return num_blocks, mask + 1
+    return num_blocks, mask // limit * limit
+
+
+def _binary_digits(p: float) -> List[int]:
+    # Returns the binary digits d1, d2, ..., dm of the float p in
+    # (0, 1), such that p = 0.d1 d2 ... dm exactly and dm = 1.
+    numerator, denominator = p.as_integer_ratio()
+    num_digits = denominator.bit_length() - 1
+    return [(numerator >> (num_digits - t)) & 1
+            for t in range(1, num_digits + 1)]
+
+
+@lru_cache()
+def _field_width(limit: int) -> int:
+    # Returns the field width used by small_ints(limit, n), which
+    # maximizes the expected number of accepted fields per block,
+    # preferring narrower fields in the case of ties.
+    def score(width: int) -> int:
+        size = 1 << width
+        return (64 // width) * (size - size % limit) << (64 - width)
+
+    min_width = (limit - 1).bit_length()
+    return max(range(min_width, 65), key=lambda width: (score(width), -width))
+
+
+def _derive_hash_input(hash_input: bytes, key) -> bytes:
+    if isinstance(key, bytearray):
+        key = bytes(key)
+    return _derive_hash_input_cached(hash_input, key)
+
+
+# N.B. typed=True keeps e.g. 1 and 1.0 from sharing a cache entry.
+@lru_cache(maxsize=DERIVE_CACHE_SIZE, typed=True)
+def _derive_hash_input_cached(hash_input: bytes, key) -> bytes:
+    # Keys are tagged by type so that e.g. 1, '1', and b'1' produce
+    # distinct children.
+    if isinstance(key, int):
+        num_bytes = max(8, (key.bit_length() + 8) // 8)
+        encoded = b'\x01' + key.to_bytes(num_bytes, 'big', signed=True)
+    elif isinstance(key, str):
+        encoded = b'\x02' + key.encode()
+    elif isinstance(key, (bytes, bytearray)):
+        encoded = b'\x03' + bytes(key)
+    else:
+        raise ValueError('Key must be an int, str, bytes, or bytearray.')
+    return xxhash.xxh64_digest(hash_input + encoded, seed=0)
+
+
 @dataclass
 class RepeatableRandomSequenceState:
     """An object representing a :class:`RepeatableRandomSequence`'s
@@ -41,13 +141,17 @@ class RepeatableRandomSequenceState:
     _seed: Any
     _hash_input: bytes
     _index: int
+    _counter_version: int = 1
+    _backend: str = 'xxh64'
 
     def as_dict(self):
         """Return the sequence state as a dictionary for serialization."""
         return {
             'seed': self._seed,
             'hash_input': standard_b64encode(self._hash_input).decode('ascii'),
-            'index': self._index
+            'index': self._index,
+            'counter_version': self._counter_version,
+            'backend': self._backend
         }
 
     @classmethod
@@ -61,20 +165,27 @@ class RepeatableRandomSequenceState:
             >>>
             >>> state_as_dict = rrs.getstate().as_dict()
             >>> state_as_dict
-            {'seed': 0, 'hash_input': 'NMlqzcrbG7s=', 'index': 0}
+            {'seed': 0, 'hash_input': 'NMlqzcrbG7s=', 'index': 0, 'counter_version': 1, 'backend': 'xxh64'}
             >>>
             >>> new_state = RepeatableRandomSequenceState.from_dict(state_as_dict)
             >>> rrs.setstate(new_state)
 
+        States serialized before counter mode was introduced do not
+        include ``'counter_version'``, and are treated as version 1.
+        Similarly, states serialized before block backends were
+        introduced do not include ``'backend'``, and are treated as
+        using the ``'xxh64'`` backend.
         """
         return cls(
             _seed=as_dict['seed'],
             _hash_input=standard_b64decode(as_dict['hash_input']),
-            _index=as_dict['index'])
+            _index=as_dict['index'],
+            _counter_version=as_dict.get('counter_version', 1),
+            _backend=as_dict.get('backend', 'xxh64'))
 
     def __repr__(self):
         return f'<{self.__class__.__name__}: ' \
-            f'{repr(self._seed)}, {repr(self._index)}>'
+            f'{repr(self._seed)}, {repr(self._index)}, {repr(self._backend)}>'
 
 
 class RepeatableRandomSequence(object):
@@ -84,6 +195,11 @@ class RepeatableRandomSequence(object):
     Args:
         seed (int, str, bytes, bytearray): The sequence's initial seed.
             See the :meth:`seed()` method below for more details.
+        backend (str): The name of the function used to generate each
+            block. See :ref:`block-backends-label`.
+
+    Raises:
+        ValueError: if `backend` is not supported.
     """
 
     BLOCK_SIZE_BITS: int = 64
@@ -92,15 +208,26 @@ class RepeatableRandomSequence(object):
     BLOCK_MASK: int = 0xFFFFFFFFFFFFFFFF
     """A bitmask corresponding to ``(1 << BLOCK_SIZE_BITS) - 1``"""
 
+    COUNTER_MODE_VERSION: int = 1
+    """The version of the counter-mode block derivation implemented by
+    this class. See :ref:`counter-mode-label` for its definition."""
+
+    DEFAULT_BACKEND: str = 'xxh64'
+    """The block backend used unless another is specified. See
+    :ref:`block-backends-label`."""
+
     _MAX_ITERATIONS: int = 1024
 
-    __slots__ = ('_seed', '_hash_input', '_index', '_cascading')
+    __slots__ = ('_seed', '_hash_input', '_index', '_cascading',
+                 '_backend', '_block')
 
-    def __init__(self, seed=None):
+    def __init__(self, seed=None, backend: str = DEFAULT_BACKEND):
         self._seed = None
         self._hash_input: bytes = None
         self._index: int = 0
         self._cascading: int = 0
+        self._block: Callable[[bytes, int], int] = _block_function(backend)
+        self._backend: str = backend
         self.seed(seed)
 
     @_no_cascade
@@ -140,11 +267,79 @@ class RepeatableRandomSequence(object):
 
         self.reset()
 
+    def derive(self, *keys) -> 'RepeatableRandomSequence':
+        """Return a new child sequence derived from this sequence's
+        seed and the given keys.
+
+        Children depend only on the parent's seed and the keys, and not
+        on the parent's index, so the same child may be re-derived at
+        any time. Deriving with several keys is equivalent to deriving
+        with each key in turn, i.e. ``rrs.derive('a', 1)`` produces the
+        same sequence as ``rrs.derive('a').derive(1)``. See
+        :ref:`derived-sequences-label` for the derivation.
+
+        The child's seed, as returned by :meth:`getseed`, is a list
+        containing the parent's seed followed by the keys.
+
+        Examples:
+
+            >>> world = RepeatableRandomSequence(seed='world')
+            >>> tree = world.derive('chunk', 4, -2).derive('tree', 7)
+            >>> tree.getseed()
+            [['world', 'chunk', 4, -2], 'tree', 7]
+
+        Args:
+            *keys (int, str, bytes, bytearray): The keys identifying
+                the child.
+
+        Raises:
+            ValueError: if any key is not a supported type.
+        """
+        hash_input = self._hash_input
+        for key in keys:
+            hash_input = _derive_hash_input(hash_input, key)
+        return self._child([self._seed, *keys], hash_input)
+
+    def derive_many(self, keys: Iterable) -> List['RepeatableRandomSequence']:
+        """Derive many child sequences at once.
+
+        Equivalent to ``[rrs.derive(*k) for k in keys]``, where each
+        element of `keys` is a tuple of keys, or a single key if it is
+        not a tuple.
+
+        Examples:
+
+            >>> trees = world.derive_many(('tree', i) for i in range(1000))
+        """
+        parent_seed = self._seed
+        parent_hash_input = self._hash_input
+        derive = _derive_hash_input
+        child = self._child
+        result = []
+        for child_keys in keys:
+            if not isinstance(child_keys, tuple):
+                child_keys = (child_keys,)
+            hash_input = parent_hash_input
+            for key in child_keys:
+                hash_input = derive(hash_input, key)
+            result.append(child([parent_seed, *child_keys], hash_input))
+        return result
+
     def getseed(self):
         """Returns: the original value passed to
          :meth:`RepeatableRandomSequence` or :meth:`seed`."""
         return self._seed
 
+    @property
+    def backend(self) -> str:
+        """str: The name of the sequence's block backend. See
+        :ref:`block-backends-label`.
+
+        The backend is part of the sequence's state, and is inherited
+        by derived sequences. It can only be changed by restoring a
+        state using :meth:`setstate()`."""
+        return self._backend
+
     @property
     @_no_cascade
     def index(self) -> int:
@@ -232,14 +427,26 @@ class RepeatableRandomSequence(object):
         return RepeatableRandomSequenceState(
             _seed=self._seed,
             _hash_input=self._hash_input,
-            _index=self._index
+            _index=self._index,
+            _counter_version=self.COUNTER_MODE_VERSION,
+            _backend=self._backend
         )
 
     # noinspection PyProtectedMember
     @_no_cascade
     def setstate(self, state: RepeatableRandomSequenceState) -> None:
         """Restore the sequence's state from previous call to
-        :meth:`getstate()`."""
+        :meth:`getstate()`.
+
+        Raises:
+            ValueError: if the state was produced by an implementation
+                using an unsupported counter-mode version or
+                block backend.
+        """
+        if state._counter_version != self.COUNTER_MODE_VERSION:
+            raise ValueError('Unsupported counter mode version.')
+        self._block = _block_function(state._backend)
+        self._backend = state._backend
         self._seed = state._seed
         self._hash_input = state._hash_input
         self._index = state._index
@@ -262,7 +469,7 @@ class RepeatableRandomSequence(object):
         # remains constant over the run of the sequence. This greatly
         # simplifies index generation across platforms, and, based on
         # testing, has no adverse effects on value distribution.
-        result = xxhash.xxh64_intdigest(self._hash_input, self._index)
+        result = self._block(self._hash_input, self._index)
         if self._cascading:
             # Normally, the index is incremented after each block.
             # When cascading, generated blocks are fed forward to use
@@ -273,7 +480,7 @@ class RepeatableRandomSequence(object):
             self._index += 1
         return result
 
-    def getrandbits(self, k: int) -> int:
+    def getrandbits(self, k: int, mode: str = 'cascade') -> int:
         """Generate an int with `k` random bits.
 
         This method may call :meth:`getnextblock()` multiple times if
@@ -286,36 +493,76 @@ class RepeatableRandomSequence(object):
 
         Args:
             k (int): The number of random bits to generate.
+            mode (str, default 'cascade'): Either ``'cascade'`` or
+                ``'counter'``. See :ref:`counter-mode-label`.
 
         Returns:
             A random integer in [0, ``max(2^k, 1)``)
+
+        Raises:
+            ValueError: if `mode` is not recognized.
         """
+        _check_mode(mode)
         if k <= 0:
             self._index += 1
             return 0
 
         # Only one block is needed
-        if k <= self.BLOCK_SIZE_BITS:
+        if k <= self.BLOCK_SIZE_BITS and mode == 'cascade':
             block = self.getnextblock()
             if k == self.BLOCK_SIZE_BITS:
                 return block
             return block >> (self.BLOCK_SIZE_BITS - k)
 
-        # Multiple blocks required to produce enough bits
-        result: int = 0
-        with self.cascade():
-            while k > 0:
-                block = self.getnextblock()
-                if k >= self.BLOCK_SIZE_BITS:
-                    result = (result << self.BLOCK_SIZE_BITS) | block
-                    k -= self.BLOCK_SIZE_BITS
-                else:
-                    result = \
-                        (result << k) | \
-                        block >> (self.BLOCK_SIZE_BITS - k)
-                    k = 0
+        # Multiple blocks required to produce enough bits. The blocks
+        # are concatenated in a single step, since repeatedly shifting
+        # a growing int takes time quadratic in the number of blocks.
+        num_blocks = (k + self.BLOCK_SIZE_BITS - 1) // self.BLOCK_SIZE_BITS
+        blocks = self._bitblocks(num_blocks, mode)
+        result = int.from_bytes(pack('>{}Q'.format(num_blocks), *blocks), 'big')
+        return result >> (num_blocks * self.BLOCK_SIZE_BITS - k)
 
-        return result
+    def getrandbits_bytes(self, k: int, mode: str = 'cascade') -> bytes:
+        """Generate `k` random bits as a big-endian :class:`bytes`
+        object.
+
+        The result is equal to ``getrandbits(k).to_bytes((k + 7) // 8, 'big')``,
+        and the sequence advances in the same manner, but no large
+        ints are constructed. This is significantly faster for very
+        large values of `k`.
+
+        Args:
+            k (int): The number of random bits to generate.
+            mode (str, default 'cascade'): Either ``'cascade'`` or
+                ``'counter'``. See :ref:`counter-mode-label`.
+
+        Returns:
+            A :class:`bytes` object of ``(k + 7) // 8`` bytes, whose
+            leading ``-k % 8`` bits are zero. Empty if `k` is not
+            greater than 0.
+
+        Raises:
+            ValueError: if `mode` is not recognized.
+        """
+        _check_mode(mode)
+        if k <= 0:
+            self._index += 1
+            return b''
+
+        num_blocks = (k + self.BLOCK_SIZE_BITS - 1) // self.BLOCK_SIZE_BITS
+        blocks = self._bitblocks(num_blocks, mode)
+
+        # Shift the concatenated blocks right, one block at a time
+        shift = num_blocks * self.BLOCK_SIZE_BITS - k
+        if shift:
+            carry = self.BLOCK_SIZE_BITS - shift
+            mask = self.BLOCK_MASK
+            blocks = [blocks[0] >> shift] + [
+                ((previous << carry) | (block >> shift)) & mask
+                for previous, block in zip(blocks, blocks[1:])]
+
+        result = pack('>{}Q'.format(num_blocks), *blocks)
+        return result[num_blocks * 8 - (k + 7) // 8:]
 
     def randrange(self,
                   start: int,
@@ -373,10 +620,28 @@ class RepeatableRandomSequence(object):
         """Generate a random integer in the range [`a`, `b`].
 
         This is an alias for ``randrange(a, b + 1)``, included for
-        compatibility with the builtin :mod:`random` module."""
+        compatibility with the builtin :mod:`random` module.
+
+        Tip:
+            Use :meth:`range_sampler` when drawing many integers from
+            the same range."""
         return self.randrange(a, b + 1)
 
-    def randbytes(self, num_bytes) -> bytes:
+    def range_sampler(self, a: int, b: int) -> 'RangeSampler':
+        """Return a :class:`RangeSampler` drawing random integers in the
+        range [`a`, `b`] from this sequence.
+
+        Each draw produces the same result as ``randint(a, b)``, and
+        advances the sequence identically, but range arithmetic and
+        rejection thresholds are computed only once.
+
+        Raises:
+            TypeError: if `a` or `b` is not an integer.
+            ValueError: if `b` is less than `a`.
+        """
+        return RangeSampler(self, a, b)
+
+    def randbytes(self, num_bytes, mode: str = 'cascade') -> bytes:
         """Generate a sequence of random bytes.
 
         The index will only increment once, regardless of the number of
@@ -390,10 +655,30 @@ class RepeatableRandomSequence(object):
         but offers significantly-improved performance and does not
         discard excess random bits.
 
+        Tip:
+            Use ``mode='counter'`` for very large outputs; counter-mode
+            blocks are independent of one another, so the output can be
+            generated in parallel. See :ref:`counter-mode-label`.
+
+        Args:
+            num_bytes (int): The number of bytes to generate.
+            mode (str, default 'cascade'): Either ``'cascade'`` or
+                ``'counter'``.
+
         Returns:
             A :class:`bytes` object with `num_bytes` random
             integers in [0, 255].
+
+        Raises:
+            ValueError: if `mode` is not recognized.
         """
+        _check_mode(mode)
+        if mode == 'counter':
+            num_blocks = (num_bytes + 7) // 8
+            return b''.join(
+                block.to_bytes(8, 'little')
+                for block in self._counterblocks(num_blocks))[:num_bytes]
+
         random = 0
         available_bits = 0
         result = [0] * num_bytes
@@ -432,6 +717,12 @@ class RepeatableRandomSequence(object):
                 is ``False``, or less than 0 if `include_zero`
                 is ``True``.
         """
+        return self._geometric_sampler(mean, include_zero)()
+
+    def _geometric_sampler(self, mean: float,
+                           include_zero: bool) -> Callable[[], int]:
+        # Returns a function sampling from a geometric distribution,
+        # with constants depending only on the parameters precomputed.
         if include_zero:
             if mean < 0.0:
                 raise ValueError('Mean must be at least 0.')
@@ -441,15 +732,23 @@ class RepeatableRandomSequence(object):
                 raise ValueError('Mean must be at least 1.')
             p = 1.0 / mean
 
+        offset = 1 if include_zero else 0
         if p == 1.0:
-            self._index += 1
-            return 0 if include_zero else 1
+            def degenerate() -> int:
+                self._index += 1
+                return 1 - offset
 
-        # Sample from inverse CDF
-        result = int(ceil(log(1.0 - self.random(), 1.0 - p)))
-        if include_zero:
-            result -= 1
-        return result
+            return degenerate
+
+        # Sample from inverse CDF. N.B. log(x, base) is computed as
+        # log(x) / log(base), so hoisting the denominator is exact.
+        random = self.random
+        log_q = log(1.0 - p)
+
+        def sample() -> int:
+            return int(ceil(log(1.0 - random()) / log_q)) - offset
+
+        return sample
 
     def finitegeometric(self, s: float, n: int):
         r"""Generate a random integer according to a geometric-like
@@ -494,6 +793,268 @@ class RepeatableRandomSequence(object):
         cum_weights = list(accumulate((i + q) ** (-s) for i in range(1, n + 1)))
         return sample_discrete_roulette(self.random, cum_weights) + 1
 
+    def binomialvariate(self, n: int = 1, p: float = 0.5) -> int:
+        r"""Sample the number of successes in `n` independent trials,
+        each of which succeeds with probability `p`.
+
+        The binomial distribution is defined by
+
+        .. math::
+
+            \text{Pr}(x = k) = \binom{n}{k} p^k (1 - p)^{n - k}
+
+        The expected cost is constant regardless of `n`; see
+        :func:`~samplespace.algorithms.sample_binomial`. The sequence's
+        index advances exactly once per sample.
+
+        Raises:
+            ValueError: if `n` is negative or not an integer, or `p` is
+                not in [0.0, 1.0].
+        """
+        return self._cascade_sampler(_binomial_sampler(n, p))()
+
+    def poissonvariate(self, lam: float) -> int:
+        r"""Sample from a Poisson distribution with mean `lam`.
+
+        The Poisson distribution is defined by
+
+        .. math::
+
+            \text{Pr}(x = k) = \frac{\lambda^k e^{-\lambda}}{k!}
+
+        The expected cost is constant regardless of `lam`; see
+        :func:`~samplespace.algorithms.sample_poisson`. The sequence's
+        index advances exactly once per sample.
+
+        Raises:
+            ValueError: if `lam` is negative.
+        """
+        return self._cascade_sampler(_poisson_sampler(lam))()
+
+    # ---- Packed Methods ----
+
+    def coins(self, n: int) -> List[bool]:
+        """Flip `n` fair coins, using one block per 64 flips.
+
+        Flip `i` is ``True`` if bit ``i % 64`` of block ``i // 64`` of
+        a single cascade is set, with bit 0 being the least significant.
+        Shorter draws are prefixes of longer draws from the same index.
+        See :ref:`packed-draws-label`.
+
+        Tip:
+            The index will only increment once, regardless of `n`.
+
+        Returns:
+            A list of `n` bools.
+
+        Raises:
+            ValueError: if `n` is negative.
+        """
+        if n < 0:
+            raise ValueError('Count must be at least 0.')
+        num_blocks = (n + self.BLOCK_SIZE_BITS - 1) // self.BLOCK_SIZE_BITS
+        if not num_blocks:
+            self._index += 1
+            return []
+        bits = ''.join(format(block, '064b')[::-1]
+                       for block in self._bitblocks(num_blocks, 'cascade'))
+        return [bit == '1' for bit in bits[:n]]
+
+    def bernoulli_bits(self, p: float, n: int) -> List[bool]:
+        """Return `n` outcomes which are each ``True`` with
+        probability `p`, using about 7.3 blocks per 64 outcomes on
+        average, rather than one block per outcome.
+
+        Outcomes are produced 64 at a time by comparing the bits of
+        each block with the binary digits of `p`, as defined in
+        :ref:`packed-draws-label`. ``bernoulli_bits(0.5, n)`` is
+        equivalent to ``coins(n)``. Shorter draws are prefixes of longer
+        draws from the same index.
+
+        Tip:
+            The index will only increment once, regardless of `n`.
+
+        Args:
+            p (float): The probability of each outcome being ``True``.
+                Outcomes are always ``False`` if `p` is not greater
+                than 0, and always ``True`` if `p` is at least 1.
+                Other real numbers, such as :class:`fractions.Fraction`,
+                are first converted to the nearest float.
+            n (int): The number of outcomes.
+
+        Returns:
+            A list of `n` bools.
+
+        Raises:
+            ValueError: if `n` is negative.
+        """
+        if n < 0:
+            raise ValueError('Count must be at least 0.')
+        # The digits of p are only finite, and given exactly by its
+        # integer ratio, for floats
+        p = float(p)
+        if not 0.0 < p < 1.0 or not n:
+            self._index += 1
+            return [p >= 1.0] * n
+
+        digits = _binary_digits(p)
+        getnextblock = self.getnextblock
+        result = []
+        with self.cascade():
+            for first in range(0, n, self.BLOCK_SIZE_BITS):
+                size = min(self.BLOCK_SIZE_BITS, n - first)
+                undecided = (1 << size) - 1
+                outcomes = 0
+                for digit in digits:
+                    block = getnextblock()
+                    if digit:
+                        # Lanes whose bit is set are below p
+                        outcomes |= undecided & block
+                        undecided &= ~block
+                    else:
+                        # Lanes whose bit is clear are above p
+                        undecided &= block
+                    if not undecided:
+                        break
+                result.extend(
+                    bit == '1'
+                    for bit in format(outcomes, '064b')[:-size - 1:-1])
+        return result
+
+    def small_ints(self, limit: int, n: int) -> List[int]:
+        """Return `n` random integers in [0, `limit`), packing several
+        into each block.
+
+        Each block is divided into fixed-width fields, and fields are
+        accepted or rejected as defined in :ref:`packed-draws-label`.
+        For example, each block yields an expected 15.75 rolls of a
+        six-sided die. Shorter draws are prefixes of longer draws from
+        the same index.
+
+        Tip:
+            The index will only increment once, regardless of `n`.
+
+        Args:
+            limit (int): The exclusive upper bound, between 1
+                and 2^64.
+            n (int): The number of integers.
+
+        Returns:
+            A list of `n` ints.
+
+        Raises:
+            ValueError: if `limit` is out of range or `n` is negative.
+            TypeError: if `limit` is not an integer.
+        """
+        if not 1 <= limit <= 1 << self.BLOCK_SIZE_BITS:
+            raise ValueError('Limit must be between 1 and 2^64.')
+        if limit != int(limit):
+            raise TypeError('Limit must be an integer.')
+        if n < 0:
+            raise ValueError('Count must be at least 0.')
+        limit = int(limit)
+        if limit == 1 or not n:
+            self._index += 1
+            return [0] * n
+
+        width = _field_width(limit)
+        size = 1 << width
+        threshold = size - size % limit
+        field_mask = size - 1
+        shifts = range(0, (self.BLOCK_SIZE_BITS // width) * width, width)
+        getnextblock = self.getnextblock
+        result = []
+        with self.cascade():
+            while len(result) < n:
+                block = getnextblock()
+                fields = [(block >> shift) & field_mask for shift in shifts]
+                result.extend(field % limit for field in fields
+                              if field < threshold)
+        del result[n:]
+        return result
+
+    # ---- Coordinate Methods ----
+
+    def block_at(self, *coords: int) -> int:
+        """Return a block of random bits for the given integer
+        coordinates.
+
+        Unlike other methods, this does not depend on or advance the
+        sequence's index; the result depends only on the sequence's
+        seed and the coordinates, so values may be looked up in any
+        order. See :ref:`coordinate-lookup-label`.
+
+        Returns:
+            A block of :attr:`BLOCK_SIZE_BITS` random bits as an int
+        """
+        return self._block(
+            pack('>{}Q'.format(len(coords)),
+                 *(coord & self.BLOCK_MASK for coord in coords)),
+            int.from_bytes(self._hash_input, 'big'))
+
+    def value_at(self, *coords: int) -> float:
+        """Return a random float in [0.0, 1.0) for the given integer
+        coordinates.
+
+        Like :meth:`block_at`, this does not depend on or advance the
+        sequence's index.
+
+        Examples:
+
+            >>> terrain = RepeatableRandomSequence(seed='terrain')
+            >>> height = terrain.value_at(120, -45)
+            >>> assert height == terrain.value_at(120, -45)
+        """
+        return self._64bits_to_float(self.block_at(*coords))
+
+    def fill_grid(self,
+                  shape: Sequence[int],
+                  origin: Optional[Sequence[int]] = None) -> List:
+        """Evaluate :meth:`value_at` over a grid of coordinates.
+
+        The result is a nested list such that
+        ``result[i][j] == value_at(origin[0] + i, origin[1] + j)``,
+        and similarly for other numbers of dimensions.
+
+        Since each value depends only on its coordinates, adjacent tiles
+        may be generated independently and will agree on shared values.
+
+        Args:
+            shape (Sequence[int]): The size of the grid along
+                each dimension.
+            origin (Sequence[int], optional): The coordinates of the
+                first grid element. Defaults to all zeros.
+
+        Raises:
+            ValueError: if `shape` is empty, or if `origin` does not
+                have the same length as `shape`.
+        """
+        if not shape:
+            raise ValueError('Shape must have at least one dimension.')
+        if origin is None:
+            origin = [0] * len(shape)
+        elif len(origin) != len(shape):
+            raise ValueError('Origin must have the same number of '
+                             'dimensions as shape.')
+
+        # Coordinates are packed once per dimension, then concatenated
+        # to form each cell's hash input.
+        packed = [[pack('>Q', (start + i) & self.BLOCK_MASK)
+                   for i in range(size)]
+                  for start, size in zip(origin, shape)]
+        seed = int.from_bytes(self._hash_input, 'big')
+        digest = self._block
+        conv = CONV_53BIT_TO_FLOAT
+
+        def fill(prefix: bytes, depth: int) -> List:
+            if depth == len(packed) - 1:
+                return [(digest(prefix + coord, seed) >> 11) * conv
+                        for coord in packed[depth]]
+            return [fill(prefix + coord, depth + 1)
+                    for coord in packed[depth]]
+
+        return fill(b'', 0)
+
     # ---- Categorical Methods ----
 
     def choice(self, sequence: Sequence):
@@ -668,7 +1229,14 @@ class RepeatableRandomSequence(object):
         """Return a random float in [0.0, 1.0)."""
         # N.B. This explicitly depends on the block size being 64.
         # No assertions are included since this is performance-critical.
-        return self._64bits_to_float(self.getnextblock())
+        # Outside of a cascade, the block is hashed directly rather
+        # than through getnextblock(), saving two method calls.
+        if self._cascading:
+            return (self.getnextblock() >> 11) * CONV_53BIT_TO_FLOAT
+        index = self._index
+        self._index = index + 1
+        return (self._block(self._hash_input, index) >> 11) * \
+            CONV_53BIT_TO_FLOAT
 
     def uniform(self, a: float, b: float) -> float:
         """Return a random float uniformly distributed in [`a`, `b`)."""
@@ -700,6 +1268,14 @@ class RepeatableRandomSequence(object):
         Raises:
             ValueError: if the mode is not in [`low`, `high`].
         """
+        return self._triangular_sampler(low, high, mode)()
+
+    def _triangular_sampler(self,
+                            low: float,
+                            high: float,
+                            mode: Optional[float]) -> Callable[[], float]:
+        # Returns a function sampling from a triangular distribution,
+        # with constants depending only on the parameters precomputed.
         if mode is None:
             if not low <= high:
                 raise ValueError('Mode must be between low and high ranges.')
@@ -710,20 +1286,29 @@ class RepeatableRandomSequence(object):
                 raise ValueError('Mode must be between low and high ranges.')
 
             try:
-                c = 0.5 if mode is None else (mode - low) / (high - low)
+                c = (mode - low) / (high - low)
             except ZeroDivisionError:
-                self._index += 1
-                return low
+                def degenerate() -> float:
+                    self._index += 1
+                    return low
+
+                return degenerate
 
         # Implementation adapted from Python's standard library
-        u = self.random()
-        if u > c:
-            u = 1.0 - u
-            c = 1.0 - c
-            low, high = high, low
-        return low + (high - low) * sqrt(u * c)
-
-    def uniformproduct(self, n: int) -> float:
+        random = self.random
+        reflected_c = 1.0 - c
+        span = high - low
+        reflected_span = low - high
+
+        def sample() -> float:
+            u = random()
+            if u > c:
+                return high + reflected_span * sqrt((1.0 - u) * reflected_c)
+            return low + span * sqrt(u * c)
+
+        return sample
+
+    def uniformproduct(self, n: int, mode: str = 'cascade') -> float:
         r"""Sample from a distribution whose values are the product of N
         uniformly distributed variables.
 
@@ -738,12 +1323,23 @@ class RepeatableRandomSequence(object):
             0 & \text{otherwise}
             \end{cases}
 
+        Args:
+            n (int): The number of uniform variables to multiply.
+            mode (str, default 'cascade'): Either ``'cascade'`` or
+                ``'counter'``. See :ref:`counter-mode-label`.
+
         Raises:
-            ValueError: if `n` is not at least 1.
+            ValueError: if `n` is not at least 1, or if `mode` is
+                not recognized.
         """
+        _check_mode(mode)
         if n < 1:
             raise ValueError('n must be at least 1.')
         result: float = 1.0
+        if mode == 'counter':
+            for block in self._counterblocks(n):
+                result *= self._64bits_to_float(block)
+            return result
         with self.cascade():
             for _ in range(n):
                 result *= self.random()
@@ -814,31 +1410,47 @@ class RepeatableRandomSequence(object):
         Returns:
             An angle in radians within [0, `2 pi`)
         """
+        return self._vonmises_sampler(mu, kappa)()
+
+    def _vonmises_sampler(self, mu: float,
+                          kappa: float) -> Callable[[], float]:
+        # Returns a function sampling from a von Mises distribution,
+        # with constants depending only on the parameters precomputed.
+        random = self.random
+
         # Implementation adapted from Python's standard library
         if kappa <= 1e-6:
-            return TWO_PI * self.random()
+            return lambda: TWO_PI * random()
 
         s = 0.5 / kappa
         r = s + sqrt(1.0 + s * s)
-        with self.cascade():
-            b = self.getnextblock() < (self.BLOCK_MASK >> 1)
-            for _ in range(self._MAX_ITERATIONS):
-                u1 = self.random()
-                u2 = self.random()
-
-                candidate_z = cos(PI * u1)
-                d = candidate_z / (r + candidate_z)
-                if (u2 < 1.0 - d * d) or (u2 <= (1.0 - d) * exp(d)):
-                    z = candidate_z
-                    break
-            else:
-                raise RuntimeError('Could not make a random '
-                                   'selection within limit.')
-
         q = 1.0 / r
-        f = (q + z) / (1.0 + q * z)
-        theta = mu + acos(f) * (-1.0 if b else 1.0)
-        return theta % TWO_PI
+        half_mask = self.BLOCK_MASK >> 1
+        getnextblock = self.getnextblock
+        cascade = self.cascade
+        max_iterations = self._MAX_ITERATIONS
+
+        def sample() -> float:
+            with cascade():
+                b = getnextblock() < half_mask
+                for _ in range(max_iterations):
+                    u1 = random()
+                    u2 = random()
+
+                    candidate_z = cos(PI * u1)
+                    d = candidate_z / (r + candidate_z)
+                    if (u2 < 1.0 - d * d) or (u2 <= (1.0 - d) * exp(d)):
+                        z = candidate_z
+                        break
+                else:
+                    raise RuntimeError('Could not make a random '
+                                       'selection within limit.')
+
+            f = (q + z) / (1.0 + q * z)
+            theta = mu + acos(f) * (-1.0 if b else 1.0)
+            return theta % TWO_PI
+
+        return sample
 
     def gammavariate(self, alpha: float, beta: float) -> float:
         r"""Sample from a gamma distribution with parameters `alpha`
@@ -861,58 +1473,76 @@ class RepeatableRandomSequence(object):
         Raises:
             ValueError: if either `alpha` or `beta` is not greater than 0.
         """
+        return self._gamma_sampler(alpha, beta)()
+
+    def _gamma_sampler(self, alpha: float,
+                       beta: float) -> Callable[[], float]:
+        # Returns a function sampling from a gamma distribution, with
+        # constants depending only on the parameters precomputed.
         if alpha <= 0.0 or beta <= 0.0:
             raise ValueError('alpha and beta must be greater than 0.')
 
+        random = self.random
+        cascade = self.cascade
+        max_iterations = self._MAX_ITERATIONS
+
         if alpha > 1.0:
             ainv = sqrt(2.0 * alpha - 1.0)
             b = alpha - LOG_4
             c = alpha + ainv
 
-            with self.cascade():
-                for _ in range(self._MAX_ITERATIONS):
-                    u1 = self.random()
-                    if (u1 < 1e-7) or (u1 > 0.9999999):
-                        continue
-                    u2 = 1.0 - self.random()
-
-                    v = log(u1 / (1.0 - u1)) / ainv
-                    x = alpha * exp(v)
-                    z = u1 * u1 * u2
-                    r = b + c * v - x
-                    if (r + GAMMA_MAGIC - 4.5 * z >= 0.0) or \
-                            (r >= log(z)):
-                        result = x * beta
-                        break
-                else:
-                    raise RuntimeError('Could not make a random '
-                                       'selection within limit.')
+            def sample() -> float:
+                with cascade():
+                    for _ in range(max_iterations):
+                        u1 = random()
+                        if (u1 < 1e-7) or (u1 > 0.9999999):
+                            continue
+                        u2 = 1.0 - random()
+
+                        v = log(u1 / (1.0 - u1)) / ainv
+                        x = alpha * exp(v)
+                        z = u1 * u1 * u2
+                        r = b + c * v - x
+                        if (r + GAMMA_MAGIC - 4.5 * z >= 0.0) or \
+                                (r >= log(z)):
+                            result = x * beta
+                            break
+                    else:
+                        raise RuntimeError('Could not make a random '
+                                           'selection within limit.')
+                return result
         elif alpha == 1.0:
-            result = -log(1.0 - self.random()) * beta
+            def sample() -> float:
+                return -log(1.0 - random()) * beta
         else:
             # Alpha in (0.0, 1.0)
-            with self.cascade():
-                for _ in range(self._MAX_ITERATIONS):
-                    u1 = self.random()
-                    u2 = self.random()
-
-                    b = (E + alpha) / E
-                    p = b * u1
-                    if p <= 1.0:
-                        x = p ** (1.0 / alpha)
-                        if u2 <= exp(-x):
-                            result = x * beta
-                            break
+            b = (E + alpha) / E
+            alpha_inv = 1.0 / alpha
+            alpha_minus_one = alpha - 1.0
+
+            def sample() -> float:
+                with cascade():
+                    for _ in range(max_iterations):
+                        u1 = random()
+                        u2 = random()
+
+                        p = b * u1
+                        if p <= 1.0:
+                            x = p ** alpha_inv
+                            if u2 <= exp(-x):
+                                result = x * beta
+                                break
+                        else:
+                            x = -log((b - p) / alpha)
+                            if u2 <= x ** alpha_minus_one:
+                                result = x * beta
+                                break
                     else:
-                        x = -log((b - p) / alpha)
-                        if u2 <= x ** (alpha - 1.0):
-                            result = x * beta
-                            break
-                else:
-                    raise RuntimeError('Could not make a random '
-                                       'selection within limit.')
+                        raise RuntimeError('Could not make a random '
+                                           'selection within limit.')
+                return result
 
-        return result
+        return sample
 
     def gauss(self, mu: float, sigma: float) -> float:
         r"""Sample from a Gaussian distribution with parameters
@@ -1018,6 +1648,84 @@ class RepeatableRandomSequence(object):
 
     # ---- Internal ----
 
+    def _child(self, seed, hash_input: bytes) -> 'RepeatableRandomSequence':
+        # Builds a new sequence without re-hashing its seed.
+        child = self.__class__.__new__(self.__class__)
+        child._seed = seed
+        child._hash_input = hash_input
+        child._index = 0
+        child._cascading = 0
+        child._backend = self._backend
+        child._block = self._block
+        return child
+
+    def _counterblocks(self, count: int) -> List[int]:
+        """Generate `count` counter-mode blocks for a single logical
+        draw, advancing the sequence exactly as one call to
+        :meth:`getnextblock` would."""
+        key = _counter_key(self._hash_input, self._index)
+        self.getnextblock()
+        return _counter_blocks(key, 0, count, self._backend)
+
+    def _bitblocks(self, num_blocks: int, mode: str) -> List[int]:
+        """Return the `num_blocks` blocks used by a single multi-block
+        draw, advancing the sequence once."""
+        if mode == 'counter':
+            return self._counterblocks(num_blocks)
+        getnextblock = self.getnextblock
+        with self.cascade():
+            return [getnextblock() for _ in range(num_blocks)]
+
+    def _randoms(self, count: int) -> List[float]:
+        """Return `count` random floats, exactly as `count` calls to
+        :meth:`random` would, advancing the sequence `count` times.
+        Outside of a cascade, blocks are hashed in bulk."""
+        if self._cascading:
+            random = self.random
+            return [random() for _ in range(count)]
+        start = self._index
+        self._index = start + count
+        digest = self._block
+        hash_input = self._hash_input
+        return [(digest(hash_input, i) >> 11) * CONV_53BIT_TO_FLOAT
+                for i in range(start, start + count)]
+
+    def _cascade_sampler(self, draw: Callable[[Callable[[], float]], Any]) \
+            -> Callable[[], Any]:
+        # Returns a function equivalent to calling draw(self.random)
+        # within a cascade. Outside of a cascade, each sample's chain
+        # of blocks is hashed directly, and the index is only advanced
+        # once the sample succeeds.
+        def sample():
+            if self._cascading:
+                with self.cascade():
+                    return draw(self.random)
+            index = self._index
+            digest = self._block
+            hash_input = self._hash_input
+            chain = [index]
+
+            def randfloat() -> float:
+                block = digest(hash_input, chain[0])
+                chain[0] = block
+                return (block >> 11) * CONV_53BIT_TO_FLOAT
+
+            result = draw(randfloat)
+            self._index = index + 1
+            return result
+
+        return sample
+
+    def _binomial_sampler(self, n: int, p: float) -> Callable[[], int]:
+        # Returns a function equivalent to binomialvariate(n, p), with
+        # constants depending only on the parameters precomputed.
+        return self._cascade_sampler(_binomial_sampler(n, p))
+
+    def _poisson_sampler(self, lam: float) -> Callable[[], int]:
+        # Returns a function equivalent to poissonvariate(lam), with
+        # constants depending only on the parameters precomputed.
+        return self._cascade_sampler(_poisson_sampler(lam))
+
     def _randbelow(self, limit: int) -> int:
         """Return an int in the range [0, `limit`).
 
@@ -1031,23 +1739,30 @@ class RepeatableRandomSequence(object):
         if limit != int(limit):
             raise TypeError('Limit must be an integer.')
         limit = int(limit)
+        return self._randbelow_impl(limit, *_rejection_params(limit))
 
+    def _randbelow_impl(self, limit: int, num_blocks: int,
+                        threshold: int) -> int:
         # Implementation based on MSVC standard library.
-        # Supports limits greater than _BLOCK_SIZE_BITS bits long
+        # Supports limits greater than _BLOCK_SIZE_BITS bits long.
+        # Each attempt draws the fewest blocks whose combined mask
+        # covers [0, limit), and is rejected if it is not below the
+        # largest multiple of the limit within the mask.
+        fmt = '>{}Q'.format(num_blocks)
+        getnextblock = self.getnextblock
         with self.cascade():
             for _ in range(self._MAX_ITERATIONS):
-                result = 0
-                mask = 0
-                while mask < limit - 1:
-                    result = \
-                        (result << self.BLOCK_SIZE_BITS) | \
-                        self.getnextblock()
-                    mask = \
-                        (mask << self.BLOCK_SIZE_BITS) | \
-                        self.BLOCK_MASK
+                if num_blocks == 1:
+                    result = getnextblock()
+                elif num_blocks:
+                    result = int.from_bytes(
+                        pack(fmt, *[getnextblock()
+                                    for _ in range(num_blocks)]),
+                        'big')
+                else:
+                    result = 0
 
-                if (result // limit < mask // limit) or \
-                        (mask % limit == limit - 1):
+                if result < threshold:
                     return result % limit
 
             raise RuntimeError('Could not make a random '
@@ -1059,6 +1774,25 @@ class RepeatableRandomSequence(object):
             b = sqrt(-2.0 * log(1.0 - self.random()))
         return a, b
 
+    def _gauss_many(self, count: int) -> List[Tuple[float, float]]:
+        # Equivalent to `count` calls to _gauss_impl(). Outside of a
+        # cascade, each pair's cascaded blocks are hashed directly.
+        if self._cascading:
+            gauss_impl = self._gauss_impl
+            return [gauss_impl() for _ in range(count)]
+        start = self._index
+        self._index = start + count
+        digest = self._block
+        hash_input = self._hash_input
+        result = []
+        for i in range(start, start + count):
+            first = digest(hash_input, i)
+            second = digest(hash_input, first)
+            result.append((
+                (first >> 11) * CONV_53BIT_TO_FLOAT * TWO_PI,
+                sqrt(-2.0 * log(1.0 - (second >> 11) * CONV_53BIT_TO_FLOAT))))
+        return result
+
     @staticmethod
     def _64bits_to_float(value: int) -> float:
         # A double-precision float has 53 significant bits,
@@ -1073,3 +1807,125 @@ class RepeatableRandomSequence(object):
 
     def __reduce__(self):
         return self.__class__, (), self.getstate()
+
+
+class RangeSampler(object):
+    """Draws random integers in the range [`a`, `b`] from a
+    :class:`RepeatableRandomSequence`.
+
+    Each draw produces the same result as ``rrs.randint(a, b)``, and
+    advances the sequence identically, including within cascades.
+    The range arithmetic, rejection threshold, and number of blocks per
+    attempt are computed once, when the sampler is created, and
+    draws from ranges of at most 2^64 integers hash blocks directly.
+
+    Samplers are usually created using
+    :meth:`RepeatableRandomSequence.range_sampler`. They may be
+    pickled along with their sequence, e.g. to send them to worker
+    processes.
+
+    Args:
+        rrs (RepeatableRandomSequence): The sequence to draw from.
+        a (int): The lower bound of the range, inclusive.
+        b (int): The upper bound of the range, inclusive.
+
+    Raises:
+        TypeError: if `a` or `b` is not an integer.
+        ValueError: if `b` is less than `a`.
+    """
+
+    __slots__ = ('_rrs', '_a', '_b', '_limit', '_num_blocks', '_threshold')
+
+    def __init__(self, rrs: RepeatableRandomSequence, a: int, b: int):
+        if a != int(a) or b != int(b):
+            raise TypeError('Range bounds must be integers.')
+        a, b = int(a), int(b)
+        if b < a:
+            raise ValueError('Upper bound must not be less than lower bound.')
+        self._rrs: RepeatableRandomSequence = rrs
+        self._a: int = a
+        self._b: int = b
+        self._limit: int = b - a + 1
+        self._num_blocks, self._threshold = _rejection_params(self._limit)
+
+    @property
+    def rrs(self) -> RepeatableRandomSequence:
+        """Read-only property for the sequence drawn from."""
+        return self._rrs
+
+    @property
+    def a(self) -> int:
+        """Read-only property for the lower bound, inclusive."""
+        return self._a
+
+    @property
+    def b(self) -> int:
+        """Read-only property for the upper bound, inclusive."""
+        return self._b
+
+    # noinspection PyProtectedMember
+    def draw(self) -> int:
+        """Draw a random integer in [`a`, `b`].
+
+        Equivalent to ``rrs.randint(a, b)``."""
+        rrs = self._rrs
+        if rrs._cascading or self._num_blocks != 1:
+            return self._a + rrs._randbelow_impl(
+                self._limit, self._num_blocks, self._threshold)
+
+        # Outside of a cascade, a single-block draw is hashed directly
+        index = rrs._index
+        result = rrs._block(rrs._hash_input, index)
+        if result >= self._threshold:
+            result = self._retry(result)
+        rrs._index = index + 1
+        return self._a + result % self._limit
+
+    # noinspection PyProtectedMember
+    def draw_many(self, n: int) -> List[int]:
+        """Draw `n` random integers in [`a`, `b`].
+
+        Equivalent to ``[rrs.randint(a, b) for _ in range(n)]``, but
+        outside of a cascade, blocks are hashed in bulk."""
+        rrs = self._rrs
+        if rrs._cascading or self._num_blocks != 1:
+            draw = self.draw
+            return [draw() for _ in range(n)]
+
+        digest = rrs._block
+        hash_input = rrs._hash_input
+        start = rrs._index
+        threshold = self._threshold
+        results = [digest(hash_input, i) for i in range(start, start + n)]
+        for i, result in enumerate(results):
+            if result >= threshold:
+                # Rejections are rare; if retrying fails, the index
+                # reflects only the preceding draws
+                rrs._index = start + i
+                results[i] = self._retry(result)
+        rrs._index = start + n
+
+        a = self._a
+        limit = self._limit
+        return [a + result % limit for result in results]
+
+    # noinspection PyProtectedMember
+    def _retry(self, result: int) -> int:
+        # Continues a rejected single-block draw, cascading from the
+        # rejected block as _randbelow_impl() would.
+        rrs = self._rrs
+        digest = rrs._block
+        hash_input = rrs._hash_input
+        threshold = self._threshold
+        for _ in range(rrs._MAX_ITERATIONS - 1):
+            result = digest(hash_input, result)
+            if result < threshold:
+                return result
+        raise RuntimeError('Could not make a random '
+                           'selection within limit.')
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}: [{self._a}, {self._b}]>'
+
+    def __reduce__(self):
+        return self.__class__, (self._rrs, self._a, self._b)
@@ -0,0 +1,75 @@
+# Compares the time taken to repeatedly sample from each distribution
+# class using Distribution.sample() and a sampler returned by
+# Distribution.bind(), for both a RepeatableRandomSequence and the
+# random module.
+
+import random
+import timeit
+
+from samplespace import RepeatableRandomSequence
+from samplespace import distributions as d
+
+COUNT = 20000
+
+DISTRIBUTIONS = [
+    d.Constant(2.3),
+    d.Uniform(4.5, 6.7),
+    d.DiscreteUniform(2, 8),
+    d.Geometric(1.6),
+    d.FiniteGeometric(0.7, 10),
+    d.ZipfMandelbrot(1.5, 0.5, 10),
+    d.Gamma(3.4, 4.5),
+    d.Gamma(0.4, 4.5),
+    d.Triangular(2.4, 4.6, 3.5),
+    d.UniformProduct(4),
+    d.LogNormal(-1.3, 3.1),
+    d.Exponential(2.3),
+    d.VonMises(3.4, 23.1),
+    d.Beta(1.2, 3.4),
+    d.Pareto(5.6),
+    d.Weibull(7.8, 9.1),
+    d.Gaussian(2.3, 4.5),
+    d.Bernoulli(0.47),
+    d.Binomial(20, 0.3),
+    d.Poisson(3.5),
+    d.WeightedCategorical(population='abcd', weights=[1.0, 2.0, 3.0, 1.0]),
+    d.UniformCategorical('abcd'),
+    d.FiniteGeometricCategorical('abcd', 0.7),
+    d.ZipfMandelbrotCategorical('abcd', 1.5, 0.5),
+    d.MarkovChain([['a', 'b', 1.0], ['a', 'c', 2.0], ['b', 'a', 1.0],
+                   ['c', 'a', 3.0], ['c', 'end', 1.0]], 'a', 5),
+    d.Multinomial(100, [1.0, 0.0, 2.5, 3.0]),
+    d.Dirichlet([0.5, 1.0, 4.0]),
+    d.MultivariateGaussian([1.0, -2.0], [[4.0, 1.2], [1.2, 1.0]]),
+    d.Truncated(d.Gaussian(2.0, 3.0), 10.0),
+    d.Empirical([0.5, 1.0, 1.25, 3.0, 7.5]),
+    d.Mixture([d.Gaussian(-2.0, 0.5), d.Exponential(1.0)], [2.0, 1.0]),
+    d.Gaussian(0.0, 1.0) * 3.0 + d.Exponential(2.0),
+    d.Uniform(1.0, 2.0).map('log'),
+    d.clip(d.Gaussian(), -1.0)
+]
+
+
+def _time(func) -> float:
+    return min(timeit.repeat(func, number=COUNT, repeat=3)) / COUNT * 1e6
+
+
+if __name__ == '__main__':
+    covered = {type(dist).__name__ for dist in DISTRIBUTIONS}
+    missing = [name for name in d.__all__
+               if isinstance(getattr(d, name), type) and name not in covered]
+    if missing:
+        print('Not benchmarked: {}'.format(', '.join(missing)))
+
+    print('{:<28} {:>10} {:>10} {:>8}'.format(
+        'Distribution (us/sample)', 'sample', 'bind', 'speedup'))
+    for name, rand in (('rrs', RepeatableRandomSequence(seed=0)),
+                       ('random', random.Random(0))):
+        print('-- {} --'.format(name))
+        for dist in DISTRIBUTIONS:
+            sample_time = _time(lambda: dist.sample(rand))
+            bound = dist.bind(rand)
+            bind_time = _time(bound)
+            print('{:<28} {:>10.3f} {:>10.3f} {:>7.2f}x'.format(
+                str(dist).strip('<>').replace('Distribution', ''),
+                sample_time, bind_time, sample_time / bind_time))
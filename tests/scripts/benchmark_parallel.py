@@ -0,0 +1,30 @@
+# Measures bulk generation throughput for each parallel backend over a
+# range of worker counts. Run under both a standard and a free-threaded
+# build of CPython to compare thread scaling.
+
+import os
+import sys
+
+from samplespace import RepeatableRandomSequence
+from samplespace.parallel import ParallelGenerator
+
+COUNT = 1 << 23
+CHUNK_SIZE = 1 << 18
+KINDS = ('floats', 'ints', 'bytes')
+
+if __name__ == '__main__':
+    gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print('Python {} ({})'.format(
+        sys.version.split()[0],
+        'GIL enabled' if gil_enabled else 'free-threaded'))
+
+    worker_counts = sorted({1, 2, 4, os.cpu_count() or 1})
+    rrs = RepeatableRandomSequence(seed=0)
+    for backend in ('thread', 'process'):
+        for workers in worker_counts:
+            with ParallelGenerator(max_workers=workers,
+                                   chunk_size=CHUNK_SIZE,
+                                   backend=backend) as gen:
+                for kind in KINDS:
+                    getattr(gen, 'fill_' + kind)(rrs, COUNT)
+                    print('{:>7}: {}'.format(backend, gen.last_report))
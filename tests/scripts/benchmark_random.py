@@ -0,0 +1,47 @@
+# Compares the time taken by RepeatableRandomSequence.random() and the
+# scalar methods built on it against the previous implementation of
+# random(), which called getnextblock() and _64bits_to_float().
+# Measurements of the two implementations are interleaved and repeated,
+# and the median and minimum of each are reported, since single timeit
+# runs are dominated by noise.
+
+import statistics
+import timeit
+
+from samplespace import RepeatableRandomSequence
+
+COUNT = 100000
+ROUNDS = 15
+
+
+class PreviousRRS(RepeatableRandomSequence):
+    __slots__ = ()
+
+    def random(self) -> float:
+        return self._64bits_to_float(self.getnextblock())
+
+
+METHODS = {
+    'random()': lambda rrs: rrs.random,
+    'uniform(2, 5)': lambda rrs: lambda: rrs.uniform(2.0, 5.0),
+    'chance(0.3)': lambda rrs: lambda: rrs.chance(0.3),
+    'expovariate(2)': lambda rrs: lambda: rrs.expovariate(2.0),
+}
+
+
+if __name__ == '__main__':
+    print('{:<16} {:>22} {:>22} {:>8}'.format(
+        'ns/call', 'previous (med/min)', 'current (med/min)', 'change'))
+    for name, make in METHODS.items():
+        times = {'previous': [], 'current': []}
+        funcs = {'previous': make(PreviousRRS(seed=0)),
+                 'current': make(RepeatableRandomSequence(seed=0))}
+        for _ in range(ROUNDS):
+            for key, func in funcs.items():
+                times[key].append(
+                    timeit.timeit(func, number=COUNT) / COUNT * 1e9)
+        previous = statistics.median(times['previous'])
+        current = statistics.median(times['current'])
+        print('{:<16} {:>13.0f} / {:<6.0f} {:>13.0f} / {:<6.0f} {:>+7.0%}'.format(
+            name, previous, min(times['previous']),
+            current, min(times['current']), current / previous - 1.0))
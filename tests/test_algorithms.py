@@ -1,6 +1,8 @@
 from itertools import accumulate
 
-from samplespace import algorithms
+import pytest
+
+from samplespace import algorithms, RepeatableRandomSequence
 
 
 def test_roulette():
@@ -37,3 +39,109 @@ def test_alias_table_equality():
     assert at1 == at2
     assert at1 != algorithms.AliasTable([], [])
     assert at1 != object()
+
+
+def test_sample_binomial():
+    calls = []
+
+    def randfloat():
+        calls.append(None)
+        return 0.5
+
+    # Degenerate cases still consume a random value
+    assert algorithms.sample_binomial(randfloat, 0, 0.5) == 0
+    assert algorithms.sample_binomial(randfloat, 5, 0.0) == 0
+    assert algorithms.sample_binomial(randfloat, 5, 1.0) == 5
+    assert len(calls) == 3
+
+    # The median of the distribution is found by inversion
+    assert algorithms.sample_binomial(randfloat, 10, 0.5) == 5
+
+    # Sampling p > 0.5 counts failures instead
+    rrs = RepeatableRandomSequence(123456)
+    expected = [50 - algorithms.sample_binomial(rrs.random, 50, 0.25)
+                for _ in range(10)]
+    rrs.reset()
+    assert [algorithms.sample_binomial(rrs.random, 50, 0.75)
+            for _ in range(10)] == expected
+
+
+def check_poisson_disk(points, size, radius_at):
+    for point in points:
+        assert all(0.0 <= x < limit for x, limit in zip(point, size))
+    for i, p in enumerate(points):
+        for q in points[i + 1:]:
+            limit = max(radius_at(p), radius_at(q))
+            assert sum((a - b) ** 2 for a, b in zip(p, q)) >= limit * limit
+
+
+def test_poisson_disk_2d():
+    rrs = RepeatableRandomSequence(123456)
+    points = algorithms.poisson_disk_sample(
+        rrs.random, rrs.randrange, (20.0, 10.0), 1.0)
+    check_poisson_disk(points, (20.0, 10.0), lambda p: 1.0)
+
+    # The box should be densely filled
+    assert len(points) > 100
+
+    rrs.reset()
+    assert algorithms.poisson_disk_sample(
+        rrs.random, rrs.randrange, (20.0, 10.0), 1.0) == points
+
+
+def test_poisson_disk_3d():
+    rrs = RepeatableRandomSequence(123456)
+    points = algorithms.poisson_disk_sample(
+        rrs.random, rrs.randrange, (5.0, 4.0, 3.0), 1.0, k=10,
+        start=(1.0, 2.0, 0.5))
+    assert points[0] == (1.0, 2.0, 0.5)
+    check_poisson_disk(points, (5.0, 4.0, 3.0), lambda p: 1.0)
+    assert len(points) > 25
+
+
+def test_poisson_disk_variable_radius():
+    def radius(point):
+        return 0.5 + point[0] / 10.0
+
+    rrs = RepeatableRandomSequence(123456)
+    points = algorithms.poisson_disk_sample(
+        rrs.random, rrs.randrange, (10.0, 10.0), radius,
+        min_radius=0.5, max_radius=1.5)
+    check_poisson_disk(points, (10.0, 10.0), radius)
+
+    # Points should be denser where the radius is smaller
+    left = sum(1 for p in points if p[0] < 5.0)
+    assert left > 1.5 * (len(points) - left)
+
+
+def test_poisson_disk_invalid():
+    rrs = RepeatableRandomSequence(123456)
+    with pytest.raises(ValueError):
+        algorithms.poisson_disk_sample(
+            rrs.random, rrs.randrange, (1.0,), 1.0)
+    with pytest.raises(ValueError):
+        algorithms.poisson_disk_sample(
+            rrs.random, rrs.randrange, (1.0, 1.0), 1.0, k=0)
+    with pytest.raises(ValueError):
+        algorithms.poisson_disk_sample(
+            rrs.random, rrs.randrange, (1.0, 1.0), 0.0)
+    with pytest.raises(ValueError):
+        algorithms.poisson_disk_sample(
+            rrs.random, rrs.randrange, (1.0, 1.0), lambda p: 1.0)
+    with pytest.raises(ValueError):
+        algorithms.poisson_disk_sample(
+            rrs.random, rrs.randrange, (1.0, 1.0), 1.0, start=(0.5,))
+    with pytest.raises(ValueError):
+        algorithms.poisson_disk_sample(
+            rrs.random, rrs.randrange, (1.0, 1.0), 0.1, start=(0.5, 1.0))
+    with pytest.raises(ValueError):
+        algorithms.poisson_disk_sample(
+            rrs.random, rrs.randrange, (1.0, 1.0), 0.1, start=(-0.1, 0.5))
+
+    # Radii outside the given bounds would break the spacing guarantee
+    # or overwrite grid cells
+    for radius in (5.0, 0.1):
+        with pytest.raises(ValueError):
+            algorithms.poisson_disk_sample(
+                rrs.random, rrs.randrange, (10.0, 10.0),
+                lambda p, r=radius: r, min_radius=1.0, max_radius=2.0)
@@ -1,4 +1,7 @@
+import math
 import random
+from array import array
+from fractions import Fraction
 
 import pytest
 
@@ -27,6 +30,10 @@ dist_args = [
     ('weibull', {'alpha': 7.8, 'beta': 9.1}),
     ('gaussian', {'mu': 2.3, 'sigma': 4.5}),
     ('bernoulli', {'p': 0.47}),
+    ('binomial', {'n': 20, 'p': 0.3}),
+    ('binomial', {'n': 1000000, 'p': 0.75}),
+    ('poisson', {'lam': 3.5}),
+    ('poisson', {'lam': 12345.6}),
     ('weightedcategorical', {'population': ['hello', 'world', '!']}),
     ('weightedcategorical', {
         'population': 'abcd',
@@ -36,7 +43,35 @@ dist_args = [
         'cum_weights': [1.2, 3.3, 5.7, 7.8, 9.1, 10.3]}),
     ('uniformcategorical', {'population': [2, 6.4, 'hi', None, {'b': 'dict'}]}),
     ('finitegeometriccategorical', {'population': ['one', 'two', 'three'], 's': 0.7}),
-    ('zipfmandelbrotcategorical', {'population': ['one', 'two', 'three'], 's': 1.5, 'q': 0.5})
+    ('zipfmandelbrotcategorical', {'population': ['one', 'two', 'three'], 's': 1.5, 'q': 0.5}),
+    ('markovchain', {
+        'transitions': [['a', 'b', 1.0], ['a', 'c', 2.0], ['b', 'a', 1.0],
+                        ['c', 'a', 3.0], ['c', 'end', 1.0]],
+        'start': 'a',
+        'length': 5}),
+    ('multinomial', {'n': 100, 'weights': [1.0, 0.0, 2.5, 3.0]}),
+    ('dirichlet', {'alphas': [0.5, 1.0, 4.0]}),
+    ('multivariategaussian', {
+        'mean': [1.0, -2.0, 0.5],
+        'cov': [[4.0, 1.2, 0.0], [1.2, 1.0, -0.3], [0.0, -0.3, 2.25]]}),
+    ('truncated', {
+        'dist': distributions.Gaussian(2.0, 3.0), 'lo': 10.0, 'hi': None}),
+    ('truncated', {
+        'dist': distributions.Gamma(2.5, 1.5), 'lo': 1.0, 'hi': 2.0}),
+    ('empirical', {'quantiles': [0.5, 1.0, 1.25, 3.0, 7.5]}),
+    ('mixture', {
+        'components': [distributions.Gaussian(-2.0, 0.5),
+                       distributions.Truncated(
+                           distributions.Exponential(1.0), 1.0, 3.0),
+                       distributions.Constant(7)],
+        'weights': [2.0, 1.0, 0.5]}),
+    ('arithmetic', {
+        'op': 'add',
+        'left': distributions.Gaussian(0.0, 1.0) * 3.0,
+        'right': distributions.Exponential(2.0)}),
+    ('arithmetic', {'op': 'truediv', 'left': 1, 'right': ['uniform', 1.0, 2.0]}),
+    ('mapped', {'dist': distributions.Uniform(1.0, 2.0), 'func': 'log'}),
+    ('clipped', {'dist': distributions.Gaussian(), 'lo': -1.0, 'hi': None})
 ]
 assert sorted(list(set(name for name, args in dist_args))) == sorted(list(dist_lookup.keys())), \
     'Inadequate coverage over distribution types!'
@@ -77,6 +112,11 @@ def test_properties():
             # Special case for item-list serialization
             if key == 'items':
                 val = [tuple(x) for x in val]
+            # Special case for nested distributions
+            if key in ('dist', 'left', 'right') and isinstance(val, dict):
+                val = distributions.distribution_from_dict(val)
+            if key == 'components':
+                val = [distributions.distribution_from_dict(x) for x in val]
             assert getattr(dist, key) == val
 
 
@@ -98,6 +138,26 @@ def test_sample_no_throw():
             dist.samples_unique(rrs, 3)
 
 
+def test_discrete_uniform_bounds():
+    """Verify that integral bounds of any type produce ints on every
+    sampling path."""
+    dist = distributions.DiscreteUniform(8.0, Fraction(2))
+    assert dist.min_val == 2 and type(dist.min_val) is int
+    assert dist.max_val == 8 and type(dist.max_val) is int
+
+    rrs = RepeatableRandomSequence(seed=1234)
+    expected = [dist.sample(rrs) for _ in range(20)]
+    assert all(type(x) is int for x in expected)
+    rrs.reset()
+    assert dist.samples(rrs, 20) == expected
+    rrs.reset()
+    sample = dist.bind(rrs)
+    assert all(type(x) is int for x in [sample() for _ in range(20)])
+
+    with pytest.raises(TypeError):
+        distributions.DiscreteUniform(2.5, 8)
+
+
 def test_geometric_dynamic_impl():
     # noinspection PyUnusedLocal
     def override_impl(*args):
@@ -197,3 +257,732 @@ def test_equality():
         assert str(dist1) == str(dist2)
         assert repr(dist1) == repr(dist2)
         assert dist1 != distributions.Distribution()
+
+
+def test_binomial_dynamic_impl():
+    # noinspection PyUnusedLocal
+    def override_impl(*args):
+        return 'CALLED_IMPL'
+
+    dist = distributions.Binomial(10, 0.5)
+    dist._impl = override_impl
+
+    # RRS supplies binomialvariate(), so the replaced impl method
+    # should not be called.
+    rrs = RepeatableRandomSequence(seed=2)
+    assert dist.sample(rrs) != 'CALLED_IMPL'
+    assert 'CALLED_IMPL' not in dist.samples(rrs, 5)
+
+
+# noinspection PyProtectedMember
+def test_binomial_impl():
+    with pytest.raises(ValueError):
+        distributions.Binomial(-1, 0.5)
+    with pytest.raises(ValueError):
+        distributions.Binomial(2.5, 0.5)
+    with pytest.raises(ValueError):
+        distributions.Binomial(10, 1.5)
+
+    rrs = RepeatableRandomSequence(seed=1234)
+    for n, p in ((5, 0.1), (40, 0.5), (10000, 0.2), (10000, 0.9)):
+        dist = distributions.Binomial(n, p)
+        state = rrs.getstate()
+        expected = [rrs.binomialvariate(n, p) for _ in range(10)]
+        rrs.setstate(state)
+        assert dist.samples(rrs, 10) == expected
+        rrs.setstate(state)
+        actual = []
+        for _ in range(10):
+            with rrs.cascade():
+                actual.append(dist._impl(rrs, n, p))
+        assert actual == expected
+
+
+# noinspection PyProtectedMember
+def test_poisson_impl():
+    with pytest.raises(ValueError):
+        distributions.Poisson(-1.0)
+
+    rrs = RepeatableRandomSequence(seed=1234)
+    for lam in (0.5, 9.0, 100.0, 1e6):
+        dist = distributions.Poisson(lam)
+        state = rrs.getstate()
+        expected = [rrs.poissonvariate(lam) for _ in range(10)]
+        rrs.setstate(state)
+        assert dist.samples(rrs, 10) == expected
+        rrs.setstate(state)
+        actual = []
+        for _ in range(10):
+            with rrs.cascade():
+                actual.append(dist._impl(rrs, lam))
+        assert actual == expected
+
+
+@pytest.mark.parametrize('dist', [
+    distributions.Binomial(0, 0.5),
+    distributions.Binomial(30, 0.0),
+    distributions.Binomial(30, 0.1),
+    distributions.Binomial(10 ** 6, 0.01),
+    distributions.Binomial(10 ** 6, 0.7),
+    distributions.Poisson(0.0),
+    distributions.Poisson(3.0),
+    distributions.Poisson(1e4)
+])
+def test_bound_variate_samplers(dist):
+    """Verify that bound samplers advance the sequence exactly as
+    sample() does, inside and outside of cascades."""
+    rrs = RepeatableRandomSequence(seed=1234)
+    expected = [dist.sample(rrs) for _ in range(50)]
+    assert rrs.index == 50
+    rrs.reset()
+    sample = dist.bind(rrs)
+    assert [sample() for _ in range(50)] == expected
+    assert rrs.index == 50
+
+    rrs.reset()
+    with rrs.cascade():
+        expected = [dist.sample(rrs) for _ in range(20)]
+    rrs.reset()
+    with rrs.cascade():
+        assert dist.samples(rrs, 20) == expected
+    assert rrs.index == 1
+
+
+def test_markov_chain_walks():
+    chain = distributions.MarkovChain(
+        [[0, 1, 1.0], [0, 2, 3.0], [1, 0, 1.0], [2, 2, 1.0], [2, 3, 1.0]],
+        start=0, length=20)
+    assert chain.states == [0, 1, 2]
+
+    # Walks are equivalent to repeated steps
+    rrs = RepeatableRandomSequence(seed=1234)
+    walk = chain.walk(rrs, 0, 20)
+    rrs.reset()
+    state = 0
+    for expected in walk:
+        state = chain.step(rrs, state)
+        assert state == expected
+
+    # Walks end upon reaching a state with no transitions
+    assert len(walk) < 20 and walk[-1] == 3
+    assert 3 not in walk[:-1]
+
+    rrs.reset()
+    assert chain.sample(rrs) == walk
+
+    # Batched walks advance in lockstep
+    starts = [0, 1, 2, 3, 0]
+    rrs.reset()
+    walks = chain.walks(rrs, starts, 10)
+    rrs.reset()
+    expected = [[] for _ in starts]
+    current = list(starts)
+    for _ in range(10):
+        for i, state in enumerate(current):
+            if state in chain.states:
+                current[i] = chain.step(rrs, state)
+                expected[i].append(current[i])
+            else:
+                current[i] = None
+    assert walks == expected
+    assert walks[3] == []
+
+
+def test_markov_chain_distribution():
+    chain = distributions.MarkovChain(
+        [['x', 'x', 1.0], ['x', 'y', 3.0], ['y', 'x', 1.0]], 'x', 1)
+    rrs = RepeatableRandomSequence(seed=1234)
+    steps = [chain.step(rrs, 'x') for _ in range(4000)]
+    assert steps.count('y') / len(steps) == pytest.approx(0.75, abs=0.03)
+
+    # Alias tables are cached, but do not affect equality
+    assert chain == distributions.MarkovChain(chain.transitions, 'x', 1)
+
+
+def test_markov_chain_invalid():
+    with pytest.raises(ValueError):
+        distributions.MarkovChain([['a', 'b', -1.0]])
+    with pytest.raises(ValueError):
+        distributions.MarkovChain([['a', 'b', 0.0], ['a', 'c', 0.0]])
+
+
+def test_multinomial():
+    dist = distributions.Multinomial(1000, [1.0, 0.0, 2.0, 5.0, 2.0])
+    rrs = RepeatableRandomSequence(seed=1234)
+    samples = dist.samples(rrs, 200)
+    assert all(len(x) == 5 and sum(x) == 1000 for x in samples)
+    assert all(x[1] == 0 for x in samples)
+    for i, expected in enumerate([100.0, 0.0, 200.0, 500.0, 200.0]):
+        mean = sum(x[i] for x in samples) / len(samples)
+        assert mean == pytest.approx(expected, abs=5.0)
+
+    # Batches are equivalent to repeated samples
+    rrs.reset()
+    assert [dist.sample(rrs) for _ in range(200)] == samples
+
+    assert distributions.Multinomial(0, [1.0, 2.0]).sample(rrs) == [0, 0]
+
+    with pytest.raises(ValueError):
+        distributions.Multinomial(-1, [1.0])
+    with pytest.raises(ValueError):
+        distributions.Multinomial(10, [1.0, -1.0])
+    with pytest.raises(ValueError):
+        distributions.Multinomial(10, [0.0, 0.0])
+
+
+def test_dirichlet():
+    dist = distributions.Dirichlet([1.0, 2.0, 7.0])
+    rrs = RepeatableRandomSequence(seed=1234)
+    samples = dist.samples(rrs, 2000)
+    assert all(sum(x) == pytest.approx(1.0) for x in samples)
+    assert all(min(x) >= 0.0 for x in samples)
+    for i, expected in enumerate([0.1, 0.2, 0.7]):
+        mean = sum(x[i] for x in samples) / len(samples)
+        assert mean == pytest.approx(expected, abs=0.01)
+
+    rrs.reset()
+    assert [dist.sample(rrs) for _ in range(2000)] == samples
+
+    with pytest.raises(ValueError):
+        distributions.Dirichlet([1.0])
+    with pytest.raises(ValueError):
+        distributions.Dirichlet([1.0, 0.0])
+
+
+def test_multivariate_gaussian():
+    mean = [1.0, -2.0, 0.5]
+    cov = [[4.0, 1.2, 0.0], [1.2, 1.0, -0.3], [0.0, -0.3, 2.25]]
+    dist = distributions.MultivariateGaussian(mean, cov)
+    rrs = RepeatableRandomSequence(seed=1234)
+    samples = dist.samples(rrs, 20000)
+    assert all(len(x) == 3 for x in samples)
+
+    sample_mean = [sum(x[i] for x in samples) / len(samples)
+                   for i in range(3)]
+    assert sample_mean == pytest.approx(mean, abs=0.05)
+    for i in range(3):
+        for j in range(3):
+            sample_cov = sum((x[i] - sample_mean[i]) * (x[j] - sample_mean[j])
+                             for x in samples) / (len(samples) - 1)
+            assert sample_cov == pytest.approx(cov[i][j], abs=0.1)
+
+    rrs.reset()
+    assert [dist.sample(rrs) for _ in range(10)] == samples[:10]
+
+    # Samples are also drawn correctly using the random module
+    assert len(dist.sample(random)) == 3
+
+
+def test_multivariate_gaussian_semidefinite():
+    # Perfectly correlated variables have a singular covariance
+    dist = distributions.MultivariateGaussian(
+        [0.0, 1.0], [[1.0, 2.0], [2.0, 4.0]])
+    rrs = RepeatableRandomSequence(seed=1234)
+    for x, y in dist.samples(rrs, 10):
+        assert y - 1.0 == pytest.approx(2.0 * x)
+
+
+def test_multivariate_gaussian_invalid():
+    with pytest.raises(ValueError):
+        distributions.MultivariateGaussian([], [])
+    with pytest.raises(ValueError):
+        distributions.MultivariateGaussian([0.0, 0.0], [[1.0, 0.0]])
+    with pytest.raises(ValueError):
+        distributions.MultivariateGaussian(
+            [0.0, 0.0], [[1.0, 0.5], [0.0, 1.0]])
+    with pytest.raises(ValueError):
+        distributions.MultivariateGaussian(
+            [0.0, 0.0], [[1.0, 2.0], [2.0, 1.0]])
+
+
+@pytest.mark.parametrize('dist,lo,hi', [
+    (distributions.Gaussian(1.0, 2.0), -1.0, 0.5),
+    (distributions.Gaussian(0.0, 1.0), 6.0, None),
+    (distributions.Gaussian(0.0, 1.0), None, -50.0),
+    (distributions.LogNormal(0.0, 1.0), 20.0, 30.0),
+    (distributions.Exponential(2.0), 5.0, 5.5),
+    (distributions.Pareto(1.5), None, 3.0),
+    (distributions.Gamma(3.0, 2.0), 40.0, None),
+    (distributions.Gamma(0.5, 1.0), 0.0, 0.001),
+])
+def test_truncated_bounds(dist, lo, hi):
+    truncated = distributions.Truncated(dist, lo, hi)
+    rrs = RepeatableRandomSequence(seed=1234)
+    samples = truncated.samples(rrs, 500)
+    assert all((lo is None or x >= lo) and (hi is None or x <= hi)
+               for x in samples)
+    assert len(set(samples)) == 500
+
+    rrs.reset()
+    assert [truncated.sample(rrs) for _ in range(500)] == samples
+
+
+def test_truncated_inverse_cdf():
+    # Each sample uses a single random value
+    rrs = RepeatableRandomSequence(seed=1234)
+    for dist in (distributions.Gaussian(0.0, 1.0),
+                 distributions.Exponential(1.0),
+                 distributions.Gamma(2.0, 1.0)):
+        truncated = distributions.Truncated(dist, 3.0, 4.0)
+        rrs.index = 0
+        truncated.samples(rrs, 10)
+        assert rrs.index == 10
+
+    # Exponential distributions are memoryless
+    truncated = distributions.Truncated(
+        distributions.Exponential(0.5), 100.0)
+    rrs.reset()
+    expected = [100.0 + rrs.expovariate(0.5) for _ in range(10)]
+    rrs.reset()
+    assert truncated.samples(rrs, 10) == pytest.approx(expected)
+
+
+# noinspection PyProtectedMember
+def test_normal_inverse_cdf():
+    inv_cdf = distributions._normal_inv_cdf
+    cdf = distributions._normal_cdf
+    rrs = RepeatableRandomSequence(seed=1234)
+    ps = [rrs.random() for _ in range(1000)] + \
+        [10.0 ** -rrs.uniform(1.0, 300.0) for _ in range(100)]
+    for p in ps:
+        assert cdf(inv_cdf(p)) == pytest.approx(p, rel=1e-12)
+    assert inv_cdf(0.5) == 0.0
+    assert inv_cdf(0.975) == pytest.approx(1.959963984540054, rel=1e-15)
+
+    # Matches statistics.NormalDist where available (Python 3.8+)
+    try:
+        from statistics import NormalDist
+    except ImportError:
+        return
+    assert [inv_cdf(p) for p in ps] == [NormalDist().inv_cdf(p) for p in ps]
+
+
+def test_truncated_moments():
+    rrs = RepeatableRandomSequence(seed=1234)
+
+    # The mean of a standard normal truncated to [a, inf) is
+    # pdf(a) / (1 - cdf(a))
+    truncated = distributions.Truncated(distributions.Gaussian(), 4.0)
+    samples = truncated.samples(rrs, 5000)
+    expected = math.exp(-8.0) / math.sqrt(2.0 * math.pi) / \
+        (0.5 * math.erfc(4.0 / math.sqrt(2.0)))
+    assert sum(samples) / len(samples) == pytest.approx(expected, abs=0.01)
+
+    # Robert's method, far into the tail
+    truncated = distributions.Truncated(
+        distributions.Gaussian(), None, -45.0)
+    samples = truncated.samples(rrs, 5000)
+    assert sum(samples) / len(samples) == \
+        pytest.approx(-45.0 - 1.0 / 45.0, abs=0.002)
+
+    # A gamma distribution with alpha == 1 is exponential
+    truncated = distributions.Truncated(
+        distributions.Gamma(1.0, 2.0), 10.0, None)
+    samples = truncated.samples(rrs, 5000)
+    assert sum(samples) / len(samples) == pytest.approx(12.0, abs=0.1)
+
+
+def test_truncated_serialization():
+    truncated = distributions.Truncated(
+        distributions.Pareto(2.0), 1.5, 3.0)
+    as_dict = truncated.as_dict()
+    assert as_dict['dist'] == {'distribution': 'pareto', 'alpha': 2.0}
+    assert distributions.Truncated(as_dict['dist'], 1.5, 3.0) == truncated
+    assert distributions.Truncated(['pareto', 2.0], 1.5, 3.0) == truncated
+
+
+def test_truncated_invalid():
+    with pytest.raises(ValueError):
+        distributions.Truncated(distributions.Uniform(), 0.2, 0.4)
+    with pytest.raises(ValueError):
+        distributions.Truncated(distributions.Gaussian(), 1.0, 1.0)
+    with pytest.raises(ValueError):
+        distributions.Truncated(distributions.Exponential(1.0), None, -1.0)
+    with pytest.raises(ValueError):
+        distributions.Truncated(distributions.Pareto(1.0), None, 0.5)
+    with pytest.raises(ValueError):
+        distributions.Truncated(distributions.LogNormal(), -2.0, -1.0)
+    with pytest.raises(ValueError):
+        distributions.Truncated(distributions.Gamma(2.0, 1.0), None, 0.0)
+
+
+def test_empirical_from_data():
+    rrs = RepeatableRandomSequence(seed=1234)
+    data = [rrs.expovariate(1.0) for _ in range(20000)]
+    dist = distributions.Empirical(data=data, table_size=101)
+    assert len(dist.quantiles) == 101
+    assert dist.quantiles[0] == min(data)
+    assert dist.quantiles[-1] == max(data)
+    assert dist.quantile(0.5) == pytest.approx(math.log(2.0), abs=0.03)
+
+    samples = dist.samples(rrs, 20000)
+    low, high = min(data), max(data)
+    assert all(low <= x <= high for x in samples)
+    assert sum(samples) / len(samples) == pytest.approx(1.0, abs=0.03)
+
+    rrs.index = 20000
+    assert [dist.sample(rrs) for _ in range(20000)] == samples
+
+    # Quantiles interpolate between order statistics
+    dist = distributions.Empirical(data=[3.0, 1.0, 2.0], table_size=5)
+    assert dist.quantiles == [1.0, 1.5, 2.0, 2.5, 3.0]
+
+
+def test_empirical_from_cdf():
+    dist = distributions.Empirical(values=[0.0, 1.0, 3.0],
+                                   cdf=[0.0, 0.8, 1.0],
+                                   table_size=6)
+    assert dist.quantiles == pytest.approx([0.0, 0.25, 0.5, 0.75, 1.0, 3.0])
+    assert dist.quantile(0.9) == pytest.approx(2.0)
+
+    # The CDF is rescaled to span [0, 1]
+    assert distributions.Empirical(values=[0.0, 1.0, 3.0],
+                                   cdf=[2.0, 10.0, 12.0],
+                                   table_size=6) == dist
+
+
+def test_empirical_bytes():
+    dist = distributions.Empirical([-1.5, 0.0, 0.25, 1e100])
+    as_bytes = dist.as_bytes()
+    assert len(as_bytes) == 5 + 8 * 4
+    assert distributions.Empirical.from_bytes(as_bytes) == dist
+
+    with pytest.raises(ValueError):
+        distributions.Empirical.from_bytes(as_bytes[:-1])
+    with pytest.raises(ValueError):
+        distributions.Empirical.from_bytes(b'\x02' + as_bytes[1:])
+    with pytest.raises(ValueError):
+        distributions.Empirical.from_bytes(b'')
+
+
+def test_empirical_invalid():
+    with pytest.raises(ValueError):
+        distributions.Empirical()
+    with pytest.raises(ValueError):
+        distributions.Empirical([1.0, 2.0], data=[1.0, 2.0])
+    with pytest.raises(ValueError):
+        distributions.Empirical(values=[1.0, 2.0])
+    with pytest.raises(ValueError):
+        distributions.Empirical([1.0])
+    with pytest.raises(ValueError):
+        distributions.Empirical([2.0, 1.0])
+    with pytest.raises(ValueError):
+        distributions.Empirical(data=[])
+    with pytest.raises(ValueError):
+        distributions.Empirical(data=[1.0], table_size=1)
+    with pytest.raises(ValueError):
+        distributions.Empirical(values=[0.0, 1.0], cdf=[0.5, 0.5])
+    with pytest.raises(ValueError):
+        distributions.Empirical(values=[0.0, 1.0], cdf=[1.0, 0.0])
+    with pytest.raises(ValueError):
+        distributions.Empirical(values=[0.0, 1.0, 2.0], cdf=[0.0, 1.0])
+
+    dist = distributions.Empirical([1.0, 2.0])
+    with pytest.raises(ValueError):
+        dist.quantile(1.5)
+
+
+def test_mixture():
+    low = distributions.Uniform(0.0, 1.0)
+    high = distributions.Exponential(1.0)
+    dist = distributions.Mixture([low, high, low.as_dict()], [1.0, 3.0, 1.0])
+    assert dist.components == [low, high, low]
+
+    rrs = RepeatableRandomSequence(seed=1234)
+    samples = dist.samples(rrs, 10000)
+    assert sum(samples) / len(samples) == pytest.approx(0.8, abs=0.03)
+    below = sum(1 for x in samples if x < 1.0) / len(samples)
+    assert below == pytest.approx(0.4 + 0.6 * (1.0 - math.exp(-1.0)), abs=0.02)
+
+    # Batches select every component before sampling any
+    rrs.reset()
+    table = dist._table
+    indices = [table.sample(rrs.randrange, rrs.chance) for _ in range(100)]
+    by_component = {i: dist.components[i].samples(rrs, indices.count(i))
+                    for i in range(3)}
+    expected = [by_component[i].pop(0) for i in indices]
+    rrs.reset()
+    assert dist.samples_grouped(rrs, 100) == expected
+
+    # Single samples select a component, then sample it
+    rrs.reset()
+    expected = dist.components[table.sample(rrs.randrange, rrs.chance)] \
+        .sample(rrs)
+    rrs.reset()
+    assert dist.sample(rrs) == expected
+
+
+def test_mixture_invalid():
+    with pytest.raises(ValueError):
+        distributions.Mixture([])
+    with pytest.raises(ValueError):
+        distributions.Mixture([distributions.Gaussian()], [1.0, 2.0])
+    with pytest.raises(ValueError):
+        distributions.Mixture([distributions.Gaussian()], [-1.0])
+    with pytest.raises(ValueError):
+        distributions.Mixture([distributions.Gaussian()], [0.0])
+
+    dist = distributions.Mixture([distributions.Gaussian()] * 2)
+    assert dist.weights == [1.0, 1.0]
+
+
+def test_arithmetic():
+    gauss = distributions.Gaussian(1.0, 2.0)
+    expo = distributions.Exponential(3.0)
+    rrs = RepeatableRandomSequence(seed=1234)
+
+    cases = [
+        (gauss + expo, lambda a, b: a + b),
+        (gauss - expo, lambda a, b: a - b),
+        (gauss * expo, lambda a, b: a * b),
+        (gauss / expo, lambda a, b: a / b),
+    ]
+    for dist, func in cases:
+        assert isinstance(dist, distributions.Arithmetic)
+        rrs.reset()
+        expected = func(gauss.sample(rrs), expo.sample(rrs))
+        rrs.reset()
+        assert dist.sample(rrs) == expected
+
+    # Constants may appear on either side
+    rrs.reset()
+    expected = [10.0 - 2.0 * gauss.sample(rrs) for _ in range(5)]
+    rrs.reset()
+    assert [(10.0 - 2.0 * gauss).sample(rrs) for _ in range(5)] == expected
+    rrs.reset()
+    expected = [3 / expo.sample(rrs) for _ in range(5)]
+    rrs.reset()
+    assert [(3 / expo).sample(rrs) for _ in range(5)] == expected
+    rrs.reset()
+    expected = [-gauss.sample(rrs) for _ in range(5)]
+    rrs.reset()
+    assert [(-gauss).sample(rrs) for _ in range(5)] == expected
+
+    with pytest.raises(TypeError):
+        gauss + 'string'
+    with pytest.raises(ValueError):
+        distributions.Arithmetic('pow', gauss, 2.0)
+
+
+def test_expression_batches():
+    gauss = distributions.Gaussian(1.0, 2.0)
+    expo = distributions.Exponential(3.0)
+    dist = distributions.clip((gauss * 3.0 + expo).map('exp'), hi=100.0)
+    rrs = RepeatableRandomSequence(seed=1234)
+
+    # Grouped batches sample each leaf in a single batch, in
+    # expression order
+    left = [gauss.sample(rrs) for _ in range(50)]
+    right = [expo.sample(rrs) for _ in range(50)]
+    expected = [min(math.exp(a * 3.0 + b), 100.0)
+                for a, b in zip(left, right)]
+    rrs.reset()
+    assert dist.samples_grouped(rrs, 50) == expected
+
+    # Other batches evaluate one sample at a time
+    rrs.reset()
+    expected = []
+    for _ in range(50):
+        a = gauss.sample(rrs)
+        b = expo.sample(rrs)
+        expected.append(min(math.exp(a * 3.0 + b), 100.0))
+    rrs.reset()
+    assert dist.samples(rrs, 50) == expected
+    rrs.reset()
+    out = [None] * 50
+    dist.sample_into(rrs, out)
+    assert out == expected
+
+    samples = dist.samples(rrs, 1000)
+    assert max(samples) == 100.0
+    assert min(samples) > 0.0
+
+
+def test_expression_serialization():
+    dist = distributions.clip(
+        (distributions.Gaussian(0.0, 1.0) * 3 + 1).map(abs), 0.5, 2.0)
+    as_dict = dist.as_dict()
+    assert as_dict['dist']['func'] == 'abs'
+    assert as_dict['dist']['dist']['right'] == 1
+    assert distributions.distribution_from_dict(as_dict) == dist
+    assert distributions.distribution_from_list(dist.as_list()) == dist
+
+
+def test_map_functions():
+    dist = distributions.Uniform(1.0, 2.0)
+    with pytest.raises(ValueError):
+        dist.map('no_such_function')
+    with pytest.raises(ValueError):
+        dist.map(lambda x: x * x)
+
+    def square(x):
+        return x * x
+
+    distributions.register_function('test_square', square)
+    distributions.register_function('test_square', square)
+    with pytest.raises(ValueError):
+        distributions.register_function('test_square', abs)
+
+    mapped = dist.map(square)
+    assert mapped.func == 'test_square'
+    rrs = RepeatableRandomSequence(seed=1234)
+    expected = dist.sample(rrs) ** 2
+    rrs.reset()
+    assert mapped.sample(rrs) == expected
+
+    with pytest.raises(ValueError):
+        distributions.clip(dist, 2.0, 1.0)
+
+
+def _assert_bind_matches(dist, n=200):
+    rrs = RepeatableRandomSequence(seed=1234)
+    expected = [dist.sample(rrs) for _ in range(n)]
+    expected_index = rrs.index
+    rrs.reset()
+    bound = dist.bind(rrs)
+    assert [bound() for _ in range(n)] == expected
+    assert rrs.index == expected_index
+
+    rand = random.Random(1234)
+    expected = [dist.sample(rand) for _ in range(n)]
+    expected_state = rand.getstate()
+    rand.seed(1234)
+    bound = dist.bind(rand)
+    assert [bound() for _ in range(n)] == expected
+    assert rand.getstate() == expected_state
+
+
+def test_bind():
+    """Verify that bound samplers are identical to repeated calls
+    to sample()."""
+    for name, args in dist_args:
+        _assert_bind_matches(dist_lookup[name](**args))
+
+
+@pytest.mark.parametrize('dist', [
+    distributions.Gamma(0.4, 2.0),
+    distributions.Gamma(1.0, 2.0),
+    distributions.VonMises(1.0, 1e-7),
+    distributions.Triangular(2.0, 2.0, 2.0),
+    distributions.Geometric(1.0),
+    distributions.Geometric(0.0, include_zero=True),
+    distributions.Geometric(1e6, include_zero=True)
+])
+def test_bind_special_cases(dist):
+    _assert_bind_matches(dist)
+
+
+def test_samples_and_sample_into():
+    """Verify that batches are identical to repeated calls
+    to sample()."""
+    for name, args in dist_args:
+        dist = dist_lookup[name](**args)
+        for rand in (RepeatableRandomSequence(seed=1234), random.Random(1234)):
+            state = rand.getstate()
+            expected = [dist.sample(rand) for _ in range(100)]
+            expected_state = rand.getstate()
+
+            if not isinstance(dist, (distributions.WeightedCategorical,
+                                     distributions.UniformCategorical)):
+                rand.setstate(state)
+                assert dist.samples(rand, 100) == expected
+                assert rand.getstate() == expected_state
+
+            rand.setstate(state)
+            out = [None] * 100
+            dist.sample_into(rand, out)
+            assert out == expected
+            assert rand.getstate() == expected_state
+
+
+def test_sample_into_array():
+    rrs = RepeatableRandomSequence(seed=1234)
+    dist = distributions.Gaussian(1.0, 2.0)
+    expected = [dist.sample(rrs) for _ in range(20)]
+    rrs.reset()
+    out = array('d', bytes(8 * 20))
+    dist.sample_into(rrs, out)
+    assert out.tolist() == expected
+
+    dist = distributions.Poisson(4.0)
+    expected = [dist.sample(rrs) for _ in range(20)]
+    rrs.reset()
+    rrs.index = 20
+    out = array('q', bytes(8 * 20))
+    with memoryview(out) as view:
+        dist.sample_into(rrs, view)
+    assert out.tolist() == expected
+
+
+def test_samples_in_cascade():
+    rrs = RepeatableRandomSequence(seed=1234)
+    for dist in (distributions.Uniform(2.0, 3.0), distributions.Bernoulli(0.3),
+                 distributions.Empirical([0.0, 1.0, 4.0])):
+        rrs.reset()
+        with rrs.cascade():
+            expected = [dist.sample(rrs) for _ in range(10)]
+        rrs.reset()
+        with rrs.cascade():
+            assert dist.samples(rrs, 10) == expected
+        assert rrs.index == 1
+
+
+@pytest.mark.parametrize('cls,params', [
+    (distributions.Uniform, {'min_val': [0.0, 2.0, 5.0, -1.0],
+                             'max_val': [1.0, 1.0, 9.0, 4.0]}),
+    (distributions.DiscreteUniform, {'min_val': [0, 10, -5, 3],
+                                     'max_val': 20}),
+    (distributions.Gamma, {'alpha': [0.5, 1.0, 3.4, 9.0], 'beta': 2.0}),
+    (distributions.LogNormal, {'mu': 0.5, 'sigma': [0.1, 0.2, 1.0, 3.0]}),
+    (distributions.Exponential, {'lambd': array('d', [0.5, 1.0, 2.0, 8.0])}),
+    (distributions.VonMises, {'mu': [0.0, 1.0, 2.0, 3.0], 'kappa': 4.0}),
+    (distributions.Beta, {'alpha': [0.5, 1.0, 2.0, 3.0],
+                          'beta': [1.0, 2.0, 0.5, 3.0]}),
+    (distributions.Pareto, {'alpha': [0.5, 1.0, 2.0, 3.0]}),
+    (distributions.Weibull, {'alpha': [0.5, 1.0, 2.0, 3.0],
+                             'beta': [1.0, 2.0, 0.5, 3.0]}),
+    (distributions.Gaussian, {'mu': [0.0, 1.0, -2.0, 30.0],
+                              'sigma': [1.0, 0.5, 2.0, 0.0]}),
+    (distributions.Bernoulli, {'p': [0.0, 0.25, 0.5, 1.0]}),
+    (distributions.Binomial, {'n': [1, 10, 100, 1000], 'p': 0.3})
+])
+def test_sample_broadcast(cls, params):
+    """Verify that broadcast samples are identical to sampling from
+    each element's distribution in turn."""
+    count = max(len(x) for x in params.values() if hasattr(x, '__len__'))
+    columns = {key: value if hasattr(value, '__len__') else [value] * count
+               for key, value in params.items()}
+    dists = [cls(**{key: value[i] for key, value in columns.items()})
+             for i in range(count)]
+
+    for rand in (RepeatableRandomSequence(seed=1234), random.Random(1234)):
+        state = rand.getstate()
+        expected = [dist.sample(rand) for dist in dists]
+        expected_state = rand.getstate()
+        rand.setstate(state)
+        assert cls.sample_broadcast(rand, **params) == expected
+        assert rand.getstate() == expected_state
+
+
+def test_sample_broadcast_invalid():
+    rrs = RepeatableRandomSequence(seed=1234)
+    with pytest.raises(ValueError):
+        distributions.Gaussian.sample_broadcast(rrs, [1.0, 2.0], [1.0])
+    with pytest.raises(ValueError):
+        distributions.Gaussian.sample_broadcast(rrs, 1.0, 2.0)
+    with pytest.raises(ValueError):
+        distributions.Binomial.sample_broadcast(rrs, [1, 2], 1.5)
+    assert distributions.Exponential.sample_broadcast(rrs, []) == []
+
+
+def test_gaussian_samples_in_cascade():
+    rrs = RepeatableRandomSequence(seed=1234)
+    dist = distributions.Gaussian(1.0, 2.0)
+    with rrs.cascade():
+        expected = [dist.sample(rrs) for _ in range(10)]
+    rrs.reset()
+    with rrs.cascade():
+        assert dist.samples(rrs, 5) == expected[:5]
+        assert distributions.Gaussian.sample_broadcast(
+            rrs, [1.0] * 5, 2.0) == expected[5:]
+    assert rrs.index == 1
@@ -0,0 +1,81 @@
+import statistics
+
+import pytest
+
+from samplespace import montecarlo
+
+
+def gauss_trial(rrs):
+    return rrs.gauss(2.0, 3.0)
+
+
+def pair_trial(rrs):
+    return {'x': rrs.random(), 'y': rrs.expovariate(2.0)}
+
+
+def make_accumulators():
+    return {
+        'mean': montecarlo.Mean(),
+        'variance': montecarlo.Variance(),
+        'histogram': montecarlo.Histogram(-10.0, 10.0, 8)
+    }
+
+
+def test_reproducible():
+    """Verifies that results are identical regardless of the number of
+    workers."""
+    expected = montecarlo.run(gauss_trial, 1000, make_accumulators(),
+                              seed=1234, max_workers=1, block_size=64)
+    actual = montecarlo.run(gauss_trial, 1000, make_accumulators(),
+                            seed=1234, max_workers=3, block_size=64)
+    assert actual == expected
+
+    different = montecarlo.run(gauss_trial, 1000, make_accumulators(),
+                               seed=4321, max_workers=1, block_size=64)
+    assert different != expected
+
+
+def test_trial_sequences():
+    values = [gauss_trial(montecarlo.trial_sequence('root', i))
+              for i in range(100)]
+    result = montecarlo.run(gauss_trial, 100, make_accumulators(),
+                            seed='root', max_workers=1, block_size=7)
+
+    assert result['mean'].count == 100
+    assert result['mean'].mean == pytest.approx(statistics.mean(values))
+    assert result['variance'].mean == pytest.approx(statistics.mean(values))
+    assert result['variance'].variance == pytest.approx(statistics.variance(values))
+    assert result['variance'].stdev == pytest.approx(statistics.stdev(values))
+
+    histogram = result['histogram']
+    assert sum(histogram.counts) + histogram.underflow + histogram.overflow == 100
+    assert histogram.counts[0] == sum(1 for x in values if -10.0 <= x < -7.5)
+
+
+def test_fields():
+    result = montecarlo.run(
+        pair_trial, 200,
+        {'x': montecarlo.Mean(field='x'), 'y': montecarlo.Mean(field='y')},
+        max_workers=1)
+    assert 0.0 < result['x'].mean < 1.0
+    assert result['y'].mean == pytest.approx(0.5, abs=0.15)
+
+
+def test_empty_accumulators():
+    result = montecarlo.run(gauss_trial, 0, make_accumulators())
+    assert result == make_accumulators()
+    assert result['variance'].variance != result['variance'].variance
+
+
+def test_args():
+    with pytest.raises(ValueError):
+        montecarlo.run(gauss_trial, -1, {})
+
+    with pytest.raises(ValueError):
+        montecarlo.run(gauss_trial, 10, {}, block_size=0)
+
+    with pytest.raises(ValueError):
+        montecarlo.Histogram(1.0, 0.0, 4)
+
+    with pytest.raises(ValueError):
+        montecarlo.Histogram(0.0, 1.0, 4).merge(montecarlo.Histogram(0.0, 1.0, 5))
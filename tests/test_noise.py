@@ -0,0 +1,151 @@
+import itertools
+
+import pytest
+
+from samplespace import RepeatableRandomSequence
+from samplespace import noise
+from samplespace.repeatablerandom import _BLOCK_FUNCTIONS
+
+noise_types = [noise.ValueNoise, noise.PerlinNoise, noise.SimplexNoise]
+
+
+def sample_points(dimensions, count=200):
+    rrs = RepeatableRandomSequence('points')
+    return [tuple(rrs.uniform(-20.0, 20.0) for _ in range(dimensions))
+            for _ in range(count)]
+
+
+@pytest.mark.parametrize('noise_type', noise_types)
+@pytest.mark.parametrize('dimensions', [1, 2, 3, 4])
+def test_noise_range(noise_type, dimensions):
+    n = noise_type(RepeatableRandomSequence(123456), dimensions)
+    assert n.dimensions == dimensions
+    values = n.evaluate(sample_points(dimensions))
+    assert all(-1.0 <= x <= 1.0 for x in values)
+    assert len(set(values)) > 100
+
+
+@pytest.mark.parametrize('noise_type', noise_types)
+def test_noise_repeatable(noise_type):
+    points = sample_points(3)
+    rrs = RepeatableRandomSequence(123456)
+    expected = noise_type(rrs, 3).evaluate(points)
+
+    # Noise depends only on the seed, not the sequence's index
+    rrs.random()
+    assert noise_type(rrs, 3).evaluate(points) == expected
+    assert rrs.index == 1
+
+    # Each point's value is independent of the other points evaluated
+    assert [noise_type(rrs, 3).at(*p) for p in reversed(points)] == \
+        list(reversed(expected))
+
+    other = noise_type(RepeatableRandomSequence(654321), 3)
+    assert other.evaluate(points) != expected
+
+
+@pytest.mark.parametrize('noise_type', noise_types)
+def test_noise_continuous(noise_type):
+    n = noise_type(RepeatableRandomSequence(123456), 2)
+    for x, y in sample_points(2, 50):
+        assert abs(n.at(x, y) - n.at(x + 1e-6, y - 1e-6)) < 1e-4
+
+
+@pytest.mark.parametrize('backend', sorted(_BLOCK_FUNCTIONS))
+def test_value_noise_lattice(backend):
+    rrs = RepeatableRandomSequence(123456, backend=backend)
+    n = noise.ValueNoise(rrs, 2)
+    for x, y in [(0, 0), (3, -7), (-12, 5)]:
+        expected = (rrs.block_at(x, y) >> 11) * 2.0 ** -52 - 1.0
+        assert n.at(x, y) == expected
+
+
+def test_perlin_noise_lattice():
+    n = noise.PerlinNoise(RepeatableRandomSequence(123456), 3)
+    for point in [(0, 0, 0), (3, -7, 2), (-12, 5, 100)]:
+        assert n.at(*point) == 0.0
+
+
+@pytest.mark.parametrize('noise_type', noise_types)
+def test_noise_grid(noise_type):
+    n = noise_type(RepeatableRandomSequence(123456), 3)
+    grid = n.grid((4, 3, 2), origin=(-1.5, 2.0, 0.25), step=0.5)
+    assert len(grid) == 4
+    assert all(len(row) == 3 for row in grid)
+    assert all(len(col) == 2 for row in grid for col in row)
+    for i in range(4):
+        for j in range(3):
+            for k in range(2):
+                assert grid[i][j][k] == n.at(-1.5 + i * 0.5,
+                                             2.0 + j * 0.5,
+                                             0.25 + k * 0.5)
+
+    assert n.grid((2, 2, 2)) == n.grid((2, 2, 2), origin=(0.0, 0.0, 0.0))
+
+
+@pytest.mark.parametrize('noise_type', noise_types)
+@pytest.mark.parametrize('dimensions', [1, 2, 4])
+def test_noise_rows(noise_type, dimensions):
+    n = noise_type(RepeatableRandomSequence(123456), dimensions)
+    shape = (3,) * (dimensions - 1) + (9,)
+    origin = (4.75,) * dimensions
+    rows = list(n.rows(shape, origin, step=-0.7))
+    assert len(rows) == 3 ** (dimensions - 1)
+    for index, row in zip(itertools.product(range(3), repeat=dimensions - 1),
+                          rows):
+        assert row == [n.at(*(4.75 - i * 0.7 for i in index + (j,)))
+                       for j in range(9)]
+
+    grid = n.grid(shape, origin, step=-0.7)
+    for _ in range(dimensions - 2):
+        grid = [row for block in grid for row in block]
+    assert grid == (rows[0] if dimensions == 1 else rows)
+
+
+def test_noise_grid_empty():
+    n = noise.ValueNoise(RepeatableRandomSequence(123456), 3)
+    assert n.grid((2, 0, 3)) == [[], []]
+    assert n.grid((0, 2, 3)) == []
+    assert n.grid((2, 3, 0)) == [[[], [], []], [[], [], []]]
+    assert list(n.rows((2, 0, 3))) == []
+    assert list(n.rows((2, 1, 0))) == [[], []]
+
+    n = noise.PerlinNoise(RepeatableRandomSequence(123456), 4)
+    assert n.grid((2, 2, 0, 3)) == [[[], []], [[], []]]
+    assert noise.SimplexNoise(RepeatableRandomSequence(), 1).grid((0,)) == []
+
+
+def test_fractal():
+    rrs = RepeatableRandomSequence(123456)
+    fbm = noise.Fractal(noise.PerlinNoise, rrs, dimensions=2, octaves=3)
+    octaves = [noise.PerlinNoise(rrs.derive('octave', i), 2) for i in range(3)]
+
+    for x, y in sample_points(2, 20):
+        expected = (octaves[0].at(x, y)
+                    + octaves[1].at(2.0 * x, 2.0 * y) * 0.5
+                    + octaves[2].at(4.0 * x, 4.0 * y) * 0.25) / 1.75
+        assert fbm.at(x, y) == pytest.approx(expected)
+
+    assert fbm.grid((3, 4), step=0.3)[2][1] == fbm.at(0.6, 0.3)
+    assert list(fbm.rows((3, 4), step=0.3))[1] == \
+        [fbm.at(0.3, 0.3 * j) for j in range(4)]
+
+
+def test_noise_invalid():
+    rrs = RepeatableRandomSequence(123456)
+    with pytest.raises(ValueError):
+        noise.PerlinNoise(rrs, 0)
+    with pytest.raises(ValueError):
+        noise.SimplexNoise(rrs, 5)
+    with pytest.raises(ValueError):
+        noise.Fractal(noise.ValueNoise, rrs, octaves=0)
+
+    n = noise.PerlinNoise(rrs, 2)
+    with pytest.raises(ValueError):
+        n.at(1.0)
+    with pytest.raises(ValueError):
+        n.evaluate([(1.0, 2.0), (1.0, 2.0, 3.0)])
+    with pytest.raises(ValueError):
+        n.grid((2, 2, 2))
+    with pytest.raises(ValueError):
+        n.grid((2, 2), origin=(0.0,))
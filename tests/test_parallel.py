@@ -0,0 +1,147 @@
+from array import array
+
+import pytest
+
+from samplespace import RepeatableRandomSequence
+from samplespace import parallel
+from samplespace.parallel import ParallelGenerator
+from samplespace.repeatablerandom import _BLOCK_FUNCTIONS
+
+
+requires_shared_memory = pytest.mark.skipif(
+    parallel.shared_memory is None,
+    reason='The process backend requires Python 3.8 or later.')
+
+
+@pytest.fixture(scope='module', params=[
+    pytest.param('process', marks=requires_shared_memory), 'thread'])
+def generators(request):
+    with ParallelGenerator(max_workers=1, chunk_size=1000) as single, \
+            ParallelGenerator(max_workers=3, chunk_size=333,
+                              backend=request.param) as multi:
+        yield single, multi
+
+
+def test_matches_single_process(generators):
+    """Verifies that output is identical regardless of the number of
+    workers and the chunk size."""
+    single, multi = generators
+    rrs = RepeatableRandomSequence(seed=1234)
+    for method in ('fill_floats', 'fill_ints', 'fill_bytes'):
+        for count in (0, 1, 7, 8, 9, 4321):
+            rrs.reset()
+            expected = getattr(single, method)(rrs, count)
+            assert rrs.index == 1
+
+            rrs.reset()
+            actual = getattr(multi, method)(rrs, count)
+            assert rrs.index == 1
+
+            assert actual == expected
+            assert len(actual) == count
+
+
+@pytest.mark.parametrize('backend', sorted(_BLOCK_FUNCTIONS))
+def test_matches_counter_mode(generators, backend):
+    single, multi = generators
+    rrs = RepeatableRandomSequence(seed='bytes', backend=backend)
+    expected = rrs.randbytes(2503, mode='counter')
+
+    rrs.reset()
+    assert bytes(multi.fill_bytes(rrs, 2503)) == expected
+
+    # Integers and bytes are drawn from the same blocks
+    rrs.reset()
+    ints = single.fill_ints(rrs, 3)
+    assert b''.join(x.to_bytes(8, 'little') for x in ints) == expected[:24]
+
+    rrs.reset()
+    floats = single.fill_floats(rrs, 3)
+    assert list(floats) == [(x >> 11) / (1 << 53) for x in ints]
+
+
+def test_fill_into_buffer(generators):
+    """Verifies that fills may write directly into the
+    caller's buffer."""
+    single, multi = generators
+    rrs = RepeatableRandomSequence(seed=1234)
+    expected = single.fill_floats(rrs, 1000)
+
+    rrs.reset()
+    out = array('d', [0.0]) * 1000
+    assert multi.fill_floats(rrs, 1000, out=out) is out
+    assert out == expected
+    assert rrs.index == 1
+
+    # Byte buffers are reinterpreted as items of the appropriate type
+    rrs.reset()
+    out = bytearray(8000)
+    with memoryview(out) as view:
+        multi.fill_floats(rrs, 1000, out=view)
+    assert out == expected.tobytes()
+
+    rrs.reset()
+    out = bytearray(2503)
+    multi.fill_bytes(rrs, 2503, out=out)
+    rrs.reset()
+    assert out == rrs.randbytes(2503, mode='counter')
+
+    with pytest.raises(ValueError):
+        multi.fill_ints(rrs, 10, out=array('Q', [0]) * 9)
+    with pytest.raises(ValueError):
+        multi.fill_bytes(rrs, 10, out=bytes(10))
+
+
+def test_report(generators):
+    _, multi = generators
+    rrs = RepeatableRandomSequence()
+    multi.fill_floats(rrs, 1000)
+    report = multi.last_report
+    assert report.kind == 'floats'
+    assert report.count == 1000
+    assert report.num_bytes == 8000
+    assert report.num_chunks == 4
+    assert report.items_per_second > 0.0
+
+
+def test_tune_chunk_size():
+    with ParallelGenerator(max_workers=1) as gen:
+        reports = gen.tune_chunk_size('ints', count=1000, candidates=(100, 500))
+        assert [x.chunk_size for x in reports] == [100, 500]
+        assert gen.chunk_size in (100, 500)
+
+
+def test_args(generators):
+    single, _ = generators
+    rrs = RepeatableRandomSequence()
+
+    with pytest.raises(ValueError):
+        single.fill_floats(rrs, -1)
+
+    with pytest.raises(ValueError):
+        ParallelGenerator(max_workers=1, chunk_size=0)
+
+    with pytest.raises(ValueError):
+        ParallelGenerator(max_workers=1, backend='cluster')
+
+
+def test_thread_count_independence():
+    rrs = RepeatableRandomSequence(seed=98765)
+    results = []
+    for workers in (1, 2, 5):
+        with ParallelGenerator(max_workers=workers, chunk_size=100,
+                               backend='thread') as gen:
+            rrs.reset()
+            results.append(gen.fill_floats(rrs, 1234))
+    assert results[0] == results[1] == results[2]
+
+
+@pytest.mark.skipif(parallel.shared_memory is not None,
+                    reason='Shared memory is available.')
+def test_process_backend_unavailable():
+    with pytest.raises(RuntimeError):
+        ParallelGenerator(max_workers=2, backend='process')
+
+    # A single worker does not need shared memory
+    with ParallelGenerator(max_workers=1, backend='process') as gen:
+        assert len(gen.fill_bytes(RepeatableRandomSequence(), 10)) == 10
@@ -37,6 +37,25 @@ def test_serialize_rrs():
     assert actual == expected
 
 
+def test_serialize_rrs_backend():
+    """Verifies that an RRS's block backend survives serialization."""
+    for backend in repeatablerandom._BLOCK_FUNCTIONS:
+        rrs = repeatablerandom.RepeatableRandomSequence(seed=12345, backend=backend)
+        rrs_as_yaml = yaml.dump(rrs)
+        expected = rrs.getnextblock()
+
+        new_rrs = yaml.load(rrs_as_yaml, Loader=yaml.FullLoader)
+        assert new_rrs.backend == backend
+        assert new_rrs.getnextblock() == expected
+
+    # Sequences serialized without a backend use xxh64
+    old_yaml = '!samplespace.rrs\ncounter_version: 1\n' \
+               'hash_input: s1enBV+SSXk=\nindex: 5\nseed: 678\n'
+    rrs = yaml.load(old_yaml, Loader=yaml.FullLoader)
+    assert rrs.backend == 'xxh64'
+    assert [rrs.randrange(10) for _ in range(5)] == [0, 5, 1, 3, 9]
+
+
 def test_serialize_rrs_state():
     """Verifies that RRS states serialize to YAML correctly."""
     rrs = repeatablerandom.RepeatableRandomSequence(seed=12345)
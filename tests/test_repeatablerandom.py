@@ -1,4 +1,7 @@
 import json
+import pickle
+from decimal import Decimal
+from fractions import Fraction
 
 import pytest
 
@@ -9,6 +12,10 @@ DATA_FILE = 'data.json'
 with open(DATA_FILE, 'r') as f:
     test_data = json.load(f)
 
+requires_xxh3 = pytest.mark.skipif(
+    'xxh3_64' not in samplespace.repeatablerandom._BLOCK_FUNCTIONS,
+    reason='The xxh3_64 backend requires xxhash 2.0 or later.')
+
 
 class PatchedRRS(samplespace.RepeatableRandomSequence):
     __slots__ = ('_seed', '_hash_input', '_index', '_cascading', 'index_list')
@@ -149,6 +156,27 @@ def test_cascade_indices():
     assert rrs.index_list == [start_index + 1]
 
 
+def test_random_matches_blocks():
+    rrs = samplespace.RepeatableRandomSequence(seed=1234)
+    for start in (0, 5, 2 ** 40):
+        rrs.index = start
+        blocks = [rrs.getnextblock() for _ in range(10)]
+        rrs.index = start
+        assert [rrs.random() for _ in range(10)] == \
+            [(x >> 11) * 2.0 ** -53 for x in blocks]
+        assert rrs.index == start + 10
+
+    # Cascaded values continue to feed forward
+    rrs.reset()
+    with rrs.cascade():
+        blocks = [rrs.getnextblock() for _ in range(10)]
+    rrs.reset()
+    with rrs.cascade():
+        assert [rrs.random() for _ in range(10)] == \
+            [(x >> 11) * 2.0 ** -53 for x in blocks]
+    assert rrs.index == 1
+
+
 def test_reset():
     rrs = samplespace.RepeatableRandomSequence(seed='abcdef')
     run1 = [rrs.getnextblock() for _ in range(256)]
@@ -196,6 +224,42 @@ def test_getrandbits():
     assert rrs._index == start_index + 1
 
 
+def test_large_getrandbits_expected_values():
+    rrs = samplespace.RepeatableRandomSequence(seed=123456)
+    actual = [rrs.getrandbits(k) for k in (65, 128, 150, 4096, 4097)]
+    expected = [int(x) for x in test_data['bits-k65-k128-k150-k4096-k4097-seed123456-index0']]
+    assert actual == expected
+
+    limits = [2 ** 64, 2 ** 64 + 1, 3 ** 100, 2 ** 4096 - 12345, 10 ** 1300 + 7]
+    actual = [rrs.randrange(limit) for limit in limits]
+    expected = [int(x) for x in test_data['randbelow-large-seed123456-index5-n5']]
+    assert actual == expected
+
+
+@pytest.mark.parametrize('mode', ['cascade', 'counter'])
+def test_getrandbits_bytes(mode):
+    rrs = samplespace.RepeatableRandomSequence(seed=1234)
+    for k in (-1, 0, 1, 7, 8, 9, 63, 64, 65, 127, 128, 129, 4095, 4096, 4097):
+        start_index = rrs.index
+        expected = rrs.getrandbits(k, mode=mode)
+        assert rrs.index == start_index + 1
+
+        rrs.index = start_index
+        actual = rrs.getrandbits_bytes(k, mode=mode)
+        assert rrs.index == start_index + 1
+        assert actual == expected.to_bytes((max(k, 0) + 7) // 8, 'big')
+
+    # Within a cascade, both methods feed forward identically
+    rrs.reset()
+    with rrs.cascade():
+        rrs.getrandbits(200, mode=mode)
+        expected = rrs.getnextblock()
+    rrs.reset()
+    with rrs.cascade():
+        rrs.getrandbits_bytes(200, mode=mode)
+        assert rrs.getnextblock() == expected
+
+
 def test_distinct_seeds():
     rrs = samplespace.RepeatableRandomSequence(seed='abcdef')
     run1 = [rrs.getnextblock() for _ in range(256)]
@@ -299,6 +363,59 @@ def test_randint():
 
 
 # noinspection PyTypeChecker
+@pytest.mark.parametrize('a, b', [
+    (0, 0), (0, 1), (-5, 5), (1, 6), (0, 2 ** 63), (0, 2 ** 64 - 1),
+    (0, 2 ** 64), (10, 3 ** 50), (0, 2 ** 200 - 1)])
+def test_range_sampler(a, b):
+    rrs = samplespace.RepeatableRandomSequence(seed='range')
+    sampler = rrs.range_sampler(a, b)
+    assert (sampler.a, sampler.b, sampler.rrs) == (a, b, rrs)
+
+    expected = [rrs.randint(a, b) for _ in range(200)]
+    end_index = rrs.index
+
+    rrs.reset()
+    assert [sampler.draw() for _ in range(200)] == expected
+    assert rrs.index == end_index
+
+    rrs.reset()
+    assert sampler.draw_many(150) + sampler.draw_many(50) == expected
+    assert rrs.index == end_index
+
+    # Within a cascade, draws feed forward like randint()
+    rrs.reset()
+    with rrs.cascade():
+        expected = [rrs.randint(a, b) for _ in range(20)]
+        expected_block = rrs.getnextblock()
+    rrs.reset()
+    with rrs.cascade():
+        assert [sampler.draw() for _ in range(10)] + \
+            sampler.draw_many(10) == expected
+        assert rrs.getnextblock() == expected_block
+
+    # Samplers are picklable along with their sequence
+    rrs.reset()
+    copied = pickle.loads(pickle.dumps(sampler))
+    assert (copied.a, copied.b) == (a, b)
+    assert copied.draw_many(10) == \
+        [rrs.randint(a, b) for _ in range(10)]
+
+
+def test_range_sampler_rejection():
+    # A range of 2^63 + 1 rejects nearly half of all blocks
+    rrs = samplespace.RepeatableRandomSequence(seed=1234)
+    a, b = 7, 2 ** 63 + 7
+    expected = [rrs.randint(a, b) for _ in range(100)]
+    rrs.reset()
+    assert rrs.range_sampler(a, b).draw_many(100) == expected
+
+    with pytest.raises(ValueError):
+        rrs.range_sampler(5, 4)
+
+    with pytest.raises(TypeError):
+        rrs.range_sampler(0, 2.5)
+
+
 def test_randrange_args():
     rrs = samplespace.RepeatableRandomSequence()
 
@@ -422,3 +539,453 @@ def test_randbelow_args():
 
     with pytest.raises(ValueError):
         rrs._randbelow(0)
+
+
+def test_binomial_expected_sequence():
+    rrs = samplespace.RepeatableRandomSequence(seed=123456)
+
+    # Small n * p, sampled by inversion
+    actual = [rrs.binomialvariate(20, 0.3) for _ in range(5)]
+    expected = test_data['binomial-n20-p0.3-seed123456-index0-n5']
+    assert actual == expected
+
+    # Large n * p, sampled by transformed rejection
+    actual = [rrs.binomialvariate(1000000, 0.25) for _ in range(5)]
+    expected = test_data['binomial-n1000000-p0.25-seed123456-index5-n5']
+    assert actual == expected
+    assert rrs.index == 10
+
+
+@pytest.mark.parametrize('n,p', [(20, 0.3), (40, 0.95), (1000, 0.5),
+                                 (10 ** 9, 0.001)])
+def test_binomial_moments(n, p):
+    rrs = samplespace.RepeatableRandomSequence(seed=1234)
+    samples = [rrs.binomialvariate(n, p) for _ in range(10000)]
+    assert all(0 <= x <= n for x in samples)
+
+    mean = sum(samples) / len(samples)
+    variance = sum((x - mean) ** 2 for x in samples) / (len(samples) - 1)
+    assert mean == pytest.approx(n * p, rel=0.01)
+    assert variance == pytest.approx(n * p * (1.0 - p), rel=0.05)
+
+
+def test_binomial_args():
+    rrs = samplespace.RepeatableRandomSequence()
+
+    assert rrs.binomialvariate(0, 0.5) == 0
+    assert rrs.binomialvariate(10, 0.0) == 0
+    assert rrs.binomialvariate(10, 1.0) == 10
+    assert rrs.index == 3
+
+    with pytest.raises(ValueError):
+        rrs.binomialvariate(-1, 0.5)
+    with pytest.raises(ValueError):
+        rrs.binomialvariate(1.5, 0.5)
+    with pytest.raises(ValueError):
+        rrs.binomialvariate(10, -0.1)
+    with pytest.raises(ValueError):
+        rrs.binomialvariate(10, 1.1)
+
+
+def test_poisson_expected_sequence():
+    rrs = samplespace.RepeatableRandomSequence(seed=123456)
+
+    # Small mean, sampled by inversion
+    actual = [rrs.poissonvariate(3.5) for _ in range(5)]
+    expected = test_data['poisson-lam3.5-seed123456-index0-n5']
+    assert actual == expected
+
+    # Large mean, sampled by transformed rejection
+    actual = [rrs.poissonvariate(10000.0) for _ in range(5)]
+    expected = test_data['poisson-lam10000-seed123456-index5-n5']
+    assert actual == expected
+    assert rrs.index == 10
+
+
+@pytest.mark.parametrize('lam', [0.2, 4.0, 9.99, 10.0, 250.0, 1e7])
+def test_poisson_moments(lam):
+    rrs = samplespace.RepeatableRandomSequence(seed=1234)
+    samples = [rrs.poissonvariate(lam) for _ in range(10000)]
+    assert all(x >= 0 for x in samples)
+
+    mean = sum(samples) / len(samples)
+    variance = sum((x - mean) ** 2 for x in samples) / (len(samples) - 1)
+    assert mean == pytest.approx(lam, rel=0.05)
+    assert variance == pytest.approx(lam, rel=0.05)
+
+
+def test_poisson_args():
+    rrs = samplespace.RepeatableRandomSequence()
+
+    assert rrs.poissonvariate(0.0) == 0
+    assert rrs.index == 1
+
+    with pytest.raises(ValueError):
+        rrs.poissonvariate(-1.0)
+
+
+def test_counter_mode_expected_sequence():
+    rrs = samplespace.RepeatableRandomSequence(seed=123456)
+
+    actual = rrs.randbytes(20, mode='counter')
+    expected = bytes(test_data['bytes-counter-len20-seed123456-index0'])
+    assert actual == expected
+
+    actual = rrs.getrandbits(150, mode='counter')
+    expected = int(test_data['bits-counter-k150-seed123456-index1'])
+    assert actual == expected
+
+    actual = [rrs.uniformproduct(4, mode='counter') for _ in range(3)]
+    expected = test_data['uniformproduct-counter-n4-seed123456-index2-n3']
+    assert actual == expected
+
+
+# noinspection PyProtectedMember
+def test_counter_mode_indices():
+    rrs = PatchedRRS(seed=1234)
+
+    # Counter mode draws advance the index exactly once
+    rrs.index_list.clear()
+    start_index = rrs.index
+    rrs.randbytes(1000, mode='counter')
+    assert rrs.index_list == [start_index]
+    assert rrs.index == start_index + 1
+
+    # Within a cascade, counter mode draws feed forward like a
+    # single block
+    rrs.reset()
+    with rrs.cascade():
+        rrs.getrandbits(256, mode='counter')
+        expected = rrs.getnextblock()
+
+    rrs.reset()
+    with rrs.cascade():
+        rrs.getnextblock()
+        actual = rrs.getnextblock()
+
+    assert actual == expected
+
+
+def test_counter_mode_ranges():
+    rrs = samplespace.RepeatableRandomSequence(seed='counter')
+
+    # Shorter draws are prefixes of longer draws at the same index
+    long_bytes = rrs.randbytes(1003, mode='counter')
+    rrs.reset()
+    short_bytes = rrs.randbytes(17, mode='counter')
+    assert long_bytes[:17] == short_bytes
+
+    rrs.reset()
+    assert rrs.getrandbits(0, mode='counter') == 0
+    assert rrs.index == 1
+    assert all(0 <= rrs.getrandbits(70, mode='counter') < 2 ** 70
+               for _ in range(100))
+
+    # Counter mode is distinct from cascade mode
+    rrs.reset()
+    cascaded = rrs.randbytes(64)
+    rrs.reset()
+    assert rrs.randbytes(64, mode='counter') != cascaded
+
+    with pytest.raises(ValueError):
+        rrs.randbytes(10, mode='parallel')
+
+
+def test_counter_mode_version():
+    rrs = samplespace.RepeatableRandomSequence(seed=12345)
+    state = rrs.getstate()
+    assert state.as_dict()['counter_version'] == rrs.COUNTER_MODE_VERSION
+
+    # States serialized without a version are treated as version 1
+    state_as_dict = state.as_dict()
+    del state_as_dict['counter_version']
+    assert samplespace.repeatablerandom.RepeatableRandomSequenceState.from_dict(state_as_dict) == state
+
+    state_as_dict['counter_version'] = rrs.COUNTER_MODE_VERSION + 1
+    new_state = samplespace.repeatablerandom.RepeatableRandomSequenceState.from_dict(state_as_dict)
+    with pytest.raises(ValueError):
+        rrs.setstate(new_state)
+
+
+@requires_xxh3
+def test_backend_expected_sequence():
+    rrs = samplespace.RepeatableRandomSequence(seed=123456, backend='xxh3_64')
+    assert rrs.backend == 'xxh3_64'
+
+    actual = [rrs.getnextblock() for _ in range(10)]
+    expected = test_data['raw-xxh3_64-seed123456-index0-n10']
+    assert actual == expected
+
+    actual = [rrs.random() for _ in range(10)]
+    expected = test_data['double-xxh3_64-seed123456-index10-n10']
+    assert actual == expected
+
+    with rrs.cascade():
+        actual = [rrs.random() for _ in range(5)]
+    expected = test_data['doubles-xxh3_64-len5-seed123456-index20']
+    assert actual == expected
+
+    actual = rrs.randbytes(20, mode='counter')
+    expected = bytes(test_data['bytes-counter-xxh3_64-len20-seed123456-index21'])
+    assert actual == expected
+
+    actual = [rrs.block_at(3, -7), rrs.block_at(0), rrs.block_at(1, 2, 3)]
+    expected = test_data['raw-blockat-xxh3_64-3neg7-0-123-seed123456']
+    assert actual == expected
+
+
+@requires_xxh3
+def test_backend():
+    rrs = samplespace.RepeatableRandomSequence(seed=12345)
+    assert rrs.backend == rrs.DEFAULT_BACKEND == 'xxh64'
+
+    other = samplespace.RepeatableRandomSequence(seed=12345, backend='xxh3_64')
+    assert other.getstate()._hash_input == rrs.getstate()._hash_input
+    assert other.getnextblock() != rrs.getnextblock()
+
+    # The backend is part of the state
+    state = other.getstate()
+    expected = [other.random() for _ in range(10)]
+    assert state.as_dict()['backend'] == 'xxh3_64'
+    new_state = samplespace.repeatablerandom.RepeatableRandomSequenceState.from_dict(state.as_dict())
+    assert new_state == state
+
+    rrs.setstate(new_state)
+    assert rrs.backend == 'xxh3_64'
+    assert [rrs.random() for _ in range(10)] == expected
+
+    rrs.setstate(state)
+    copied = pickle.loads(pickle.dumps(rrs))
+    assert copied.backend == 'xxh3_64'
+    assert [copied.random() for _ in range(10)] == expected
+
+    # Derived sequences inherit the backend
+    assert rrs.derive('a', 1).backend == 'xxh3_64'
+    assert all(child.backend == 'xxh3_64' for child in rrs.derive_many([1, 2]))
+
+    # States serialized without a backend use xxh64
+    state_as_dict = state.as_dict()
+    del state_as_dict['backend']
+    rrs.setstate(samplespace.repeatablerandom.RepeatableRandomSequenceState.from_dict(state_as_dict))
+    assert rrs.backend == 'xxh64'
+
+    with pytest.raises(ValueError):
+        samplespace.RepeatableRandomSequence(seed=12345, backend='md5')
+
+    state_as_dict['backend'] = 'md5'
+    new_state = samplespace.repeatablerandom.RepeatableRandomSequenceState.from_dict(state_as_dict)
+    with pytest.raises(ValueError):
+        rrs.setstate(new_state)
+    assert rrs.backend == 'xxh64'
+
+
+def test_packed_expected_sequence():
+    rrs = samplespace.RepeatableRandomSequence(seed=123456)
+
+    actual = rrs.coins(100)
+    expected = test_data['coins-n100-seed123456-index0']
+    assert actual == expected
+
+    actual = [rrs.bernoulli_bits(p, 70) for p in (0.1, 0.75)]
+    expected = test_data['bernoulli-bits-p0.1-p0.75-n70-seed123456-index1']
+    assert actual == expected
+
+    actual = [rrs.small_ints(limit, 30) for limit in (6, 52)]
+    expected = test_data['small-ints-limit6-limit52-n30-seed123456-index3']
+    assert actual == expected
+
+
+# noinspection PyProtectedMember
+def test_packed_definitions():
+    rrs = PatchedRRS(seed=1234)
+
+    # Coins are the bits of each block, least significant first
+    rrs.reset()
+    with rrs.cascade():
+        blocks = [rrs.getnextblock() for _ in range(3)]
+    rrs.reset()
+    rrs.index_list.clear()
+    assert rrs.coins(150) == [bool(blocks[i // 64] >> (i % 64) & 1)
+                              for i in range(150)]
+    assert len(rrs.index_list) == 3
+    assert rrs.index == 1
+
+    rrs.reset()
+    assert rrs.bernoulli_bits(0.5, 150) == [bool(blocks[i // 64] >> (i % 64) & 1)
+                                            for i in range(150)]
+
+    # Small power-of-two ranges slice each block's bits
+    rrs.reset()
+    assert rrs.small_ints(8, 42) == [blocks[i // 21] >> (3 * (i % 21)) & 7
+                                     for i in range(42)]
+
+    # Shorter draws are prefixes of longer draws
+    for draw in (rrs.coins,
+                 lambda n: rrs.bernoulli_bits(0.1, n),
+                 lambda n: rrs.bernoulli_bits(0.7, n),
+                 lambda n: rrs.small_ints(6, n),
+                 lambda n: rrs.small_ints(1000, n)):
+        rrs.reset()
+        expected = draw(300)
+        for n in (0, 1, 63, 64, 65, 200):
+            rrs.reset()
+            assert draw(n) == expected[:n]
+            assert rrs.index == 1
+
+    # Degenerate cases consume no blocks but advance the index
+    rrs.reset()
+    rrs.index_list.clear()
+    assert rrs.bernoulli_bits(0.0, 5) == [False] * 5
+    assert rrs.bernoulli_bits(1.0, 5) == [True] * 5
+    assert rrs.small_ints(1, 5) == [0] * 5
+    assert rrs.index_list == []
+    assert rrs.index == 3
+
+
+def test_packed_distributions():
+    rrs = samplespace.RepeatableRandomSequence(seed='packed')
+    n = 20000
+
+    assert abs(sum(rrs.coins(n)) / n - 0.5) < 0.02
+    for p in (0.01, 0.3, 0.9):
+        assert abs(sum(rrs.bernoulli_bits(p, n)) / n - p) < 0.02
+
+    # Other real numbers are converted to the nearest float
+    for p in (Fraction(1, 3), Decimal('0.3')):
+        assert abs(sum(rrs.bernoulli_bits(p, n)) / n - float(p)) < 0.02
+        rrs.index = 0
+        expected = rrs.bernoulli_bits(float(p), 100)
+        rrs.index = 0
+        assert rrs.bernoulli_bits(p, 100) == expected
+
+    for limit in (3, 6, 7, 52):
+        values = rrs.small_ints(limit, n)
+        assert set(values) == set(range(limit))
+        assert all(abs(values.count(i) / n - 1.0 / limit) < 0.02
+                   for i in range(limit))
+
+    values = rrs.small_ints(2 ** 64, 100)
+    assert all(0 <= x < 2 ** 64 for x in values)
+
+
+def test_packed_args():
+    rrs = samplespace.RepeatableRandomSequence(seed=1234)
+
+    with pytest.raises(ValueError):
+        rrs.coins(-1)
+
+    with pytest.raises(ValueError):
+        rrs.bernoulli_bits(0.5, -1)
+
+    with pytest.raises(ValueError):
+        rrs.small_ints(0, 10)
+
+    with pytest.raises(ValueError):
+        rrs.small_ints(2 ** 64 + 1, 10)
+
+    with pytest.raises(ValueError):
+        rrs.small_ints(6, -1)
+
+    with pytest.raises(TypeError):
+        rrs.small_ints(2.5, 10)
+
+
+def test_derive_expected_sequence():
+    rrs = samplespace.RepeatableRandomSequence(seed=123456)
+    child = rrs.derive('chunk', 3, -7, b'\x00\xff')
+    actual = [child.getnextblock() for _ in range(5)]
+    expected = test_data['raw-derive-chunk-3-neg7-bytes00ff-seed123456-index0-n5']
+    assert actual == expected
+
+
+def test_derive():
+    rrs = samplespace.RepeatableRandomSequence(seed='world')
+    child = rrs.derive('chunk', 4, -2)
+    expected = [child.getnextblock() for _ in range(10)]
+
+    # Children do not depend on the parent's index
+    [rrs.getnextblock() for _ in range(10)]
+    child = rrs.derive('chunk', 4, -2)
+    assert [child.getnextblock() for _ in range(10)] == expected
+    assert rrs.index == 10
+
+    # Deriving with multiple keys is equivalent to deriving in turn
+    child = rrs.derive('chunk').derive(4).derive(-2)
+    assert [child.getnextblock() for _ in range(10)] == expected
+
+    # Key types are distinguished
+    firsts = [rrs.derive(key).getnextblock()
+              for key in (1, '1', b'1', bytearray(b'1'), 2)]
+    assert firsts[2] == firsts[3]
+    assert len(set(firsts)) == 4
+
+    assert rrs.derive('a', 1).getseed() == ['world', 'a', 1]
+
+    with pytest.raises(ValueError):
+        rrs.derive(1.0)
+
+    with pytest.raises(ValueError):
+        rrs.derive(None)
+
+
+def test_derive_many():
+    rrs = samplespace.RepeatableRandomSequence(seed=1234)
+    keys = [('tree', i) for i in range(20)] + [5, 'x']
+    children = rrs.derive_many(keys)
+    expected = [rrs.derive(*k) if isinstance(k, tuple) else rrs.derive(k)
+                for k in keys]
+    assert [child.getstate() for child in children] == \
+           [child.getstate() for child in expected]
+
+
+def test_block_at_expected_values():
+    rrs = samplespace.RepeatableRandomSequence(seed=123456)
+    actual = [rrs.block_at(3, -7), rrs.block_at(0), rrs.block_at(1, 2, 3)]
+    expected = test_data['raw-blockat-3neg7-0-123-seed123456']
+    assert actual == expected
+
+
+def test_coordinate_lookups():
+    rrs = samplespace.RepeatableRandomSequence(seed='terrain')
+
+    # Lookups neither depend on nor advance the index
+    expected = rrs.value_at(5, -3)
+    [rrs.getnextblock() for _ in range(10)]
+    assert rrs.value_at(5, -3) == expected
+    assert rrs.index == 10
+
+    with rrs.cascade():
+        assert rrs.value_at(5, -3) == expected
+
+    # Distinct coordinates and dimensions produce distinct values
+    values = [rrs.value_at(*coords)
+              for coords in ((5,), (5, 0), (0, 5), (5, -3, 0), (-5, 3))]
+    assert len(set(values)) == len(values)
+    assert all(0.0 <= x < 1.0 for x in values)
+
+    assert rrs.value_at(5, -3) == rrs._64bits_to_float(rrs.block_at(5, -3))
+
+
+def test_fill_grid():
+    rrs = samplespace.RepeatableRandomSequence(seed='terrain')
+
+    grid = rrs.fill_grid((4, 6), origin=(10, -3))
+    assert grid == [[rrs.value_at(10 + i, -3 + j) for j in range(6)]
+                    for i in range(4)]
+
+    grid = rrs.fill_grid((2, 3, 4))
+    assert grid == [[[rrs.value_at(i, j, k) for k in range(4)]
+                     for j in range(3)] for i in range(2)]
+
+    assert rrs.fill_grid((5,), (2,)) == [rrs.value_at(2 + i) for i in range(5)]
+
+    # Adjacent tiles agree on overlapping cells
+    left = rrs.fill_grid((8, 8), (0, 0))
+    right = rrs.fill_grid((8, 8), (0, 4))
+    assert [row[4:] for row in left] == [row[:4] for row in right]
+
+    with pytest.raises(ValueError):
+        rrs.fill_grid(())
+
+    with pytest.raises(ValueError):
+        rrs.fill_grid((2, 2), (0,))